@@ -94,6 +94,12 @@ class ShotgunPanelApp(Application):
         # for the panel widget in the future. In that case, we'll need to
         # check here to see if the panel has been pinned by the user, and
         # if it has NOT navigate it to home.
+        if self.engine.has_ui:
+            # the shotgun_fields hook may resolve differently in the new
+            # context, so make sure the shared formatters are rebuilt.
+            app_payload = self.import_module("app")
+            app_payload.clear_type_formatters()
+
         if self.engine.has_ui and self._current_panel:
             try:
                 self._current_panel.navigate_to_context(new_context)
@@ -147,6 +153,20 @@ class ShotgunPanelApp(Application):
             w = self.create_panel()
             w.navigate_to_entity(entity_type, entity_id)
 
+    def update_entity(self, entity_type, entity_id, data):
+        """
+        API support to let the panel know that an entity has been updated,
+        e.g. by an action hook, so that it is refreshed wherever it is displayed
+        without querying Shotgun again.
+
+        :param entity_type: Shotgun entity type
+        :param entity_id: Shotgun entity id
+        :param data: Dictionary of updated field values
+        """
+        if self.engine.has_ui:
+            app_payload = self.import_module("app")
+            app_payload.get_entity_store().update(entity_type, entity_id, data)
+
     def _log_metric_viewed_panel(self, entity_type):
         """
         Module local metric logging helper method for the "Viewed Panel" metric
@@ -233,6 +233,7 @@ class GeneralActions(HookBaseClass):
                 # User not assigned yet, make the request to update
                 assignees.append(app.context.user)
                 app.shotgun.update("Task", sg_data["id"], {"task_assignees": assignees})
+                app.update_entity("Task", sg_data["id"], {"task_assignees": assignees})
 
         elif name == "add_to_playlist":
             app.shotgun.update(
@@ -248,6 +249,7 @@ class GeneralActions(HookBaseClass):
 
         elif name == "task_to_ip":
             app.shotgun.update("Task", sg_data["id"], {"sg_status_list": "ip"})
+            app.update_entity("Task", sg_data["id"], {"sg_status_list": "ip"})
 
         elif name == "quicktime_clipboard":
             self._copy_to_clipboard(sg_data["sg_path_to_movie"])
@@ -260,9 +262,11 @@ class GeneralActions(HookBaseClass):
 
         elif name == "note_to_ip":
             app.shotgun.update("Note", sg_data["id"], {"sg_status_list": "ip"})
+            app.update_entity("Note", sg_data["id"], {"sg_status_list": "ip"})
 
         elif name == "note_to_closed":
             app.shotgun.update("Note", sg_data["id"], {"sg_status_list": "clsd"})
+            app.update_entity("Note", sg_data["id"], {"sg_status_list": "clsd"})
 
         return dict()
 
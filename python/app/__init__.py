@@ -9,3 +9,5 @@
 # not expressly granted therein are reserved by Shotgun Software Inc.
 
 from .dialog import AppDialog
+from .entity_store import get_entity_store
+from .shotgun_formatter import clear_type_formatters
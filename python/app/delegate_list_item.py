@@ -18,6 +18,9 @@ shotgun_model = sgtk.platform.import_framework(
 shotgun_view = sgtk.platform.import_framework("tk-framework-qtwidgets", "views")
 
 from .widget_list_item import ListItemWidget
+from .shotgun_formatter import get_list_item_cache
+from .model_entity_listing import SgEntityListingModel
+from . import utils
 
 
 class ListItemDelegate(shotgun_view.EditSelectedWidgetDelegate):
@@ -97,25 +100,40 @@ class ListItemDelegate(shotgun_view.EditSelectedWidgetDelegate):
         :param model_index: The model index to operate on
         :param style_options: QT style options
         """
+        # get the shotgun data
+        sg_item = shotgun_model.get_sg_data(model_index)
+
+        # note: This is a violation of the model/delegate independence.
+        source_model = model_index.model().sourceModel()
+
+        # keep the thumbnail of visible items in memory
+        source_model.touch_thumbnail(sg_item)
+
         icon = shotgun_model.get_sanitized_data(model_index, QtCore.Qt.DecorationRole)
         if icon:
-            thumb = icon.pixmap(512)
+            # models store thumbnails at display size, so this only
+            # scales the full size default thumbnails.
+            thumb_size = utils.get_display_size(
+                ListItemWidget.calculate_thumbnail_size()
+            )
+            thumb = icon.pixmap(QtCore.QSize(*thumb_size))
             widget.set_thumbnail(thumb)
 
-        # note: This is a violation of the model/delegate independence.
-        if model_index.model().sourceModel().is_highlighted(model_index):
+        if source_model.is_highlighted(model_index):
             widget.set_highlighted(True)
         else:
             widget.set_highlighted(False)
 
-        # get the shotgun data
-        sg_item = shotgun_model.get_sg_data(model_index)
-
         # get the formatter object which defines how this object is to be presented
-        sg_formatter = model_index.model().sourceModel().get_formatter()
-
-        # ask to format the data
-        header_left, header_right, body = sg_formatter.format_list_item_details(sg_item)
+        sg_formatter = source_model.get_formatter()
+
+        # ask to format the data. Typically, the model has already rendered
+        # the details in the background, otherwise reuse what was rendered at a
+        # previous paint if the record hasn't changed since.
+        preformatted = model_index.data(SgEntityListingModel.LIST_ITEM_DETAILS_ROLE)
+        header_left, header_right, body = get_list_item_cache().get_list_item_details(
+            sg_formatter, sg_item, preformatted
+        )
 
         widget.set_text(header_left, header_right, body)
 
@@ -0,0 +1,226 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import collections
+import time
+
+# fields linking publishes to their dependencies, in both directions
+DEPENDENCY_FIELDS = ["upstream_published_files", "downstream_published_files"]
+
+# shared graph instance, see get_dependency_graph()
+_dependency_graph = None
+
+
+def get_dependency_graph():
+    """
+    Returns the publish dependency graph shared by all models.
+
+    :returns: :class:`PublishDependencyGraph` instance
+    """
+    global _dependency_graph
+
+    if _dependency_graph is None:
+        _dependency_graph = PublishDependencyGraph()
+
+    return _dependency_graph
+
+
+def fetch_dependency_edges(sg, entity_type, publish_id, max_depth, known_edges):
+    """
+    Walks the dependencies of a publish breadth first, in both directions,
+    up to a given depth. Meant to be executed in a background thread via
+    the ShotgunDataRetriever.execute_method() method.
+
+    A single query is issued per level, for all publishes of that level
+    whose dependencies aren't known yet.
+
+    :param sg: Shotgun API instance
+    :param entity_type: PublishedFile or TankPublishedFile
+    :param publish_id: Id of the publish to start from
+    :param max_depth: Number of levels to walk
+    :param known_edges: Dictionary of dependencies which are already known,
+        see :meth:`PublishDependencyGraph.get_edges`. These are not fetched again.
+    :returns: Dictionary mapping the id of each publish which has been fetched
+        to a dictionary with the ids of its dependencies for each of the
+        :data:`DEPENDENCY_FIELDS`.
+    """
+    edges = {}
+    frontiers = dict((field, set([publish_id])) for field in DEPENDENCY_FIELDS)
+    visited = dict((field, set([publish_id])) for field in DEPENDENCY_FIELDS)
+
+    for _ in range(max_depth):
+        unknown_ids = set()
+        for frontier in frontiers.values():
+            unknown_ids.update(frontier)
+        unknown_ids = [
+            node_id
+            for node_id in sorted(unknown_ids)
+            if node_id not in known_edges and node_id not in edges
+        ]
+
+        if len(edges) + len(unknown_ids) > PublishDependencyGraph.MAX_TRAVERSAL_SIZE:
+            # the remaining levels are fetched when browsing further
+            break
+
+        if unknown_ids:
+            sg_records = sg.find(
+                entity_type, [["id", "in", unknown_ids]], DEPENDENCY_FIELDS
+            )
+            for sg_data in sg_records:
+                edges[sg_data["id"]] = dict(
+                    (field, [link["id"] for link in sg_data.get(field) or []])
+                    for field in DEPENDENCY_FIELDS
+                )
+
+            # retired or otherwise invisible publishes have no dependencies
+            for node_id in unknown_ids:
+                if node_id not in edges:
+                    edges[node_id] = dict((field, []) for field in DEPENDENCY_FIELDS)
+
+        for field in DEPENDENCY_FIELDS:
+            next_frontier = set()
+            for node_id in frontiers[field]:
+                node_edges = edges.get(node_id) or known_edges[node_id]
+                next_frontier.update(node_edges[field])
+            next_frontier -= visited[field]
+            visited[field].update(next_frontier)
+            frontiers[field] = next_frontier
+
+        if not any(frontiers.values()):
+            break
+
+    return edges
+
+
+class PublishDependencyGraph(object):
+    """
+    Caches the dependencies between publishes, as a graph keyed
+    by publish id.
+
+    The graph is filled in by :func:`fetch_dependency_edges` and shared
+    by the dependency tabs, so browsing from one publish to another
+    usually doesn't need any new dependency query. The time dependencies
+    were fetched at is kept along with them, so that stale parts of the
+    graph can be fetched again.
+
+    This is only ever accessed from the GUI thread.
+    """
+
+    # maximum number of publishes the dependencies are remembered for
+    MAX_SIZE = 10000
+
+    # maximum number of publishes fetched by a single traversal
+    MAX_TRAVERSAL_SIZE = 1000
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        # (entity type, publish id) -> {field: [dependency ids]},
+        # least recently updated first
+        self._edges = collections.OrderedDict()
+        # (entity type, publish id) -> time the dependencies were fetched
+        self._fetch_times = {}
+
+    def __repr__(self):
+        return "<Publish dependency graph, %d publishes>" % len(self._edges)
+
+    def update(self, entity_type, edges):
+        """
+        Adds dependencies to the graph.
+
+        :param entity_type: PublishedFile or TankPublishedFile
+        :param edges: Dictionary as returned by :func:`fetch_dependency_edges`
+        """
+        now = time.time()
+        for publish_id, node_edges in edges.items():
+            key = (entity_type, publish_id)
+            self._edges.pop(key, None)
+            self._edges[key] = node_edges
+            self._fetch_times[key] = now
+
+        while len(self._edges) > self.MAX_SIZE:
+            key, _ = self._edges.popitem(last=False)
+            del self._fetch_times[key]
+
+    def get_edges(self, entity_type, fresh_since=None):
+        """
+        Returns the known dependencies for an entity type.
+
+        :param entity_type: PublishedFile or TankPublishedFile
+        :param fresh_since: If set, only the dependencies fetched after
+            this unix timestamp are returned.
+        :returns: Dictionary mapping publish ids to a dictionary
+            with the ids of their dependencies for each field.
+        """
+        return dict(
+            (publish_id, node_edges)
+            for (edge_type, publish_id), node_edges in self._edges.items()
+            if edge_type == entity_type
+            and not self._is_stale((edge_type, publish_id), fresh_since)
+        )
+
+    def get_dependencies(
+        self, entity_type, publish_id, field, max_depth, fresh_since=None
+    ):
+        """
+        Returns the dependencies of a publish, following a dependency
+        field breadth first up to a given depth.
+
+        :param entity_type: PublishedFile or TankPublishedFile
+        :param publish_id: Id of the publish
+        :param field: One of the :data:`DEPENDENCY_FIELDS`
+        :param max_depth: Number of levels to follow
+        :param fresh_since: If set, levels holding dependencies fetched at
+            or before this unix timestamp are not considered known.
+        :returns: Tuple with the list of dependency ids, closest ones first,
+            and whether all levels are known.
+        """
+        dependency_ids = []
+        complete = True
+        visited = set([publish_id])
+        frontier = [publish_id]
+
+        for _ in range(max_depth):
+            next_frontier = []
+            for node_id in frontier:
+                key = (entity_type, node_id)
+                node_edges = self._edges.get(key)
+                if node_edges is None:
+                    complete = False
+                    continue
+                if self._is_stale(key, fresh_since):
+                    # listed, but to be fetched again
+                    complete = False
+                for dependency_id in node_edges[field]:
+                    if dependency_id not in visited:
+                        visited.add(dependency_id)
+                        next_frontier.append(dependency_id)
+
+            dependency_ids.extend(next_frontier)
+            frontier = next_frontier
+            if not frontier:
+                break
+
+        return dependency_ids, complete
+
+    def _is_stale(self, key, fresh_since):
+        """
+        Returns whether the dependencies of a publish have been fetched
+        at or before a given time.
+
+        :param key: (entity type, publish id) tuple
+        :param fresh_since: Unix timestamp, or None to consider
+            all dependencies fresh.
+        :returns: True if the dependencies are stale
+        """
+        if fresh_since is None:
+            return False
+        return self._fetch_times.get(key, 0) <= fresh_since
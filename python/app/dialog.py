@@ -24,7 +24,10 @@ from .delegate_list_item import ListItemDelegate
 from .action_manager import ActionManager
 from .model_entity_listing import SgEntityListingModel
 from .model_version_listing import SgVersionModel
-from .model_publish_listing import SgLatestPublishListingModel
+from .model_publish_listing import (
+    SgLatestPublishListingModel,
+    LatestPublishProxyModel,
+)
 from .model_publish_history import SgPublishHistoryListingModel
 from .model_task_listing import SgTaskListingModel
 from .model_publish_dependency_down import SgPublishDependencyDownstreamListingModel
@@ -35,17 +38,19 @@ from .model_current_user import SgCurrentUserModel
 from .not_found_overlay import NotFoundModelOverlay
 from .qtwidgets import ActivityStreamWidget
 from .qtwidgets import SGQIcon
-from .shotgun_formatter import ShotgunTypeFormatter
+from .shotgun_formatter import ShotgunTypeFormatter, get_list_item_cache
 from .note_updater import NoteUpdater
+from .record_counter import RecordCounter
+from .tab_prefetcher import TabPrefetcher
+from .thumbnail_viewport import ThumbnailViewportLoader
+from . import task_scheduler
+from . import freshness
 from .widget_all_fields import AllFieldsWidget
 from .work_area_dialog import WorkAreaDialog
 
 shotgun_model = sgtk.platform.import_framework(
     "tk-framework-shotgunutils", "shotgun_model"
 )
-task_manager = sgtk.platform.import_framework(
-    "tk-framework-shotgunutils", "task_manager"
-)
 settings = sgtk.platform.import_framework("tk-framework-shotgunutils", "settings")
 shotgun_data = sgtk.platform.import_framework(
     "tk-framework-shotgunutils", "shotgun_data"
@@ -75,6 +80,9 @@ MAX_LEN_UPPER_BODY_DETAILS = 1200
 # milliseconds to show splash
 SPLASH_UI_TIME_MILLISECONDS = 2000
 
+# milliseconds a link must be hovered before its target is prefetched
+LINK_PREFETCH_DELAY_MILLISECONDS = 300
+
 
 class AppDialog(QtGui.QWidget):
     """
@@ -134,13 +142,18 @@ class AppDialog(QtGui.QWidget):
         self._action_manager = ActionManager(self)
         self._action_manager.refresh_request.connect(self.refresh)
 
-        # create a background task manager
-        self._task_manager = task_manager.BackgroundTaskManager(
-            self, start_processing=True, max_threads=2
+        # background work runs in a task manager per priority class, the
+        # default one being for the tabs and other things displayed
+        self._task_scheduler = task_scheduler.TaskScheduler(self)
+        self._task_manager = self._task_scheduler.get_task_manager(
+            task_scheduler.PRIORITY_VISIBLE
+        )
+        self._foreground_task_manager = self._task_scheduler.get_task_manager(
+            task_scheduler.PRIORITY_FOREGROUND
         )
 
         # register the data fetcher with the global schema manager
-        shotgun_globals.register_bg_task_manager(self._task_manager)
+        shotgun_globals.register_bg_task_manager(self._foreground_task_manager)
 
         # now load in the UI that was created in the UI designer
         self.ui = Ui_Dialog()
@@ -153,14 +166,21 @@ class AppDialog(QtGui.QWidget):
         self.user_icon_orig = self.ui.current_user.icon()
 
         # create a note updater to run operations on notes in the db
-        self._note_updater = NoteUpdater(self._task_manager, self)
+        self._note_updater = NoteUpdater(
+            self._task_scheduler.get_task_manager(task_scheduler.PRIORITY_HOUSEKEEPING),
+            self,
+        )
 
         # flag to keep track of when we are navigating
         self._navigating = False
 
+        # incremented whenever a location is displayed, tab models are tagged
+        # with the generation they have been loaded for
+        self._navigation_generation = 0
+
         # hook up a data retriever with all objects needing to talk to sg
-        self.ui.search_input.set_bg_task_manager(self._task_manager)
-        self.ui.note_reply_widget.set_bg_task_manager(self._task_manager)
+        self.ui.search_input.set_bg_task_manager(self._foreground_task_manager)
+        self.ui.note_reply_widget.set_bg_task_manager(self._foreground_task_manager)
 
         # set up action menu. parent it to the action button to prevent cases
         # where it shows up elsewhere on screen (as in Houdini)
@@ -208,14 +228,16 @@ class AppDialog(QtGui.QWidget):
         self.ui.search_input.entity_selected.connect(self._on_search_item_selected)
 
         # model to get the current user's details
-        self._current_user_model = SgCurrentUserModel(self, self._task_manager)
+        self._current_user_model = SgCurrentUserModel(
+            self, self._foreground_task_manager
+        )
         self._current_user_model.thumbnail_updated.connect(self._update_current_user)
         self._current_user_model.data_updated.connect(self._update_current_user)
         self._current_user_model.load()
         self.ui.current_user.clicked.connect(self._on_user_home_clicked)
 
         # top detail section
-        self._details_model = SgEntityDetailsModel(self, self._task_manager)
+        self._details_model = SgEntityDetailsModel(self, self._foreground_task_manager)
         self._details_overlay = ShotgunModelOverlayWidget(
             self._details_model, self.ui.top_group
         )
@@ -225,6 +247,17 @@ class AppDialog(QtGui.QWidget):
         # hyperlink clicking
         self.ui.details_text_header.linkActivated.connect(self._on_link_clicked)
         self.ui.details_text_middle.linkActivated.connect(self._on_link_clicked)
+
+        # prefetch the target of hovered links, so that clicking them is instant
+        self._hovered_link = None
+        self._prefetched_link = None
+        self._link_prefetch_models = {}
+        self._link_prefetch_timer = QtCore.QTimer(self)
+        self._link_prefetch_timer.setSingleShot(True)
+        self._link_prefetch_timer.setInterval(LINK_PREFETCH_DELAY_MILLISECONDS)
+        self._link_prefetch_timer.timeout.connect(self._prefetch_hovered_link)
+        self.ui.details_text_header.linkHovered.connect(self._on_link_hovered)
+        self.ui.details_text_middle.linkHovered.connect(self._on_link_hovered)
         self.ui.details_thumb.playback_clicked.connect(self._playback_version)
 
         # notes
@@ -234,6 +267,18 @@ class AppDialog(QtGui.QWidget):
         self._entity_tabs = self.build_entity_tabs()
         # The current visible tabs. This will change based on the current entity type
         self._current_entity_tabs = []
+        # tab captions and number of records behind each of the current tabs
+        self._entity_tab_captions = {}
+        self._entity_tab_counts = {}
+        self._record_counter = RecordCounter(
+            self._task_scheduler.get_task_manager(task_scheduler.PRIORITY_HOUSEKEEPING),
+            self,
+        )
+        self._record_counter.count_available.connect(self._on_entity_tab_count)
+        # loads the other tabs in the background once the current one is loaded,
+        # with models of their own so that the queries run at prefetch priority
+        self._tab_prefetcher = TabPrefetcher(self._prefetch_entity_tab)
+        self._tab_prefetch_models = {}
         self.ui.entity_tab_widget.currentChanged.connect(self._load_entity_tab_data)
         self.ui.entity_tab_widget.currentChanged.connect(
             self._update_preset_filters_on_tab_change
@@ -259,6 +304,9 @@ class AppDialog(QtGui.QWidget):
         """
 
         self._app.log_debug("CloseEvent Received. Begin shutting down UI.")
+        self._app.log_debug(
+            "List item details cache stats: %s" % get_list_item_cache().cache_info()
+        )
 
         # tell main app instance that we are closing
         self._app._on_dialog_close(self)
@@ -271,17 +319,27 @@ class AppDialog(QtGui.QWidget):
         try:
 
             # register the data fetcher with the global schema manager
-            shotgun_globals.unregister_bg_task_manager(self._task_manager)
+            shotgun_globals.unregister_bg_task_manager(self._foreground_task_manager)
 
             # shut down models
             self._details_model.destroy()
             self._current_user_model.destroy()
+            self._record_counter.destroy()
+            self._link_prefetch_timer.stop()
+            for model in self._link_prefetch_models.values():
+                model.destroy()
+            for model in self._tab_prefetch_models.values():
+                model.destroy()
             for tab_dict in self._entity_tabs.values():
                 if tab_dict.get("model", None):
                     tab_dict["model"].destroy()
 
-            # shut down main threadpool
-            self._task_manager.shut_down()
+            # notes marked as read recently are still waiting to be updated,
+            # while queued background work is discarded when shutting down
+            self._note_updater.flush(wait=True)
+
+            # shut down all threadpools
+            self._task_scheduler.shut_down()
 
         except Exception as e:
             self._app.log_exception("Error running PTR Panel App closeEvent()")
@@ -299,6 +357,8 @@ class AppDialog(QtGui.QWidget):
         """
         Refresh the UI based on the incoming data.
         """
+        # refreshing is explicitly asked for, so everything is fetched again
+        freshness.expire_all()
 
         if data and data.get("type", None) and data.get("id", None):
             self.navigate_to_entity(data["type"], data["id"])
@@ -309,6 +369,7 @@ class AppDialog(QtGui.QWidget):
         """
         sets up the UI for the current location
         """
+        self._start_navigation_generation()
 
         if self._current_location.entity_type == "Note":
             self.focus_note()
@@ -324,6 +385,49 @@ class AppDialog(QtGui.QWidget):
             self._current_location.entity_type, self._current_location.entity_id
         )
 
+    def _start_navigation_generation(self):
+        """
+        Starts a new navigation generation. The background work queued on
+        behalf of previous locations is cancelled, so that the data for the
+        location about to be displayed doesn't wait behind it.
+        """
+        self._navigation_generation += 1
+
+        self._link_prefetch_timer.stop()
+        self._tab_prefetcher.stop()
+        self._record_counter.clear()
+
+        for tab in self._entity_tabs.values():
+            model = tab.get("model")
+            if (
+                tab.get("generation") is not None
+                and tab["generation"] < self._navigation_generation
+                and hasattr(model, "cancel_pending_work")
+            ):
+                model.cancel_pending_work()
+                tab["generation"] = None
+
+        # the details are loaded again for the new location right away
+        self._details_model.cancel_pending_work()
+        for model in self._tab_prefetch_models.values():
+            if hasattr(model, "cancel_pending_work"):
+                model.cancel_pending_work()
+
+        # the prefetch of a hovered link is only still useful if the
+        # link has been followed
+        location = self._current_location
+        if self._prefetched_link != "sgtk:%s:%s" % (
+            location.entity_type,
+            location.entity_id,
+        ):
+            for model in self._link_prefetch_models.values():
+                model.cancel_pending_work()
+
+        # links of the new location may be hovered again, including after
+        # a refresh, in which case their target is prefetched again
+        self._hovered_link = None
+        self._prefetched_link = None
+
     def focus_entity(self):
         """
         Move UI to entity mode. Load up tabs.
@@ -339,12 +443,16 @@ class AppDialog(QtGui.QWidget):
         # upgrade to >= 5.15, we can use QTabWidget::setTabVisible instead of clearing
         # and re-adding the tab widgets each time
 
+        # whatever has been prefetched is for the previous location
+        self._tab_prefetcher.reset()
+
         # Block signals emitting on the tab widget to avoid triggering unnecessary data loads
         self.ui.entity_tab_widget.blockSignals(True)
 
         try:
             self.ui.entity_tab_widget.clear()
             self._current_entity_tabs = []
+            self._entity_tab_captions = {}
             formatter = self._current_location.sg_formatter
             for tab_name in self.ENTITY_TABS:
                 enabled, text = formatter.show_entity_tab(tab_name)
@@ -352,6 +460,7 @@ class AppDialog(QtGui.QWidget):
                     tab_widget = self._entity_tabs[tab_name]["widget"]
                     self.ui.entity_tab_widget.addTab(tab_widget, text)
                     self._current_entity_tabs.append(tab_name)
+                    self._entity_tab_captions[tab_name] = text
 
                     if self._entity_tabs[tab_name].get("description", None):
                         text = formatter.get_entity_tab_description(tab_name)
@@ -371,6 +480,9 @@ class AppDialog(QtGui.QWidget):
         finally:
             self.ui.entity_tab_widget.blockSignals(False)
 
+        # count what is behind each tab in the background
+        self._request_entity_tab_counts()
+
         # get the tab index associated with the location and
         # show that tab. This means that the 'current tab' is
         # remembered as you step through history
@@ -414,8 +526,12 @@ class AppDialog(QtGui.QWidget):
         # store setting
         self._settings_manager.store("latest_publishes_only", checked)
 
-        # refresh the publishes tab
-        self._load_entity_tab_data(self.ui.entity_tab_widget.currentIndex())
+        # the publishes tab model already holds all publishes
+        model = self._entity_tabs[self.ENTITY_TAB_PUBLISHES].get("model")
+        if model:
+            model.set_show_latest_only(checked)
+        else:
+            self._load_entity_tab_data(self.ui.entity_tab_widget.currentIndex())
 
     def _on_pending_versions_toggled(self, checked):
         """
@@ -429,6 +545,55 @@ class AppDialog(QtGui.QWidget):
         # refresh the versions tab
         self._load_entity_tab_data(self.ui.entity_tab_widget.currentIndex())
 
+    def _request_entity_tab_counts(self):
+        """
+        Requests the number of records behind each of the current listing tabs,
+        so that the tab captions can show them without loading the listings.
+        """
+        self._record_counter.clear()
+        self._entity_tab_counts = {}
+
+        for tab_name in self._current_entity_tabs:
+            model = self._entity_tabs[tab_name].get("model")
+            if not isinstance(model, SgEntityListingModel):
+                continue
+
+            try:
+                filters = model.get_location_filters(self._current_location)
+            except sgtk.TankError as e:
+                # e.g. my tasks without a current user
+                self._app.log_debug("Cannot count records for %s: %s" % (tab_name, e))
+                continue
+
+            if filters is not None:
+                self._record_counter.count(
+                    tab_name,
+                    self._entity_tabs[tab_name]["entity_type"],
+                    filters,
+                )
+
+    def _on_entity_tab_count(self, tab_name, count):
+        """
+        Called when the number of records behind a tab is available.
+
+        :param tab_name: Name of the tab
+        :param count: Number of records
+        """
+        if tab_name not in self._current_entity_tabs:
+            return
+
+        self._entity_tab_counts[tab_name] = count
+        if count == 0:
+            # nothing worth loading ahead of time
+            self._tab_prefetcher.discard(tab_name)
+
+        tab_widget = self._entity_tabs[tab_name]["widget"]
+        index = self.ui.entity_tab_widget.indexOf(tab_widget)
+        if index != -1:
+            self.ui.entity_tab_widget.setTabText(
+                index, "%s (%d)" % (self._entity_tab_captions[tab_name], count)
+            )
+
     def _load_entity_tab_data(self, index, sort_by=None, sort_order=None):
         """
         Loads the data for one of the UI tabs in the entity family
@@ -452,60 +617,30 @@ class AppDialog(QtGui.QWidget):
                 self._entity_tabs[tab_name]["view"].selectionModel().clear()
 
             if tab.get("model", None):
-                args = []
-                kwargs = {}
-
-                if tab_name == self.ENTITY_TAB_ACTIVITY_STREAM:
-                    args = [self._current_location.entity_dict]
-
-                elif tab_name == self.ENTITY_TAB_VERSIONS:
-                    show_pending_only = (
-                        tab["filter_checkbox"].isEnabled()
-                        and tab["filter_checkbox"].isChecked()
-                    )
-                    formatter = self._current_location.sg_formatter
-                    tooltip = formatter.get_tab_data(tab_name, "tooltip", None)
-                    tab["model"].tooltip = tooltip
-                    sort_field = formatter.get_tab_data(tab_name, "sort", "id")
-
-                    args = [self._current_location, show_pending_only]
-                    kwargs = {"sort_field": sort_field}
-
-                elif tab_name == self.ENTITY_TAB_PUBLISHES:
-                    show_latest_only = (
-                        tab["filter_checkbox"].isEnabled()
-                        and tab["filter_checkbox"].isChecked()
-                    )
-                    args = [self._current_location, show_latest_only]
-
-                elif tab_name == self.ENTITY_TAB_TASKS:
-                    formatter = self._current_location.sg_formatter
-                    args = [self._current_location]
-                    sort_by = (
-                        sort_by if sort_by is not None else self._current_menu_sort_item
-                    )
-                    sort_order = (
-                        sort_order
-                        if sort_order is not None
-                        else self._current_menu_sort_order
-                    )
-                    sort_field = formatter.get_tab_data(tab_name, "sort", sort_by)
-                    additional_fields = ["step", "id"]
-                    kwargs = {
-                        "sort_field": sort_field,
-                        "additional_fields": additional_fields,
-                        "direction": sort_order,
-                    }
-
+                if (
+                    sort_by is None
+                    and sort_order is None
+                    and self._tab_prefetcher.take(tab_name)
+                    and tab_name not in self._tab_prefetch_models
+                ):
+                    # the data is already there, carry on with the other tabs
+                    self._prefetch_entity_tabs()
                 else:
-                    args = [self._current_location]
-
-                if tab.get("filter_menu", None):
-                    filters = tab["filter_menu"].get_active_preset_filter()
-                    filters = filters if filters else []
-                    kwargs["filters"] = filters
+                    # foreground loads take precedence over prefetching
+                    self._tab_prefetcher.stop()
+                    args, kwargs = self._get_entity_tab_load_args(
+                        tab_name,
+                        tab["model"],
+                        self._current_location,
+                        sort_by,
+                        sort_order,
+                    )
+                    tab["generation"] = self._navigation_generation
+                    tab["model"].load_data(*args, **kwargs)
 
-                tab["model"].load_data(*args, **kwargs)
+                    if not hasattr(tab["model"], "data_refreshed"):
+                        # no way to tell when loading is complete
+                        self._prefetch_entity_tabs()
 
         else:
             self._app.log_error(
@@ -513,6 +648,169 @@ class AppDialog(QtGui.QWidget):
                 % (tab_name, index)
             )
 
+    def _get_entity_tab_load_args(
+        self, tab_name, model, sg_location, sort_by=None, sort_order=None
+    ):
+        """
+        Returns the arguments to load the model of one of the entity tabs with.
+
+        :param tab_name: Name of the entity tab
+        :param model: Model to load
+        :param sg_location: Location to load the model for
+        :param sort_by: Field to sort tasks by
+        :param sort_order: Order to sort tasks in
+        :returns: Tuple with the list of arguments and the
+            dictionary of keyword arguments for the load_data() method.
+        """
+        tab = self._entity_tabs[tab_name]
+        args = []
+        kwargs = {}
+
+        if tab_name == self.ENTITY_TAB_ACTIVITY_STREAM:
+            args = [sg_location.entity_dict]
+
+        elif tab_name == self.ENTITY_TAB_VERSIONS:
+            show_pending_only = (
+                tab["filter_checkbox"].isEnabled()
+                and tab["filter_checkbox"].isChecked()
+            )
+            formatter = sg_location.sg_formatter
+            tooltip = formatter.get_tab_data(tab_name, "tooltip", None)
+            model.tooltip = tooltip
+            sort_field = formatter.get_tab_data(tab_name, "sort", "id")
+
+            args = [sg_location, show_pending_only]
+            kwargs = {"sort_field": sort_field}
+
+        elif tab_name == self.ENTITY_TAB_PUBLISHES:
+            show_latest_only = (
+                tab["filter_checkbox"].isEnabled()
+                and tab["filter_checkbox"].isChecked()
+            )
+            args = [sg_location, show_latest_only]
+
+        elif tab_name == self.ENTITY_TAB_TASKS:
+            formatter = sg_location.sg_formatter
+            args = [sg_location]
+            sort_by = sort_by if sort_by is not None else self._current_menu_sort_item
+            sort_order = (
+                sort_order if sort_order is not None else self._current_menu_sort_order
+            )
+            sort_field = formatter.get_tab_data(tab_name, "sort", sort_by)
+            additional_fields = ["step", "id"]
+            kwargs = {
+                "sort_field": sort_field,
+                "additional_fields": additional_fields,
+                "direction": sort_order,
+            }
+
+        else:
+            args = [sg_location]
+
+        if tab.get("filter_menu", None):
+            filters = tab["filter_menu"].get_active_preset_filter()
+            filters = filters if filters else []
+            kwargs["filters"] = filters
+
+        return args, kwargs
+
+    def _get_current_entity_tab(self):
+        """
+        Returns the name of the entity tab currently displayed or None.
+        """
+        index = self.ui.entity_tab_widget.currentIndex()
+        if index < 0 or index >= len(self._current_entity_tabs):
+            return None
+        return self._current_entity_tabs[index]
+
+    def _prefetch_entity_tabs(self):
+        """
+        Starts prefetching the tabs of the current location which
+        aren't displayed, in the order configured for the app. Tabs
+        known to have no records are skipped.
+        """
+        current_tab = self._get_current_entity_tab()
+        tab_names = [
+            tab_name
+            for tab_name in self._app.get_setting("prefetch_tabs")
+            if tab_name in self._current_entity_tabs
+            and tab_name != current_tab
+            and self._entity_tabs[tab_name].get("model")
+            and self._entity_tab_counts.get(tab_name) != 0
+        ]
+        self._tab_prefetcher.start(tab_names)
+
+    def _prefetch_entity_tab(self, tab_name):
+        """
+        Loads the data for a tab which isn't displayed.
+
+        :param tab_name: Name of the entity tab
+        """
+        self._app.log_debug("Prefetching entity tab %s..." % tab_name)
+        model = self._get_tab_prefetch_model(tab_name)
+        if model is None:
+            # the tab is loaded directly, at the priority of visible work
+            model = self._entity_tabs[tab_name]["model"]
+            self._entity_tabs[tab_name]["generation"] = self._navigation_generation
+
+        args, kwargs = self._get_entity_tab_load_args(
+            tab_name, model, self._current_location
+        )
+        model.load_data(*args, **kwargs)
+
+        if not hasattr(model, "data_refreshed"):
+            self._tab_prefetcher.tab_loaded(tab_name)
+
+    def _get_tab_prefetch_model(self, tab_name):
+        """
+        Returns the model prefetching the data of an entity tab, creating it
+        if needed. Its background work runs at prefetch priority, and what it
+        loads is written to the cache the model of the tab loads from first.
+
+        :param tab_name: Name of the entity tab
+        :returns: Model or None if the tab can't be prefetched with a
+            model of its own.
+        """
+        if tab_name in self._tab_prefetch_models:
+            return self._tab_prefetch_models[tab_name]
+
+        tab = self._entity_tabs[tab_name]
+        task_manager = self._task_scheduler.get_task_manager(
+            task_scheduler.PRIORITY_PREFETCH
+        )
+        if tab.get("model_class") and tab.get("view"):
+            model = tab["model_class"](tab["entity_type"], self, task_manager)
+        elif tab_name == self.ENTITY_TAB_INFO:
+            model = SgAllFieldsModel(self, task_manager)
+        else:
+            return None
+
+        model.freshness_key = tab_name
+        model.data_refreshed.connect(
+            lambda _, tab_name=tab_name: self._tab_prefetcher.tab_loaded(tab_name)
+        )
+        model.data_refresh_fail.connect(
+            lambda _, tab_name=tab_name: self._tab_prefetcher.tab_loaded(tab_name)
+        )
+        self._tab_prefetch_models[tab_name] = model
+        return model
+
+    def _on_entity_tab_loaded(self, tab_name):
+        """
+        Called when the model of an entity tab has been refreshed.
+
+        :param tab_name: Name of the entity tab
+        """
+        if self._entity_tabs[tab_name].get("generation") != self._navigation_generation:
+            # loaded for a location which isn't displayed anymore
+            return
+
+        if tab_name == self._get_current_entity_tab():
+            # the displayed tab is ready, now is a good time to load the others
+            self._prefetch_entity_tabs()
+        else:
+            self._tab_prefetcher.tab_loaded(tab_name)
+
     ###################################################################################################
     # top detail area callbacks
 
@@ -615,6 +913,15 @@ class AppDialog(QtGui.QWidget):
         else:
             self._navigate_to(sg_location)
 
+    def get_starvation_metrics(self):
+        """
+        Returns how long background tasks have waited before running.
+
+        :returns: Dictionary mapping priority classes to dictionaries with the
+            number of tasks started and their mean and maximum wait in seconds.
+        """
+        return self._task_scheduler.get_starvation_metrics()
+
     def _playback_version(self, version_data):
         """
         Given version data, play back a version
@@ -652,6 +959,72 @@ class AppDialog(QtGui.QWidget):
             # all other links are dispatched to the OS
             QtGui.QDesktopServices.openUrl(QtCore.QUrl(url))
 
+    def _on_link_hovered(self, url):
+        """
+        Callback called when the mouse enters or leaves a url.
+
+        The target of internal urls is prefetched if the url
+        remains hovered for a little while.
+
+        :param url: Hovered url, empty when the mouse leaves the url.
+        """
+        self._link_prefetch_timer.stop()
+        self._hovered_link = None
+
+        if url and url.startswith("sgtk:") and url != self._prefetched_link:
+            self._hovered_link = url
+            self._link_prefetch_timer.start()
+
+    def _prefetch_hovered_link(self):
+        """
+        Prefetches the details and the default tab of the entity
+        targeted by the hovered url.
+        """
+        url = self._hovered_link
+        if url is None:
+            return
+        self._prefetched_link = url
+
+        _, entity_type, entity_id = url.split(":")
+        # creating the location sets up the formatter for the entity type
+        sg_location = ShotgunLocation(entity_type, int(entity_id))
+        if (
+            sg_location.entity_type == self._current_location.entity_type
+            and sg_location.entity_id == self._current_location.entity_id
+        ):
+            return
+        if sg_location.sg_formatter.should_open_in_shotgun_web:
+            return
+
+        self._app.log_debug("Prefetching %s..." % sg_location)
+
+        # the models write what they load to their caches on disk,
+        # which is where the models of the panel load from first.
+        if "details" not in self._link_prefetch_models:
+            self._link_prefetch_models["details"] = SgEntityDetailsModel(
+                self,
+                self._task_scheduler.get_task_manager(task_scheduler.PRIORITY_PREFETCH),
+            )
+        self._link_prefetch_models["details"].load_data(sg_location)
+
+        tab_name = sg_location.tab
+        tab = self._entity_tabs.get(tab_name)
+        enabled, _ = sg_location.sg_formatter.show_entity_tab(tab_name)
+        if not (enabled and tab and tab.get("model_class") and tab.get("view")):
+            # only listings can be prefetched
+            return
+
+        if tab_name not in self._link_prefetch_models:
+            self._link_prefetch_models[tab_name] = tab["model_class"](
+                tab["entity_type"],
+                self,
+                self._task_scheduler.get_task_manager(task_scheduler.PRIORITY_PREFETCH),
+            )
+            self._link_prefetch_models[tab_name].freshness_key = tab_name
+        model = self._link_prefetch_models[tab_name]
+        args, kwargs = self._get_entity_tab_load_args(tab_name, model, sg_location)
+        model.load_data(*args, **kwargs)
+
     def _update_note_thumbnail(self, entity):
         """
         :param entity:
@@ -1042,6 +1415,7 @@ class AppDialog(QtGui.QWidget):
 
             elif entity_tab_name == self.ENTITY_TAB_PUBLISHES:
                 data["model_class"] = SgLatestPublishListingModel
+                data["proxy_class"] = LatestPublishProxyModel
                 data["delegate_class"] = ListItemDelegate
                 data["entity_type"] = self._publish_entity_type
                 data["has_filter"] = True
@@ -1090,6 +1464,23 @@ class AppDialog(QtGui.QWidget):
             # entity data passed in with the created model, view, delegate and other necessary objects
             self.setup_entity_model_view(data)
 
+            model = data.get("model")
+            if hasattr(model, "freshness_key"):
+                model.freshness_key = entity_tab_name
+
+            # keep track of when the tab is loaded, to prefetch the other tabs
+            if hasattr(model, "data_refreshed"):
+                model.data_refreshed.connect(
+                    lambda _, tab_name=entity_tab_name: self._on_entity_tab_loaded(
+                        tab_name
+                    )
+                )
+                model.data_refresh_fail.connect(
+                    lambda _, tab_name=entity_tab_name: self._on_entity_tab_loaded(
+                        tab_name
+                    )
+                )
+
             # Add the widgets to the layout in this order:
             # HBox: description (QLabel) - stretch [- sort] [- filter]
             # view (QListView)
@@ -1276,7 +1667,8 @@ class AppDialog(QtGui.QWidget):
         )
 
         # create proxy for sorting
-        entity_data["sort_proxy"] = FilterItemProxyModel(self)
+        ProxyClass = entity_data.get("proxy_class", FilterItemProxyModel)
+        entity_data["sort_proxy"] = ProxyClass(self)
         entity_data["sort_proxy"].setSourceModel(entity_data["model"])
 
         # now use the proxy model to sort the data to ensure
@@ -1291,6 +1683,10 @@ class AppDialog(QtGui.QWidget):
 
         # set up model
         entity_data["view"].setModel(entity_data["sort_proxy"])
+        # only download the thumbnails of the rows which are displayed
+        entity_data["thumbnail_loader"] = ThumbnailViewportLoader(
+            entity_data["view"], self
+        )
         # set up a global on-click handler for
         entity_data["view"].doubleClicked.connect(self._on_entity_doubleclicked)
         # create delegate
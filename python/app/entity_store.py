@@ -0,0 +1,145 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import time
+import collections
+
+from sgtk.platform.qt import QtCore
+
+# shared store instance, see get_entity_store()
+_entity_store = None
+
+
+def get_entity_store():
+    """
+    Returns the entity store shared by all models of the panel.
+
+    :returns: :class:`EntityStore` instance
+    """
+    global _entity_store
+
+    if _entity_store is None:
+        _entity_store = EntityStore()
+
+    return _entity_store
+
+
+class EntityStore(QtCore.QObject):
+    """
+    Holds a single record per Shotgun entity, merging the fields
+    returned by all the queries of the panel.
+
+    The records handed out are the ones held by the store, so they always
+    reflect the latest data known for an entity. They must not be modified
+    by anything but the store.
+
+    This is only ever accessed from the GUI thread.
+
+    :signal entity_updated(str, int): Emitted with the entity type and id
+        of an entity which has been updated through :meth:`update`.
+    """
+
+    entity_updated = QtCore.Signal(str, int)
+
+    # maximum number of entities held
+    MAX_SIZE = 10000
+
+    def __init__(self, parent=None):
+        """
+        Constructor
+
+        :param parent: QT parent object
+        """
+        QtCore.QObject.__init__(self, parent)
+
+        # (entity type, entity id) -> record, least recently merged first
+        self._entities = collections.OrderedDict()
+        # (entity type, entity id) -> {field: time the field was retrieved}
+        self._retrieval_times = {}
+
+    def __repr__(self):
+        return "<Entity store, %d entities>" % len(self._entities)
+
+    def merge(self, entity_type, sg_records):
+        """
+        Merges records retrieved from Shotgun into the store.
+
+        :param entity_type: Shotgun entity type
+        :param sg_records: List of Shotgun records
+        """
+        now = time.time()
+        for sg_data in sg_records:
+            key = (entity_type, sg_data["id"])
+
+            entity = self._entities.pop(key, None)
+            if entity is None:
+                entity = {}
+            # updated in place, so that references held elsewhere stay current
+            entity.update(sg_data)
+            self._entities[key] = entity
+
+            retrieval_times = self._retrieval_times.setdefault(key, {})
+            for field in sg_data:
+                retrieval_times[field] = now
+
+        while len(self._entities) > self.MAX_SIZE:
+            key, _ = self._entities.popitem(last=False)
+            del self._retrieval_times[key]
+
+    def update(self, entity_type, entity_id, data):
+        """
+        Updates an entity following a change made from the panel, e.g. by an
+        action, and lets all models know about it.
+
+        :param entity_type: Shotgun entity type
+        :param entity_id: Shotgun entity id
+        :param data: Dictionary of updated field values
+        """
+        sg_data = dict(data)
+        sg_data["id"] = entity_id
+        sg_data.setdefault("type", entity_type)
+        self.merge(entity_type, [sg_data])
+        self.entity_updated.emit(entity_type, entity_id)
+
+    def get(self, entity_type, entity_id, fields=None):
+        """
+        Returns the record held for an entity.
+
+        :param entity_type: Shotgun entity type
+        :param entity_id: Shotgun entity id
+        :param fields: Optional list of fields the record must hold
+        :returns: Dictionary or None if the entity is unknown
+            or lacks any of the fields.
+        """
+        entity = self._entities.get((entity_type, entity_id))
+        if entity is None or any(field not in entity for field in fields or []):
+            return None
+        return entity
+
+    def has_fields(self, entity_type, entity_id, fields, max_age):
+        """
+        Checks whether the values of some fields are known for an entity
+        and have been retrieved recently enough.
+
+        :param entity_type: Shotgun entity type
+        :param entity_id: Shotgun entity id
+        :param fields: List of fields
+        :param max_age: Maximum number of seconds since the fields were retrieved
+        :returns: True if all fields are known and recent enough
+        """
+        retrieval_times = self._retrieval_times.get((entity_type, entity_id))
+        if not retrieval_times:
+            return False
+
+        oldest = time.time() - max_age
+        for field in fields:
+            if retrieval_times.get(field, oldest) <= oldest:
+                return False
+        return True
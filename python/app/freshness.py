@@ -0,0 +1,113 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import time
+
+import sgtk
+
+# query signature -> time the query results were last refreshed
+_refresh_times = {}
+
+# query signature -> highest updated_at timestamp of the query results
+# cached on disk. Records updated since are all that needs refreshing.
+_watermarks = {}
+
+# time all data was last expired, see expire_all()
+_expired_at = 0
+
+
+def get_freshness_window(freshness_key):
+    """
+    Returns for how long the results of a query are considered fresh,
+    as configured by the ``freshness_windows`` setting.
+
+    :param freshness_key: Key identifying the kind of data in the
+        setting, e.g. the name of an entity tab. If None, or not in the
+        setting, the ``default`` entry of the setting is used.
+    :returns: Number of seconds
+    """
+    windows = sgtk.platform.current_bundle().get_setting("freshness_windows") or {}
+    if freshness_key in windows:
+        return windows[freshness_key]
+    return windows.get("default", 0)
+
+
+def is_fresh(signature, freshness_key):
+    """
+    Checks whether the results of a query have been refreshed
+    recently enough to be displayed without refreshing them.
+
+    :param signature: Query signature, see :func:`~query_signature.get_query_signature`
+    :param freshness_key: Key identifying the kind of data, see
+        :func:`get_freshness_window`
+    :returns: True if the results are fresh
+    """
+    refresh_time = _refresh_times.get(signature)
+    if refresh_time is None:
+        return False
+    return time.time() - refresh_time < get_freshness_window(freshness_key)
+
+
+def get_fresh_since(freshness_key):
+    """
+    Returns the time from which data fetched from Shotgun is considered
+    fresh, for data which keeps track of when it was fetched rather than
+    of the query it was fetched with.
+
+    :param freshness_key: Key identifying the kind of data, see
+        :func:`get_freshness_window`
+    :returns: Unix timestamp. Data fetched at or before it is stale.
+    """
+    return max(time.time() - get_freshness_window(freshness_key), _expired_at)
+
+
+def mark_refreshed(signature):
+    """
+    Records that the results of a query have just been refreshed.
+
+    :param signature: Query signature
+    """
+    if signature is not None:
+        _refresh_times[signature] = time.time()
+
+
+def get_watermark(signature):
+    """
+    Returns the highest updated_at timestamp of the cached results of a query.
+
+    :param signature: Query signature
+    :returns: Unix timestamp, or None if the query results haven't been
+        refreshed since data was last expired.
+    """
+    return _watermarks.get(signature)
+
+
+def set_watermark(signature, timestamp):
+    """
+    Records the highest updated_at timestamp of the cached results of a query.
+
+    :param signature: Query signature
+    :param timestamp: Unix timestamp
+    """
+    if signature is not None:
+        _watermarks[signature] = timestamp
+
+
+def expire_all():
+    """
+    Considers all query results stale, so that they are refreshed
+    next time they are displayed. The watermarks are dropped as well,
+    so that the results are fetched in full.
+    """
+    global _expired_at
+
+    _refresh_times.clear()
+    _watermarks.clear()
+    _expired_at = time.time()
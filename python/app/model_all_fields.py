@@ -10,6 +10,14 @@
 from sgtk.platform.qt import QtCore, QtGui
 import sgtk
 
+from .query_signature import (
+    canonical_fields,
+    canonical_filters,
+    get_query_signature,
+)
+from .freshness import is_fresh, mark_refreshed, get_freshness_window
+from .entity_store import get_entity_store
+
 # import the shotgun_model module from the shotgun utils framework
 shotgun_model = sgtk.platform.import_framework(
     "tk-framework-shotgunutils", "shotgun_model"
@@ -47,14 +55,44 @@ class SgAllFieldsModel(ShotgunModel):
         )
 
         self._sg_location = None
+        self._fields = None
         self.data_refreshed.connect(self._on_data_refreshed)
+        get_entity_store().entity_updated.connect(self._on_entity_updated)
+
+        # key of the freshness window applying to this model, see freshness.py
+        self.freshness_key = "info"
+        self._query_signature = None
+        self._refresh_pending = False
+        self.data_refresh_fail.connect(self._on_data_refresh_failed)
+
+    def destroy(self):
+        """
+        Tear down method
+        """
+        get_entity_store().entity_updated.disconnect(self._on_entity_updated)
+
+        # call base class
+        ShotgunModel.destroy(self)
 
     def _get_sg_data(self):
         """
         Returns the sg data dictionary for the associated item
         None if not available.
+
+        The entity store holds the most recent data and is looked up first.
         """
-        if self.rowCount() == 0:
+        entity = None
+        if self._sg_location is not None:
+            entity = get_entity_store().get(
+                self._sg_location.entity_type, self._sg_location.entity_id, self._fields
+            )
+
+        if entity is not None:
+            # the store merges fields from other queries, which aren't displayed
+            data = dict(
+                (field, entity[field]) for field in self._fields + ["type", "id"]
+            )
+        elif self.rowCount() == 0:
             data = {}
         else:
             data = self.item(0).get_sg_data()
@@ -67,9 +105,37 @@ class SgAllFieldsModel(ShotgunModel):
         so that a data_updated signal is consistently sent
         out both after the data has been updated and after a cache has been read in
         """
+        if self._refresh_pending:
+            self._refresh_pending = False
+            mark_refreshed(self._query_signature)
+            if self.rowCount() > 0:
+                get_entity_store().merge(
+                    self._sg_location.entity_type, [self.item(0).get_sg_data()]
+                )
+
         sg_data = self._get_sg_data()
         self.data_updated.emit(sg_data)
 
+    def _on_entity_updated(self, entity_type, entity_id):
+        """
+        Called when an entity has been updated in the entity store.
+
+        :param entity_type: Shotgun entity type
+        :param entity_id: Shotgun entity id
+        """
+        if (
+            self._sg_location
+            and entity_type == self._sg_location.entity_type
+            and entity_id == self._sg_location.entity_id
+        ):
+            self.data_updated.emit(self._get_sg_data())
+
+    def _on_data_refresh_failed(self):
+        """
+        Called when the data could not be refreshed.
+        """
+        self._refresh_pending = False
+
     ############################################################################################
     # public interface
 
@@ -81,16 +147,28 @@ class SgAllFieldsModel(ShotgunModel):
         # set the current location to represent
         self._sg_location = sg_location
 
-        filters = [["id", "is", self._sg_location.entity_id]]
+        entity_type = sg_location.sg_formatter.entity_type
+        filters = canonical_filters([["id", "is", self._sg_location.entity_id]])
         hierarchy = ["id"]
+        fields = canonical_fields(sg_location.sg_formatter.all_fields)
+        self._fields = fields
 
-        ShotgunModel._load_data(
-            self,
-            sg_location.sg_formatter.entity_type,
-            filters,
-            hierarchy,
-            sg_location.sg_formatter.all_fields,
-        )
+        ShotgunModel._load_data(self, entity_type, filters, hierarchy, fields)
         # signal to any views that data now may be available
         self.data_updated.emit(self._get_sg_data())
-        self._refresh_data()
+
+        self._query_signature = get_query_signature(entity_type, filters, fields)
+        if is_fresh(self._query_signature, self.freshness_key) or (
+            self.rowCount() > 0
+            and get_entity_store().has_fields(
+                entity_type,
+                sg_location.entity_id,
+                fields,
+                get_freshness_window(self.freshness_key),
+            )
+        ):
+            # nothing to refresh, the cached data is up to date
+            self.data_refreshed.emit(False)
+        else:
+            self._refresh_pending = True
+            self._refresh_data()
@@ -11,6 +11,9 @@
 from sgtk.platform.qt import QtCore, QtGui
 import sgtk
 from . import utils
+from .thumbnail_cache import get_composited_thumbnail
+from .query_signature import canonical_fields, canonical_filters
+from .thumbnail_compositor import ThumbnailCompositor
 
 # import the shotgun_model module from the shotgun utils framework
 shotgun_model = sgtk.platform.import_framework(
@@ -48,6 +51,20 @@ class SgCurrentUserModel(ShotgunModel):
         self._current_user_sg_dict = None
         self.data_refreshed.connect(self._on_data_refreshed)
 
+        self._thumbnail_compositor = ThumbnailCompositor(bg_task_manager, self)
+        self._thumbnail_compositor.thumbnails_composited.connect(
+            self._on_thumbnails_composited
+        )
+
+    def destroy(self):
+        """
+        Tear down method
+        """
+        self._thumbnail_compositor.destroy()
+
+        # call base class
+        ShotgunModel.destroy(self)
+
     def _on_data_refreshed(self):
         """
         Dispatch method that gets called whenever data has been refreshed in the cache
@@ -77,8 +94,24 @@ class SgCurrentUserModel(ShotgunModel):
         :param field: The Shotgun field which the thumbnail is associated with.
         :param path: A path on disk to the thumbnail. This is a file in jpeg format.
         """
-        self._current_pixmap = utils.create_round_thumbnail(image)
-        self.thumbnail_updated.emit()
+        # the thumbnail is composited in the background
+        self._thumbnail_compositor.request(
+            "current_user",
+            get_composited_thumbnail,
+            utils.create_round_thumbnail,
+            image,
+            path,
+        )
+
+    def _on_thumbnails_composited(self, thumbnails):
+        """
+        Called when the thumbnail has been composited in the background.
+
+        :param thumbnails: List of (key, QImage) tuples
+        """
+        for _, image in thumbnails:
+            self._current_pixmap = QtGui.QPixmap.fromImage(image)
+            self.thumbnail_updated.emit()
 
     ############################################################################################
     # public interface
@@ -106,9 +139,9 @@ class SgCurrentUserModel(ShotgunModel):
             ShotgunModel._load_data(
                 self,
                 sg_user_data["type"],
-                [["id", "is", sg_user_data["id"]]],
+                canonical_filters([["id", "is", sg_user_data["id"]]]),
                 hierarchy,
-                fields,
+                canonical_fields(fields),
             )
 
             # signal to any views that data now may be available
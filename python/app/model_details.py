@@ -11,6 +11,16 @@
 from sgtk.platform.qt import QtCore, QtGui
 import sgtk
 
+from .query_signature import (
+    canonical_fields,
+    canonical_filters,
+    get_query_signature,
+)
+from .freshness import is_fresh, mark_refreshed, get_freshness_window
+from .entity_store import get_entity_store
+from .thumbnail_compositor import ThumbnailCompositor
+from .publish_lookup import get_publish_lookup, get_history_fields
+
 # import the shotgun_model module from the shotgun utils framework
 shotgun_model = sgtk.platform.import_framework(
     "tk-framework-shotgunutils", "shotgun_model"
@@ -48,8 +58,44 @@ class SgEntityDetailsModel(ShotgunModel):
         )
 
         self._sg_location = None
+        self._fields = None
         self._current_pixmap = None
         self.data_refreshed.connect(self._on_data_refreshed)
+        get_entity_store().entity_updated.connect(self._on_entity_updated)
+
+        # key of the freshness window applying to this model, see freshness.py
+        self.freshness_key = "details"
+        self._query_signature = None
+        self._refresh_pending = False
+        self.data_refresh_fail.connect(self._on_data_refresh_failed)
+
+        self._thumbnail_compositor = ThumbnailCompositor(bg_task_manager, self)
+        self._thumbnail_compositor.thumbnails_composited.connect(
+            self._on_thumbnails_composited
+        )
+
+    def destroy(self):
+        """
+        Tear down method
+        """
+        self._thumbnail_compositor.destroy()
+        get_entity_store().entity_updated.disconnect(self._on_entity_updated)
+
+        # call base class
+        ShotgunModel.destroy(self)
+
+    def cancel_pending_work(self):
+        """
+        Cancels all background work for the data currently loaded, typically
+        because the user has navigated to another location. The data already
+        loaded is left untouched, loading data again resumes normal operation.
+        """
+        self._refresh_pending = False
+
+        # retriever of the ShotgunQueryModel base class, running the
+        # query and the thumbnail downloads
+        self._sg_data_retriever.clear()
+        self._thumbnail_compositor.clear()
 
     def _on_data_refreshed(self):
         """
@@ -57,8 +103,52 @@ class SgEntityDetailsModel(ShotgunModel):
         so that a data_updated signal is consistenntly sent
         out both after the data has been updated and after a cache has been read in
         """
+        if self._refresh_pending:
+            self._refresh_pending = False
+            mark_refreshed(self._query_signature)
+            if self.rowCount() > 0:
+                get_entity_store().merge(
+                    self._sg_location.entity_type, [self.item(0).get_sg_data()]
+                )
+
+        self._register_publish()
         self.data_updated.emit()
 
+    def _on_entity_updated(self, entity_type, entity_id):
+        """
+        Called when an entity has been updated in the entity store.
+
+        :param entity_type: Shotgun entity type
+        :param entity_id: Shotgun entity id
+        """
+        if (
+            self._sg_location
+            and entity_type == self._sg_location.entity_type
+            and entity_id == self._sg_location.entity_id
+        ):
+            self.data_updated.emit()
+
+    def _on_data_refresh_failed(self):
+        """
+        Called when the data could not be refreshed.
+        """
+        self._refresh_pending = False
+
+    def _is_publish(self):
+        """
+        Returns True if the current location is a publish.
+        """
+        return self._sg_location.entity_type in ["PublishedFile", "TankPublishedFile"]
+
+    def _register_publish(self):
+        """
+        Registers the current publish, if any, in the publish lookup so
+        that the history tab can skip looking it up.
+        """
+        sg_data = self.get_sg_data()
+        if sg_data and self._is_publish():
+            get_publish_lookup().register(self._sg_location.entity_type, [sg_data])
+
     def _populate_default_thumbnail(self, item):
         """
         Called whenever an item needs to get a default thumbnail attached to a node.
@@ -99,11 +189,27 @@ class SgEntityDetailsModel(ShotgunModel):
             # ignore and not display.
             return
 
+        # the thumbnail is composited in the background
         sg_data = item.get_sg_data()
-        self._current_pixmap = self._sg_location.sg_formatter.create_thumbnail(
-            image, sg_data
+        self._thumbnail_compositor.request(
+            (self._sg_location.entity_type, self._sg_location.entity_id),
+            self._sg_location.sg_formatter.create_thumbnail,
+            image,
+            sg_data,
+            path,
         )
-        self.thumbnail_updated.emit()
+
+    def _on_thumbnails_composited(self, thumbnails):
+        """
+        Called when the thumbnail has been composited in the background.
+
+        :param thumbnails: List of ((entity type, entity id), QImage) tuples
+        """
+        current_key = (self._sg_location.entity_type, self._sg_location.entity_id)
+        for key, image in thumbnails:
+            if key == current_key:
+                self._current_pixmap = QtGui.QPixmap.fromImage(image)
+                self.thumbnail_updated.emit()
 
     ############################################################################################
     # public interface
@@ -120,33 +226,61 @@ class SgEntityDetailsModel(ShotgunModel):
         """
         # set the current location to represent
         self._sg_location = sg_location
+        self._thumbnail_compositor.clear()
 
         fields = (
             sg_location.sg_formatter.fields + sg_location.sg_formatter.thumbnail_fields
         )
+        if self._is_publish():
+            fields += get_history_fields(sg_location.entity_type)
 
         hierarchy = ["id"]
+        filters = canonical_filters([["id", "is", sg_location.entity_id]])
+        fields = canonical_fields(fields)
+        self._fields = fields
 
         ShotgunModel._load_data(
-            self,
-            sg_location.entity_type,
-            [["id", "is", sg_location.entity_id]],
-            hierarchy,
-            fields,
+            self, sg_location.entity_type, filters, hierarchy, fields
         )
 
         # signal to any views that data now may be available
+        self._register_publish()
         self.data_updated.emit()
-        self._refresh_data()
+
+        self._query_signature = get_query_signature(
+            sg_location.entity_type, filters, fields
+        )
+        if is_fresh(self._query_signature, self.freshness_key) or (
+            # another query, e.g. from the info tab, has fetched everything
+            self.rowCount() > 0
+            and get_entity_store().has_fields(
+                sg_location.entity_type,
+                sg_location.entity_id,
+                fields,
+                get_freshness_window(self.freshness_key),
+            )
+        ):
+            # nothing to refresh, the cached data is up to date
+            self.data_refreshed.emit(False)
+        else:
+            self._refresh_pending = True
+            self._refresh_data()
 
     def get_sg_data(self):
         """
         Returns the sg data dictionary for the associated item
         None if not available.
+
+        The entity store holds the most recent data, possibly
+        fetched by other models, and is looked up first.
         """
-        if self.rowCount() == 0:
-            data = None
-        else:
+        if self._sg_location is None:
+            return None
+
+        data = get_entity_store().get(
+            self._sg_location.entity_type, self._sg_location.entity_id, self._fields
+        )
+        if data is None and self.rowCount() > 0:
             data = self.item(0).get_sg_data()
 
         return data
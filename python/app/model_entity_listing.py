@@ -8,10 +8,28 @@
 # agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
 # not expressly granted therein are reserved by Shotgun Software Inc.
 
+import time
+import datetime
+import collections
+
 import sgtk
-from sgtk.platform.qt import QtGui
+from sgtk.platform.qt import QtCore, QtGui
 
-from .shotgun_formatter import ShotgunTypeFormatter
+from .shotgun_formatter import get_type_formatter, get_list_item_cache
+from .query_signature import (
+    canonical_fields,
+    canonical_filters,
+    canonical_order,
+    get_query_signature,
+)
+from .thumbnail_compositor import ThumbnailCompositor
+from .thumbnail_budget import get_thumbnail_budget
+from .freshness import is_fresh, mark_refreshed, get_watermark, set_watermark
+from .entity_store import get_entity_store
+from .query_coalescer import CoalescingDataRetriever
+from .task_scheduler import get_cpu_task_manager
+from .widget_list_item import ListItemWidget
+from . import utils
 
 # import the shotgun_model module from the shotgun utils framework
 shotgun_model = sgtk.platform.import_framework(
@@ -19,6 +37,11 @@ shotgun_model = sgtk.platform.import_framework(
 )
 ShotgunModel = shotgun_model.ShotgunModel
 
+# pages loaded beyond the first one, keyed by (query signature, page number).
+# The first page is cached on disk by the ShotgunModel itself.
+_page_cache = collections.OrderedDict()
+PAGE_CACHE_SIZE = 50
+
 
 class SgEntityListingModel(ShotgunModel):
     """
@@ -29,13 +52,32 @@ class SgEntityListingModel(ShotgunModel):
 
     The associated object is defined in the shotgun location.
 
-    The returned data in this model is capped so that it will at
-    the most contain SG_RECORD_LIMIT items.
+    The data is loaded in pages of SG_RECORD_LIMIT items. The first page
+    is loaded by the ShotgunModel. Further pages are fetched in the
+    background when the view asks for more data, which typically happens
+    when the user scrolls to the end of the list.
+
+    Once the data has been refreshed in a session, later refreshes first
+    fetch the records updated since. The data is only fetched in full
+    again if any record has changed.
+
+    Thumbnails are only downloaded for the items handed to
+    :meth:`request_thumbnails`, typically the ones shown by the view.
+
+    :signal page_loaded(): Emitted whenever a page has been appended to the model.
     """
 
-    # maximum number of items to show in the listings
+    page_loaded = QtCore.Signal()
+
+    # number of items to load per page
     SG_RECORD_LIMIT = 200
 
+    # role holding list item details rendered ahead of time in the background
+    LIST_ITEM_DETAILS_ROLE = QtCore.Qt.UserRole + 220
+
+    # role flagging items appended from pages beyond the first one
+    APPENDED_ITEM_ROLE = QtCore.Qt.UserRole + 221
+
     TEXT_NUM_ITEMS_FULL = "Showing {num} {entity_type}s"
     TEXT_NUM_ITEMS_PARTIAL = "Only showing the first {num} {entity_type}s"
     TEXT_NUM_ITEMS_TT_FULL = (
@@ -44,6 +86,20 @@ class SgEntityListingModel(ShotgunModel):
     TEXT_NUM_ITEMS_TT_PARTIAL_FIRST = "Results are limited."
     TEXT_NUM_ITEMS_TT_PARTIAL_MIDDLE = None
     TEXT_NUM_ITEMS_TT_PARTIAL_LAST = "To see a list of all results, visit your entity pages in Flow Production Tracking."
+    # number of delta refreshes between checks for records which
+    # have been deleted or don't match the query anymore
+    DELETION_CHECK_INTERVAL = 5
+
+    # maximum number of thumbnail downloads handed to the data retriever at once,
+    # the others wait in a queue which is reordered as the view is scrolled
+    MAX_THUMBNAIL_DOWNLOADS = 6
+
+    # seconds after which a thumbnail download which hasn't completed, typically
+    # because it has failed, doesn't prevent other downloads from starting
+    THUMBNAIL_DOWNLOAD_TIMEOUT = 10
+
+    TEXT_NUM_ITEMS_PAGED = "Loaded {num} of {total} {entity_type}s"
+    TEXT_NUM_ITEMS_TT_PAGED = "Scroll to the end of the list to load more."
 
     def __init__(self, entity_type, parent, bg_task_manager):
         """
@@ -53,13 +109,18 @@ class SgEntityListingModel(ShotgunModel):
         :param parent: QT parent object
         """
         self._sg_location = None
-        self._sg_formatter = ShotgunTypeFormatter(entity_type)
+        self._sg_formatter = get_type_formatter(entity_type)
 
-        # init base class
+        # background task rendering the list item details for all items
+        self._task_manager = get_cpu_task_manager(bg_task_manager)
+        self._preformat_task_id = None
+
+        # init base class, thumbnails are only downloaded
+        # for visible items, see request_thumbnails()
         ShotgunModel.__init__(
             self,
             parent,
-            download_thumbs=True,
+            download_thumbs=False,
             bg_load_thumbs=True,
             bg_task_manager=bg_task_manager,
         )
@@ -67,8 +128,99 @@ class SgEntityListingModel(ShotgunModel):
         self.content_is_partial = False
         self.label_nb_items_status = None
 
+        # entity id -> item, built when first needed after rows have changed
+        self._item_index = None
+        self.rowsInserted.connect(self._clear_item_index)
+        self.rowsRemoved.connect(self._clear_item_index)
+        self.modelReset.connect(self._clear_item_index)
+
         self.data_refreshed.connect(self._on_data_updated)
 
+        # query of the current listing, used to fetch additional pages
+        self._page_query = None
+        self._page_signature = None
+        self._pages_loaded = 0
+        self._page_request = None
+        self._count_request_id = None
+        self.total_count = None
+
+        self._data_retriever = CoalescingDataRetriever(self, bg_task_manager)
+        self._data_retriever.start()
+        self._data_retriever.work_completed.connect(self._on_worker_completed)
+        self._data_retriever.work_failure.connect(self._on_worker_failure)
+
+        self.page_loaded.connect(self._on_data_updated)
+        self.page_loaded.connect(self._preformat_list_items)
+        self.data_refreshed.connect(self._remove_duplicate_rows)
+
+        # key of the freshness window applying to this model, see freshness.py
+        self.freshness_key = None
+        self._query_signature = None
+        self._refresh_pending = False
+        self.data_refreshed.connect(self._on_query_refreshed)
+
+        # query of the current listing and state of delta refreshes
+        self._query = None
+        self._delta_request_id = None
+        self._id_check_request_id = None
+        self._num_delta_refreshes = 0
+        # highest updated_at of the data last refreshed by the ShotgunModel
+        self._refreshed_watermark = None
+
+        # changes made from the panel are applied right away
+        get_entity_store().entity_updated.connect(self._on_entity_updated)
+        self.data_refresh_fail.connect(self._on_query_refresh_failed)
+
+        # set once the background work for the loaded data has been cancelled
+        self._work_cancelled = False
+
+        # source thumbnail paths by entity id, so that thumbnails released
+        # to stay within the memory budget can be loaded again later on.
+        self._thumbnail_paths = {}
+        self._released_thumbnails = set()
+
+        # entity ids of the thumbnails waiting to be downloaded, most important
+        # first, entity id -> time of the request for the downloads in progress,
+        # and entity id -> thumbnail urls for all thumbnails requested.
+        self._thumbnail_queue = []
+        self._thumbnail_downloads = {}
+        self._requested_thumbnails = {}
+
+        # failed downloads are never reported, their slot is freed once they
+        # have timed out, without waiting for more thumbnails to be requested
+        self._thumbnail_timeout_timer = QtCore.QTimer(self)
+        self._thumbnail_timeout_timer.setSingleShot(True)
+        self._thumbnail_timeout_timer.timeout.connect(self._download_thumbnails)
+
+        # thumbnails are composited in the background and applied in batches
+        self._thumbnail_compositor = ThumbnailCompositor(bg_task_manager, self)
+        self._thumbnail_compositor.thumbnails_composited.connect(
+            self._on_thumbnails_composited
+        )
+
+        # render html for all items in bulk whenever new data has been loaded
+        self.cache_loaded.connect(self._preformat_list_items)
+        self.data_refreshed.connect(self._preformat_list_items)
+        self._task_manager.task_completed.connect(self._on_task_completed)
+        self._task_manager.task_failed.connect(self._on_task_failed)
+
+    def destroy(self):
+        """
+        Tear down method
+        """
+        self._task_manager.task_completed.disconnect(self._on_task_completed)
+        self._task_manager.task_failed.disconnect(self._on_task_failed)
+        if self._preformat_task_id is not None:
+            self._task_manager.stop_task(self._preformat_task_id)
+            self._preformat_task_id = None
+        self._thumbnail_compositor.destroy()
+        get_thumbnail_budget().remove_model(self)
+        get_entity_store().entity_updated.disconnect(self._on_entity_updated)
+        self._data_retriever.stop()
+
+        # call base class
+        ShotgunModel.destroy(self)
+
     ############################################################################################
     # public interface
 
@@ -116,6 +268,10 @@ class SgEntityListingModel(ShotgunModel):
                is the main 'text' field in the model that is set.
         """
         self._sg_location = sg_location
+        self._work_cancelled = False
+
+        self._clear_thumbnails()
+        self._clear_pages()
 
         # if a sort field has not been specified, default to
         # update date (unix time), in descending order
@@ -135,6 +291,8 @@ class SgEntityListingModel(ShotgunModel):
         fields = self._sg_formatter.fields
         if additional_fields:
             fields += additional_fields
+        # needed to only refresh records which have been updated
+        fields = fields + ["updated_at"]
 
         # This is wrapped here to account for the situation where we can't
         # query for the My Tasks tab if we don't have a Shotgun user. This
@@ -147,9 +305,14 @@ class SgEntityListingModel(ShotgunModel):
             self.data_refresh_fail.emit(exc.message)
             return
 
+        entity_type = self._sg_formatter.entity_type
+        combined_filters = canonical_filters(combined_filters)
+        fields = canonical_fields(fields)
+        sort_order = canonical_order(sort_order)
+
         ShotgunModel._load_data(
             self,
-            self._sg_formatter.entity_type,
+            entity_type,
             combined_filters,
             hierarchy,
             fields,
@@ -158,7 +321,152 @@ class SgEntityListingModel(ShotgunModel):
             # FIXME The api3/json provides paging_info.has_next_page but python-api does not
             # return this information
         )
-        self._refresh_data()
+
+        self._query = (entity_type, combined_filters, fields, sort_order)
+
+        if self._is_paged():
+            self._page_query = (entity_type, combined_filters, fields, sort_order)
+            self._page_signature = get_query_signature(
+                entity_type, combined_filters, fields, sort_order, self.SG_RECORD_LIMIT
+            )
+            self._pages_loaded = 1
+
+        self._refresh_if_stale(
+            get_query_signature(
+                entity_type,
+                combined_filters,
+                fields,
+                sort_order,
+                self.SG_RECORD_LIMIT + 1,
+            )
+        )
+
+    def canFetchMore(self, parent):
+        """
+        Returns True if there are more pages to load. Called by the views.
+
+        :param parent: Parent QModelIndex
+        """
+        if parent.isValid() or self._page_query is None:
+            return False
+        return self.content_is_partial and self._page_request is None
+
+    def fetchMore(self, parent):
+        """
+        Loads the next page of data. Called by the views, typically when
+        the user has scrolled to the end of the list.
+
+        Pages loaded before in this session are appended right away. They
+        are fetched again in the background either way and new records
+        are appended once they have arrived.
+
+        :param parent: Parent QModelIndex
+        """
+        if not self.canFetchMore(parent):
+            return
+
+        page = self._pages_loaded + 1
+
+        cached_records = _page_cache.get((self._page_signature, page))
+        if cached_records is not None:
+            _page_cache.move_to_end((self._page_signature, page))
+            self._append_page(page, cached_records)
+
+        entity_type, filters, fields, order = self._page_query
+        uid = self._data_retriever.execute_find(
+            entity_type,
+            filters,
+            fields,
+            order,
+            limit=self.SG_RECORD_LIMIT,
+            page=page,
+        )
+        self._page_request = (uid, page)
+
+    def cancel_pending_work(self):
+        """
+        Cancels all background work for the data currently loaded, typically
+        because the user has navigated to another location. Queued queries,
+        thumbnail downloads and compositing are dropped before they run and
+        thumbnails which are already downloading are ignored once they arrive.
+
+        The data already loaded is left untouched, loading data again
+        resumes normal operation.
+        """
+        self._work_cancelled = True
+        self._refresh_pending = False
+        self._delta_request_id = None
+        self._id_check_request_id = None
+
+        # retriever of the ShotgunQueryModel base class, running the
+        # query of the first page and all thumbnail downloads
+        self._sg_data_retriever.clear()
+        self._clear_thumbnails()
+        self._clear_pages()
+
+        if self._preformat_task_id is not None:
+            self._task_manager.stop_task(self._preformat_task_id)
+            self._preformat_task_id = None
+
+    def get_location_filters(self, sg_location):
+        """
+        Returns the filters linking the items of this model to a location,
+        without any of the additional filters set up in the UI.
+
+        :param sg_location: Location object representing the *associated*
+               object for which items should be loaded.
+        :returns: List of Shotgun filters or None if the items of this model
+            cannot be retrieved with a single query.
+        """
+        return self._sg_formatter.get_link_filters(sg_location)
+
+    def touch_thumbnail(self, sg_data):
+        """
+        Called whenever the thumbnail of an item is displayed. If the thumbnail
+        has been released to stay within the thumbnail memory budget, it is
+        loaded again in the background.
+
+        :param sg_data: Shotgun data of the item
+        """
+        entity_id = sg_data.get("id")
+
+        if entity_id not in self._released_thumbnails:
+            get_thumbnail_budget().touch(self, entity_id)
+            return
+
+        self._released_thumbnails.discard(entity_id)
+        # the source image is decoded again from the path
+        self._request_thumbnail(sg_data, None, self._thumbnail_paths[entity_id])
+
+    def request_thumbnails(self, entity_ids):
+        """
+        Downloads the thumbnails of some items, in the given order. The queue
+        of thumbnails waiting to be downloaded is replaced, so thumbnails of
+        items which aren't in the list anymore are not downloaded.
+
+        Thumbnails which have already been requested are skipped, unless
+        they have changed since.
+
+        :param entity_ids: List of entity ids, most important first
+        """
+        self._thumbnail_queue = [
+            entity_id
+            for entity_id in entity_ids
+            if entity_id not in self._thumbnail_downloads
+        ]
+        self._download_thumbnails()
+
+    def release_thumbnail(self, entity_id):
+        """
+        Releases the thumbnail of an item, reverting it to the default
+        thumbnail. Called by the thumbnail memory budget.
+
+        :param entity_id: Id of the entity the thumbnail belongs to
+        """
+        item = self._get_item(entity_id)
+        if item:
+            self._populate_default_thumbnail(item)
+            self._released_thumbnails.add(entity_id)
 
     ############################################################################################
     # protected methods
@@ -167,7 +475,20 @@ class SgEntityListingModel(ShotgunModel):
         """
         Return the filter to be used for the current query
         """
-        return self._sg_formatter.get_link_filters(self._sg_location)
+        return self.get_location_filters(self._sg_location)
+
+    def _populate_item(self, item, sg_data):
+        """
+        Called whenever an item is constructed by the ShotgunModel.
+
+        Thumbnails aren't downloaded by the ShotgunModel, which then doesn't
+        set up a default thumbnail either.
+
+        :param item: QStandardItem which has been constructed
+        :param sg_data: Shotgun data of the item
+        """
+        if item.icon().isNull():
+            self._populate_default_thumbnail(item)
 
     def _populate_default_thumbnail(self, item):
         """
@@ -208,9 +529,399 @@ class SgEntityListingModel(ShotgunModel):
             # ignore and not display.
             return
 
-        sg_data = item.get_sg_data()
-        icon = self._sg_formatter.create_thumbnail(image, sg_data)
-        item.setIcon(QtGui.QIcon(icon))
+        self._on_thumbnail_downloaded(item)
+
+        if self._work_cancelled:
+            # nobody is going to look at it, don't spend time compositing it
+            return
+
+        self._request_thumbnail(item.get_sg_data(), image, path)
+
+    def _refresh_if_stale(self, signature):
+        """
+        Refreshes the data loaded from the cache, unless it has been
+        refreshed recently enough to be displayed as is.
+
+        :param signature: Signature of the query the model has been loaded with
+        """
+        self._query_signature = signature
+
+        if is_fresh(signature, self.freshness_key):
+            # nothing to refresh, the cached data is up to date
+            self.data_refreshed.emit(False)
+            return
+
+        self._refresh_pending = True
+        if self._query and get_watermark(signature) and self.rowCount() > 0:
+            self._refresh_delta()
+        else:
+            self._refresh_data()
+
+    def _refresh_delta(self):
+        """
+        Fetches the records updated since the data loaded from the
+        cache was last refreshed.
+        """
+        entity_type, filters, fields, order = self._query
+        # overlap by a second, updated_at doesn't go any finer
+        since = datetime.datetime.fromtimestamp(
+            get_watermark(self._query_signature) - 1
+        )
+
+        self._delta_request_id = self._data_retriever.execute_find(
+            entity_type,
+            filters + [["updated_at", "greater_than", since]],
+            fields,
+            order,
+            # a full page of updated records is refreshed in full anyway
+            limit=self.SG_RECORD_LIMIT,
+        )
+
+    def _check_delta(self, sg_records):
+        """
+        Checks the records updated since the last refresh against the data
+        loaded from the cache.
+
+        The first page is cached on disk by the ShotgunModel, which only
+        persists the data it has refreshed itself. Whenever any record has
+        changed, a full refresh is run so that the cache, and the watermark
+        taken from it, never fall behind what has been fetched.
+
+        :param sg_records: List of Shotgun records, with datetimes
+            already converted to unix timestamps.
+        """
+        items = self._get_item_index()
+        changed = len(sg_records) >= self.SG_RECORD_LIMIT or any(
+            sg_data["id"] not in items
+            or items[sg_data["id"]].get_sg_data().get("updated_at")
+            != sg_data.get("updated_at")
+            for sg_data in sg_records
+        )
+        if changed:
+            # the ShotgunModel takes care of ordering and caching things
+            self._refresh_data()
+            return
+
+        self._num_delta_refreshes += 1
+        if self._num_delta_refreshes % self.DELETION_CHECK_INTERVAL == 0:
+            # deleted records don't show up in the delta, look for gaps
+            entity_type, filters, _, order = self._query
+            self._id_check_request_id = self._data_retriever.execute_find(
+                entity_type, filters, ["id"], order, limit=self.SG_RECORD_LIMIT
+            )
+        else:
+            self.data_refreshed.emit(False)
+
+    def _check_ids(self, sg_records):
+        """
+        Compares the ids of the records matching the query with the records
+        of the first page, running a full refresh if they differ. Rows
+        appended by loading further pages are left out.
+
+        :param sg_records: List of Shotgun records, holding ids only
+        """
+        first_page_ids = set(
+            self.item(row).get_sg_data().get("id")
+            for row in range(self.rowCount())
+            if not self.item(row).data(self.APPENDED_ITEM_ROLE)
+        )
+        if set(sg_data["id"] for sg_data in sg_records) != first_page_ids:
+            self._refresh_data()
+        else:
+            self.data_refreshed.emit(False)
+
+    def _on_entity_updated(self, entity_type, entity_id):
+        """
+        Called when an entity has been updated in the entity store.
+
+        :param entity_type: Shotgun entity type
+        :param entity_id: Shotgun entity id
+        """
+        if entity_type != self._sg_formatter.entity_type:
+            return
+
+        item = self._get_item(entity_id)
+        if item is None:
+            return
+
+        # only the fields this model has queried are updated
+        entity = get_entity_store().get(entity_type, entity_id)
+        sg_data = dict(
+            (field, entity.get(field, value))
+            for field, value in item.get_sg_data().items()
+        )
+        item.setData(
+            shotgun_model.sanitize_for_qt_model(sg_data), ShotgunModel.SG_DATA_ROLE
+        )
+
+        # the details are rendered again by the delegate, as the cache
+        # key has changed along with the data
+        item.setData(None, self.LIST_ITEM_DETAILS_ROLE)
+
+        # thumbnails may depend on the data too, e.g. unread notes
+        path = self._thumbnail_paths.get(entity_id)
+        if path and not self._work_cancelled:
+            self._request_thumbnail(sg_data, None, path)
+
+    def _on_query_refreshed(self):
+        """
+        Called when the data has been refreshed.
+        """
+        if self._refresh_pending:
+            self._refresh_pending = False
+            mark_refreshed(self._query_signature)
+
+            sg_records = [
+                self.item(row).get_sg_data() for row in range(self.rowCount())
+            ]
+            get_entity_store().merge(self._sg_formatter.entity_type, sg_records)
+
+        # only data which has made it into the cache moves the watermark
+        # forward, rows appended from other pages or updated from the entity
+        # store aren't cached on disk
+        if self._refreshed_watermark is not None:
+            set_watermark(self._query_signature, self._refreshed_watermark)
+        self._refreshed_watermark = None
+
+    def _on_query_refresh_failed(self):
+        """
+        Called when the data could not be refreshed.
+        """
+        self._refresh_pending = False
+
+    def _is_paged(self):
+        """
+        Returns True if additional pages can be loaded beyond the first one.
+        Subclasses which cannot append data page by page should return False.
+        """
+        return True
+
+    def _clear_pages(self):
+        """
+        Forgets about the current paged query and cancels outstanding requests.
+        """
+        self._data_retriever.clear()
+        self._page_query = None
+        self._page_signature = None
+        self._pages_loaded = 0
+        self._page_request = None
+        self._count_request_id = None
+        self.total_count = None
+
+    def _append_page(self, page, sg_records):
+        """
+        Appends a page of records to the model, skipping records which
+        are already in the model.
+
+        :param page: Page number
+        :param sg_records: List of Shotgun records, with datetimes
+            already converted to unix timestamps.
+        """
+        self._pages_loaded = max(self._pages_loaded, page)
+
+        # the last page is the first one which isn't full
+        self.content_is_partial = len(sg_records) >= self.SG_RECORD_LIMIT
+        if self.total_count is not None:
+            self.content_is_partial &= self.rowCount() < self.total_count
+
+        existing_ids = set(
+            self.item(row).get_sg_data().get("id") for row in range(self.rowCount())
+        )
+
+        for sg_data in sg_records:
+            if sg_data["id"] in existing_ids:
+                continue
+
+            item = shotgun_model.ShotgunStandardItem()
+            item.setEditable(False)
+            item.setData(True, self.APPENDED_ITEM_ROLE)
+            item.setData(
+                shotgun_model.sanitize_for_qt_model(sg_data), ShotgunModel.SG_DATA_ROLE
+            )
+            self._populate_default_thumbnail(item)
+            self.appendRow(item)
+
+        self.page_loaded.emit()
+
+    def _remove_duplicate_rows(self):
+        """
+        Removes appended rows for records which have moved into the first
+        page, which is refreshed by the ShotgunModel.
+        """
+        first_page_ids = set(self.entity_ids)
+        for row in reversed(range(self.rowCount())):
+            item = self.item(row)
+            if not item.data(self.APPENDED_ITEM_ROLE):
+                # item managed by the ShotgunModel
+                continue
+            if item.get_sg_data().get("id") in first_page_ids:
+                self.removeRow(row)
+
+    def _on_worker_completed(self, uid, request_type, data):
+        """
+        Called when a background query has completed.
+
+        :param uid: Unique id of the request
+        :param request_type: Type of the request
+        :param data: Dictionary with the results
+        """
+        uid = shotgun_model.sanitize_qt(uid)  # qstring on pyqt, str on pyside
+        data = shotgun_model.sanitize_qt(data)
+
+        if uid == self._count_request_id:
+            self._count_request_id = None
+            self.total_count = data["return_value"]
+            if self._pages_loaded > 1:
+                self.content_is_partial &= self.rowCount() < self.total_count
+            self._on_data_updated()
+
+        elif uid == self._delta_request_id:
+            self._delta_request_id = None
+            self._check_delta([_normalize_sg_data(sg_data) for sg_data in data["sg"]])
+
+        elif uid == self._id_check_request_id:
+            self._id_check_request_id = None
+            self._check_ids(data["sg"])
+
+        elif self._page_request and uid == self._page_request[0]:
+            page = self._page_request[1]
+            self._page_request = None
+
+            sg_records = [_normalize_sg_data(sg_data) for sg_data in data["sg"]]
+
+            get_entity_store().merge(self._sg_formatter.entity_type, sg_records)
+            _page_cache[(self._page_signature, page)] = sg_records
+            while len(_page_cache) > PAGE_CACHE_SIZE:
+                _page_cache.popitem(last=False)
+
+            self._append_page(page, sg_records)
+
+    def _on_worker_failure(self, uid, msg):
+        """
+        Called when a background query has failed.
+
+        :param uid: Unique id of the request
+        :param msg: Error message
+        """
+        uid = shotgun_model.sanitize_qt(uid)  # qstring on pyqt, str on pyside
+        msg = shotgun_model.sanitize_qt(msg)
+
+        if uid == self._count_request_id:
+            # not fatal, the count is only used for display
+            self._count_request_id = None
+            sgtk.platform.current_bundle().log_debug(
+                "Could not count %s records: %s" % (self._sg_formatter.entity_type, msg)
+            )
+
+        elif uid in (self._delta_request_id, self._id_check_request_id):
+            # fall back to refreshing everything
+            self._delta_request_id = None
+            self._id_check_request_id = None
+            sgtk.platform.current_bundle().log_debug(
+                "Could not refresh %s records incrementally: %s"
+                % (self._sg_formatter.entity_type, msg)
+            )
+            self._refresh_data()
+
+        elif self._page_request and uid == self._page_request[0]:
+            # the view will ask again when scrolled to the end of the list
+            self._page_request = None
+            sgtk.platform.current_bundle().log_warning(
+                "Could not load more %s records: %s"
+                % (self._sg_formatter.entity_type, msg)
+            )
+
+    def _clear_thumbnails(self):
+        """
+        Forgets about all thumbnails, typically because new data is being loaded.
+        """
+        # thumbnails still being composited belong to the previous data
+        self._thumbnail_compositor.clear()
+        get_thumbnail_budget().remove_model(self)
+        self._thumbnail_paths = {}
+        self._released_thumbnails = set()
+        self._thumbnail_queue = []
+        self._thumbnail_downloads = {}
+        self._requested_thumbnails = {}
+        self._thumbnail_timeout_timer.stop()
+
+    def _download_thumbnails(self):
+        """
+        Hands the thumbnails at the front of the queue over to the data
+        retriever, as long as there are download slots available.
+        """
+        now = time.time()
+        for entity_id, requested_at in list(self._thumbnail_downloads.items()):
+            if now - requested_at > self.THUMBNAIL_DOWNLOAD_TIMEOUT:
+                # failed downloads are never reported
+                del self._thumbnail_downloads[entity_id]
+
+        items = self._get_item_index()
+        while (
+            self._thumbnail_queue
+            and len(self._thumbnail_downloads) < self.MAX_THUMBNAIL_DOWNLOADS
+        ):
+            entity_id = self._thumbnail_queue.pop(0)
+            item = items.get(entity_id)
+            if item is None:
+                continue
+
+            sg_data = item.get_sg_data()
+            urls = dict(
+                (field, sg_data[field])
+                for field in self._sg_formatter.thumbnail_fields
+                if sg_data.get(field)
+            )
+            if self._requested_thumbnails.get(entity_id) == urls:
+                continue
+            self._requested_thumbnails[entity_id] = urls
+
+            for field, url in urls.items():
+                self._request_thumbnail_download(
+                    item, field, url, sg_data["type"], entity_id
+                )
+            if urls:
+                self._thumbnail_downloads[entity_id] = now
+
+        # check again once the oldest download in progress times out
+        if self._thumbnail_downloads:
+            oldest = min(self._thumbnail_downloads.values())
+            timeout = oldest + self.THUMBNAIL_DOWNLOAD_TIMEOUT - now
+            self._thumbnail_timeout_timer.start(int(max(timeout, 0) * 1000) + 100)
+        else:
+            self._thumbnail_timeout_timer.stop()
+
+    def _on_thumbnail_downloaded(self, item):
+        """
+        Frees the download slot of a thumbnail which has arrived
+        and starts downloading the next one in the queue.
+
+        :param item: QStandardItem the thumbnail belongs to
+        """
+        if self._thumbnail_downloads.pop(item.get_sg_data().get("id"), None):
+            self._download_thumbnails()
+
+    def _request_thumbnail(self, sg_data, image, path):
+        """
+        Schedules the thumbnail of an item to be composited in the background.
+
+        :param sg_data: Shotgun data of the item
+        :param image: QImage source image, or None to load it from the path
+        :param path: A path on disk to the thumbnail
+        """
+        entity_id = sg_data.get("id")
+        if path:
+            self._thumbnail_paths[entity_id] = path
+        self._released_thumbnails.discard(entity_id)
+
+        self._thumbnail_compositor.request(
+            entity_id,
+            self._sg_formatter.create_thumbnail,
+            image,
+            sg_data,
+            path,
+            self._get_thumbnail_size(),
+        )
 
     def _before_data_processing(self, data):
         """
@@ -220,22 +931,162 @@ class SgEntityListingModel(ShotgunModel):
         processing takes place.
         """
 
-        self.content_is_partial = len(data) > self.SG_RECORD_LIMIT
-        if self.content_is_partial:
+        if self._pages_loaded <= 1:
+            # once more pages have been loaded, this only refreshes the first one
+            self.content_is_partial = len(data) > self.SG_RECORD_LIMIT
+        if len(data) > self.SG_RECORD_LIMIT:
             data = data[:-1]
 
+        # this is the data the ShotgunModel caches on disk
+        updated_at = [_to_timestamp(sg_data.get("updated_at")) or 0 for sg_data in data]
+        self._refreshed_watermark = max(updated_at) if updated_at else None
+
         return data
 
     ############################################################################################
     # private methods
 
+    def _preformat_list_items(self):
+        """
+        Schedules a background task which renders the list item details for
+        all items currently in the model, so that the delegate doesn't need
+        to do any formatting work on the GUI thread when painting.
+        """
+        if self._preformat_task_id is not None:
+            # results from a previous load are no longer needed
+            self._task_manager.stop_task(self._preformat_task_id)
+            self._preformat_task_id = None
+
+        sg_data_list = [self.item(row).get_sg_data() for row in range(self.rowCount())]
+        if not sg_data_list:
+            return
+
+        self._preformat_task_id = self._task_manager.add_task(
+            get_list_item_cache().render_list_items,
+            task_args=[self._sg_formatter, sg_data_list],
+        )
+
+    def _on_task_completed(self, uid, group, result):
+        """
+        Called when a background task has completed.
+
+        :param uid: Unique id of the task
+        :param group: Group the task belongs to
+        :param result: The result returned by the task
+        """
+        if uid != self._preformat_task_id:
+            return
+        self._preformat_task_id = None
+
+        # store the rendered details on the items, keyed by entity id
+        for row in range(self.rowCount()):
+            item = self.item(row)
+            entry = result.get(item.get_sg_data().get("id"))
+            if entry:
+                item.setData(entry, self.LIST_ITEM_DETAILS_ROLE)
+
+    def _on_task_failed(self, uid, group, msg, stack_trace):
+        """
+        Called when a background task has failed.
+
+        :param uid: Unique id of the task
+        :param group: Group the task belongs to
+        :param msg: Error message
+        :param stack_trace: Stack trace for the error
+        """
+        if uid != self._preformat_task_id:
+            return
+        self._preformat_task_id = None
+
+        # not fatal, the delegate will format the items when painting them
+        sgtk.platform.current_bundle().log_debug(
+            "Could not preformat list items: %s\n%s" % (msg, stack_trace)
+        )
+
+    def _get_thumbnail_size(self):
+        """
+        Returns the size thumbnails should be composited at. Items only ever
+        display their thumbnail in a list item widget, so there is no need to
+        keep anything larger than that around.
+
+        :returns: (width, height) tuple
+        """
+        return utils.get_display_size(ListItemWidget.calculate_thumbnail_size())
+
+    def _on_thumbnails_composited(self, thumbnails):
+        """
+        Called with a batch of thumbnails composited in the background.
+
+        :param thumbnails: List of (entity id, QImage) tuples
+        """
+        items = self._get_item_index()
+        budget = get_thumbnail_budget()
+        for entity_id, image in thumbnails:
+            item = items.get(entity_id)
+            if not item:
+                continue
+            item.setIcon(QtGui.QIcon(QtGui.QPixmap.fromImage(image)))
+
+            # thumbnails which cannot be loaded again are never released
+            if entity_id in self._thumbnail_paths:
+                budget.add(self, entity_id, image.width() * image.height() * 4)
+
+    def _get_item(self, entity_id):
+        """
+        Returns the item for an entity.
+
+        :param entity_id: Shotgun entity id
+        :returns: QStandardItem or None if not found
+        """
+        return self._get_item_index().get(entity_id)
+
+    def _get_item_index(self):
+        """
+        Returns the items of the model by entity id.
+
+        :returns: Dictionary of entity id -> QStandardItem
+        """
+        if self._item_index is None:
+            self._item_index = {}
+            for row in range(self.rowCount()):
+                item = self.item(row)
+                # rows appended from further pages may duplicate
+                # first page rows until these have been removed
+                self._item_index.setdefault(item.get_sg_data().get("id"), item)
+        return self._item_index
+
+    def _clear_item_index(self, *args):
+        """
+        Drops the index of the items by entity id, typically
+        because rows have been added or removed.
+        """
+        self._item_index = None
+
     def _on_data_updated(self):
+        if (
+            self.content_is_partial
+            and self._page_query
+            and self.total_count is None
+            and self._count_request_id is None
+        ):
+            # the total is only needed when there are more pages to load
+            entity_type, filters, _, _ = self._page_query
+            self._count_request_id = self._data_retriever.execute_shared_method(
+                get_query_signature(entity_type, filters, []),
+                utils.get_record_count,
+                entity_type,
+                filters,
+            )
+
         if not self.label_nb_items_status:
             return
 
         self.label_nb_items_status.setVisible(self.rowCount() > 0)
 
-        if self.content_is_partial:
+        if self.content_is_partial and self._page_query and self.total_count:
+            text = self.TEXT_NUM_ITEMS_PAGED
+            tooltip = self.TEXT_NUM_ITEMS_TT_PAGED
+        elif self.content_is_partial:
             text = self.TEXT_NUM_ITEMS_PARTIAL
             tooltip = self.TEXT_NUM_ITEMS_TT_PARTIAL_FIRST
             if self.TEXT_NUM_ITEMS_TT_PARTIAL_MIDDLE:
@@ -250,6 +1101,7 @@ class SgEntityListingModel(ShotgunModel):
             text.format(
                 num=self.rowCount(),
                 max_num=self.SG_RECORD_LIMIT,
+                total=self.total_count,
                 entity_type=self._sg_formatter.entity_type.lower(),
             )
         )
@@ -261,3 +1113,27 @@ class SgEntityListingModel(ShotgunModel):
                 entity_type=self._sg_formatter.entity_type.lower(),
             )
         )
+
+
+def _normalize_sg_data(sg_data):
+    """
+    Converts datetimes in a Shotgun record to unix timestamps,
+    the same way the ShotgunModel stores its data.
+
+    :param sg_data: Shotgun record, as returned by find()
+    :returns: Shotgun record
+    """
+    return dict((field, _to_timestamp(value)) for field, value in sg_data.items())
+
+
+def _to_timestamp(value):
+    """
+    Converts a datetime to a unix timestamp, the same way the
+    ShotgunModel stores its data. Other values are returned as is.
+
+    :param value: Value of a Shotgun field
+    :returns: Unix timestamp, or the value itself
+    """
+    if isinstance(value, datetime.datetime):
+        return int(time.mktime(value.timetuple()))
+    return value
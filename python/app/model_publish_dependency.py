@@ -0,0 +1,183 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import sgtk
+
+from .model_entity_listing import SgEntityListingModel
+from .dependency_graph import get_dependency_graph, fetch_dependency_edges
+from .freshness import get_fresh_since
+
+shotgun_model = sgtk.platform.import_framework(
+    "tk-framework-shotgunutils", "shotgun_model"
+)
+
+
+class SgPublishDependencyListingModel(SgEntityListingModel):
+    """
+    Base class for the models listing the dependencies of a publish.
+
+    Dependencies are listed several levels deep, as configured by the
+    ``dependency_depth`` setting. The dependencies themselves are looked up
+    in the shared :class:`~dependency_graph.PublishDependencyGraph`. When
+    the graph doesn't hold all levels yet, or holds levels fetched before
+    the freshness window of the tab, the levels known so far (or the direct
+    dependencies) are listed while the graph is walked in the background,
+    in both directions at once, so the other dependency tab can be loaded
+    straight away.
+    """
+
+    # field holding the publishes which link to the current publish,
+    # used to list direct dependencies
+    LINK_FIELD = None
+
+    # field of the current publish holding the same direct dependencies,
+    # followed to list further levels
+    DEPENDENCY_FIELD = None
+
+    def __init__(self, entity_type, parent, bg_task_manager):
+        """
+        Constructor.
+
+        :param entity_type: The entity type that should be loaded into this model.
+        :param parent: QT parent object
+        :param bg_task_manager: task manager used to process data
+        """
+        self._filters = None
+        self._graph_request_id = None
+
+        # init base class
+        SgEntityListingModel.__init__(self, entity_type, parent, bg_task_manager)
+
+        self._max_depth = max(
+            sgtk.platform.current_bundle().get_setting("dependency_depth"), 1
+        )
+
+    def load_data(self, sg_location, filters=None):
+        """
+        Clears the model and sets it up for a particular entity.
+        Loads any cached data that exists and schedules an async refresh.
+
+        :param sg_location: Location object representing the *associated*
+               object for which items should be loaded. NOTE! If the model is
+               configured to display tasks, this sg_location could for example
+               point to a Shot for which we want to display tasks.
+        """
+        self._filters = filters or []
+        self._graph_request_id = None
+
+        self._load_dependencies(sg_location)
+
+        fresh_since = get_fresh_since(self.freshness_key)
+        _, complete = self._get_dependencies(sg_location, fresh_since)
+        if not complete:
+            # stale levels are fetched again, dependencies may have been
+            # added or removed since
+            self._graph_request_id = self._data_retriever.execute_method(
+                fetch_dependency_edges,
+                sg_location.entity_type,
+                sg_location.entity_id,
+                self._max_depth,
+                get_dependency_graph().get_edges(sg_location.entity_type, fresh_since),
+            )
+
+    def cancel_pending_work(self):
+        """
+        Cancels all background work for the data currently loaded,
+        including the walk of the dependency graph.
+        """
+        self._graph_request_id = None
+
+        SgEntityListingModel.cancel_pending_work(self)
+
+    def get_location_filters(self, sg_location):
+        """
+        Returns the filters linking the items of this model to a location.
+
+        :param sg_location: Location object representing the publish
+            to list the dependencies of.
+        :returns: List of Shotgun filters
+        """
+        dependency_ids, _ = self._get_dependencies(sg_location)
+        if dependency_ids:
+            return [["id", "in", dependency_ids]]
+
+        return [[self.LINK_FIELD, "in", [sg_location.entity_dict]]]
+
+    ############################################################################################
+    # protected methods
+
+    def _get_dependencies(self, sg_location, fresh_since=None):
+        """
+        Returns the dependencies of a publish known by the dependency graph.
+
+        :param sg_location: Location object representing the publish
+        :param fresh_since: If set, levels fetched at or before this
+            unix timestamp are not considered known.
+        :returns: Tuple with the list of dependency ids and whether
+            all levels are known.
+        """
+        return get_dependency_graph().get_dependencies(
+            sg_location.entity_type,
+            sg_location.entity_id,
+            self.DEPENDENCY_FIELD,
+            self._max_depth,
+            fresh_since,
+        )
+
+    def _load_dependencies(self, sg_location):
+        """
+        Loads the dependencies currently known for a publish.
+
+        :param sg_location: Location object representing the publish
+        """
+        # for publishes, sort them by id (e.g. creation date) rather than
+        # by update date.
+        SgEntityListingModel.load_data(
+            self, sg_location, sort_field="id", filters=self._filters
+        )
+
+    def _on_worker_completed(self, uid, request_type, data):
+        """
+        Called when a background query has completed.
+
+        :param uid: Unique id of the request
+        :param request_type: Type of the request
+        :param data: Dictionary with the results
+        """
+        if shotgun_model.sanitize_qt(uid) != self._graph_request_id:
+            SgEntityListingModel._on_worker_completed(self, uid, request_type, data)
+            return
+
+        self._graph_request_id = None
+        edges = shotgun_model.sanitize_qt(data)["return_value"]
+        get_dependency_graph().update(self._sg_location.entity_type, edges)
+
+        dependency_ids, _ = self._get_dependencies(self._sg_location)
+        if set(dependency_ids) != set(self.entity_ids):
+            # further levels have been found
+            self._load_dependencies(self._sg_location)
+
+    def _on_worker_failure(self, uid, msg):
+        """
+        Called when a background query has failed.
+
+        :param uid: Unique id of the request
+        :param msg: Error message
+        """
+        if shotgun_model.sanitize_qt(uid) != self._graph_request_id:
+            SgEntityListingModel._on_worker_failure(self, uid, msg)
+            return
+
+        # not fatal, the direct dependencies are listed anyway
+        self._graph_request_id = None
+        sgtk.platform.current_bundle().log_warning(
+            "Could not retrieve the dependencies of %s: %s"
+            % (self._sg_location.entity_dict, shotgun_model.sanitize_qt(msg))
+        )
@@ -8,39 +8,18 @@
 # agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
 # not expressly granted therein are reserved by Shotgun Software Inc.
 
-from sgtk.platform.qt import QtCore, QtGui
-import sgtk
+from .model_publish_dependency import SgPublishDependencyListingModel
 
-from .model_entity_listing import SgEntityListingModel
 
-
-class SgPublishDependencyUpstreamListingModel(SgEntityListingModel):
+class SgPublishDependencyUpstreamListingModel(SgPublishDependencyListingModel):
     """
     Model which is like the entity listing model
     but tailored for displaying upstream dependencies for a given publish
     """
 
-    # note: no constructor implemented - use base class version
-
-    def load_data(self, sg_location, filters=None):
-        """
-        Clears the model and sets it up for a particular entity.
-        Loads any cached data that exists and schedules an async refresh.
+    # the publishes listing the current publish in their upstream_published_files
+    # are the ones the current publish lists in its downstream_published_files
+    LINK_FIELD = "upstream_published_files"
+    DEPENDENCY_FIELD = "downstream_published_files"
 
-        :param sg_location: Location object representing the *associated*
-               object for which items should be loaded. NOTE! If the model is
-               configured to display tasks, this sg_location could for example
-               point to a Shot for which we want to display tasks.
-        """
-        filters = filters or []
-        # for publishes, sort them by id (e.g. creation date) rather than
-        # by update date.
-        SgEntityListingModel.load_data(
-            self, sg_location, sort_field="id", filters=filters
-        )
-
-    def _get_filters(self):
-        """
-        Return the filter to be used for the current query
-        """
-        return [["upstream_published_files", "in", [self._sg_location.entity_dict]]]
+    # note: no constructor implemented - use base class version
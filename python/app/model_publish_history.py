@@ -16,13 +16,21 @@ from sgtk import TankError
 shotgun_model = sgtk.platform.import_framework(
     "tk-framework-shotgunutils", "shotgun_model"
 )
-shotgun_data = sgtk.platform.import_framework(
-    "tk-framework-shotgunutils", "shotgun_data"
-)
 
 ShotgunModel = shotgun_model.ShotgunModel
 
 from .model_entity_listing import SgEntityListingModel
+from .query_signature import (
+    canonical_fields,
+    canonical_filters,
+    get_query_signature,
+)
+from .query_coalescer import CoalescingDataRetriever
+from .publish_lookup import (
+    get_publish_lookup,
+    get_publish_type_field,
+    get_history_fields,
+)
 
 
 class SgPublishHistoryListingModel(SgEntityListingModel):
@@ -34,6 +42,11 @@ class SgPublishHistoryListingModel(SgEntityListingModel):
     version number, type, task etc. Once we have those fields,
     the shotgun model is updated to retrieve all associated
     publishes.
+
+    The first pass is skipped if the publish has already been loaded
+    by another model, see :class:`~publish_lookup.PublishLookup`. If
+    that model also holds the full history, it is displayed right away
+    while being refreshed in the background.
     """
 
     def __init__(self, entity_type, parent, bg_task_manager):
@@ -58,18 +71,21 @@ class SgPublishHistoryListingModel(SgEntityListingModel):
         # overlay for reporting errors
         self._overlay = None
 
+        # set while rows listed from memory wait to be replaced by refreshed data
+        self._replace_known_rows = False
+
         # init base class
         SgEntityListingModel.__init__(self, entity_type, parent, bg_task_manager)
 
         self._app = sgtk.platform.current_bundle()
 
-        self.__sg_data_retriever = shotgun_data.ShotgunDataRetriever(
-            self, bg_task_manager=bg_task_manager
-        )
+        self.__sg_data_retriever = CoalescingDataRetriever(self, bg_task_manager)
         self.__sg_data_retriever.start()
         self.__sg_data_retriever.work_completed.connect(self.__on_worker_signal)
         self.__sg_data_retriever.work_failure.connect(self.__on_worker_failure)
 
+        self.data_refreshed.connect(self._on_history_refreshed)
+
     def set_overlay(self, overlay):
         """
         Specify a overlay object for progress reporting
@@ -115,44 +131,7 @@ class SgPublishHistoryListingModel(SgEntityListingModel):
             error_msg = None
 
             if num_records == 1:
-                sg_data = sg_records[0]
-
-                # figure out which publish type we are after
-                if self._sg_formatter.entity_type == "PublishedFile":
-                    publish_type_field = "published_file_type"
-                else:
-                    publish_type_field = "tank_type"
-
-                # when we filter out which other publishes are associated with this one,
-                # to effectively get the "version history", we look for items
-                # which have the same project, same entity assocation, same name, same type
-                # and the same task.
-                filters = [
-                    ["project", "is", sg_data["project"]],
-                    ["name", "is", sg_data["name"]],
-                    ["task", "is", sg_data["task"]],
-                    ["entity", "is", sg_data["entity"]],
-                    [publish_type_field, "is", sg_data[publish_type_field]],
-                ]
-
-                # the proxy model that is sorting this model will
-                # sort based on id (pk), meaning that more recently
-                # commited transactions will appear later in the list.
-                # This ensures that publishes with no version number defined
-                # (yes, these exist) are also sorted correctly.
-                hierarchy = ["created_at"]
-
-                self._current_version = sg_data["version_number"]
-
-                ShotgunModel._load_data(
-                    self,
-                    self._sg_formatter.entity_type,
-                    filters,
-                    hierarchy,
-                    self._sg_formatter.fields,
-                )
-
-                self._refresh_data()
+                self._load_history(sg_records[0])
 
             elif num_records < 1:
                 error_msg = "Publish could not be found!"
@@ -179,31 +158,116 @@ class SgPublishHistoryListingModel(SgEntityListingModel):
         """
         self._sg_location = sg_location
         self._current_version = None
+        self._sg_query_id = None
+        self._replace_known_rows = False
+        self._work_cancelled = False
         self.__sg_data_retriever.clear()
+        self._clear_thumbnails()
 
-        # figure out which publish type we are after
-        if self._sg_formatter.entity_type == "PublishedFile":
-            publish_type_field = "published_file_type"
-        else:
-            publish_type_field = "tank_type"
+        entity_type = self._sg_formatter.entity_type
+        if not filters:
+            sg_data = get_publish_lookup().get_publish(
+                entity_type, sg_location.entity_id
+            )
+            if sg_data:
+                self._load_history(sg_data)
+                return
 
         combined_filters = [["id", "is", sg_location.entity_id]]
         combined_filters.extend(filters or [])
 
-        fields = [
-            "name",
-            "version_number",
-            "task",
-            "entity",
-            "project",
-            publish_type_field,
-        ]
+        fields = get_history_fields(entity_type)
 
         # get publish details async
         self._sg_query_id = self.__sg_data_retriever.execute_find(
-            self._sg_formatter.entity_type, combined_filters, fields
+            self._sg_formatter.entity_type,
+            canonical_filters(combined_filters),
+            canonical_fields(fields),
         )
 
+    def _load_history(self, sg_data):
+        """
+        Loads all publishes associated with a publish.
+
+        :param sg_data: Shotgun data for the publish, including
+            the fields required to find its history.
+        """
+        entity_type = self._sg_formatter.entity_type
+        publish_type_field = get_publish_type_field(entity_type)
+
+        # when we filter out which other publishes are associated with this one,
+        # to effectively get the "version history", we look for items
+        # which have the same project, same entity assocation, same name, same type
+        # and the same task.
+        filters = [
+            ["project", "is", sg_data["project"]],
+            ["name", "is", sg_data["name"]],
+            ["task", "is", sg_data["task"]],
+            ["entity", "is", sg_data["entity"]],
+            [publish_type_field, "is", sg_data[publish_type_field]],
+        ]
+
+        # the proxy model that is sorting this model will
+        # sort based on id (pk), meaning that more recently
+        # commited transactions will appear later in the list.
+        # This ensures that publishes with no version number defined
+        # (yes, these exist) are also sorted correctly.
+        hierarchy = ["created_at"]
+
+        self._current_version = sg_data.get("version_number")
+
+        filters = canonical_filters(filters)
+        fields = canonical_fields(self._sg_formatter.fields)
+        ShotgunModel._load_data(self, entity_type, filters, hierarchy, fields)
+
+        history = get_publish_lookup().get_history(entity_type, sg_data)
+        if history:
+            # display what is known, the rows are replaced by the refreshed data
+            self._append_page(1, history)
+
+        self._refresh_if_stale(get_query_signature(entity_type, filters, fields))
+        # the rows listed from memory are only replaced by data actually
+        # refreshed from Shotgun, not by data which is still fresh
+        self._replace_known_rows = self._refresh_pending
+
+    def _on_history_refreshed(self):
+        """
+        Called when the data has been refreshed. Rows listed from memory
+        are replaced by the refreshed history, so that publishes which
+        have been deleted or retired since are not listed anymore.
+        """
+        if not self._replace_known_rows:
+            return
+        self._replace_known_rows = False
+
+        for row in reversed(range(self.rowCount())):
+            if self.item(row).data(self.APPENDED_ITEM_ROLE):
+                # the history isn't paged, all appended rows come from memory
+                self.removeRow(row)
+
+    def cancel_pending_work(self):
+        """
+        Cancels all background work for the data currently loaded,
+        including the query for the publish itself.
+        """
+        self._sg_query_id = None
+        self._replace_known_rows = False
+        self.__sg_data_retriever.clear()
+
+        SgEntityListingModel.cancel_pending_work(self)
+
+    def get_location_filters(self, sg_location):
+        """
+        Returns the filters linking the items of this model to a location.
+
+        The history is retrieved in two passes, so there is no single
+        query for it.
+
+        :param sg_location: Location object representing the publish
+        :returns: None
+        """
+        return None
+
     def is_highlighted(self, model_index):
         """
         Compute if a model index belonging to this model
@@ -12,6 +12,17 @@ from sgtk.platform.qt import QtCore, QtGui
 import sgtk
 
 from .model_entity_listing import SgEntityListingModel
+from .publish_lookup import (
+    filters_cover_histories,
+    get_publish_lookup,
+    get_publish_type_field,
+)
+
+shotgun_model = sgtk.platform.import_framework(
+    "tk-framework-shotgunutils", "shotgun_model"
+)
+filtering = sgtk.platform.import_framework("tk-framework-qtwidgets", "filtering")
+FilterItemProxyModel = filtering.FilterItemProxyModel
 
 
 class SgLatestPublishListingModel(SgEntityListingModel):
@@ -19,8 +30,28 @@ class SgLatestPublishListingModel(SgEntityListingModel):
     Model which fetches publish objects with the option to collapse
     the list of returned data so that only the latest version of each
     publish is shown.
+
+    By default, the model always holds all publishes and flags the latest
+    publish of each group. Showing latest publishes only is then a matter of
+    filtering, see :class:`LatestPublishProxyModel`, and doesn't require
+    any new query.
+
+    If the ``latest_publishes_server_side`` setting is enabled, the latest
+    publishes are instead determined by a grouped summary query, and only
+    those are loaded. This returns a lot less data for entities with long
+    publish histories, but toggling between both modes reloads the data.
+
+    :signal show_latest_only_changed(): Emitted when the model switches between
+        showing all publishes and latest publishes only.
     """
 
+    # role holding whether an item is the latest publish of its group
+    LATEST_PUBLISH_ROLE = QtCore.Qt.UserRole + 222
+
+    TEXT_NUM_ITEMS_LATEST = "Showing {num} latest {entity_type}s"
+
+    show_latest_only_changed = QtCore.Signal()
+
     def __init__(self, entity_type, parent, bg_task_manager):
         """
         Constructor.
@@ -33,9 +64,35 @@ class SgLatestPublishListingModel(SgEntityListingModel):
         self._show_latest_only = False
         self._publish_type_field = None
 
+        # ids of the latest publish of each group
+        self._latest_publish_ids = set()
+
+        # arguments of the last load, used to reload the data when
+        # the latest publishes are determined server side.
+        self._filters = None
+        self._latest_ids_request_id = None
+
         # init base class
         SgEntityListingModel.__init__(self, entity_type, parent, bg_task_manager)
 
+        self._server_side_grouping = sgtk.platform.current_bundle().get_setting(
+            "latest_publishes_server_side"
+        )
+
+        self.cache_loaded.connect(self._update_latest_publishes)
+        self.data_refreshed.connect(self._update_latest_publishes)
+        self.page_loaded.connect(self._update_latest_publishes)
+
+    ############################################################################################
+    # public interface
+
+    @property
+    def show_latest_only(self):
+        """
+        True if only the latest publish of each group should be shown.
+        """
+        return self._show_latest_only
+
     def load_data(self, sg_location, show_latest_only, filters=None):
         """
         Clears the model and sets it up for a particular entity.
@@ -48,92 +105,299 @@ class SgLatestPublishListingModel(SgEntityListingModel):
         """
         filters = filters or []
         # figure out our current entity type
-        if self._sg_formatter.entity_type == "PublishedFile":
-            self._publish_type_field = "published_file_type"
+        self._publish_type_field = get_publish_type_field(
+            self._sg_formatter.entity_type
+        )
+
+        self._sg_location = sg_location
+        self._filters = filters
+        self._latest_publish_ids = set()
+        self._latest_ids_request_id = None
+        self._set_show_latest_only(show_latest_only)
+
+        if self._show_latest_only and self._server_side_grouping:
+            # first pass, figure out which publishes are the latest ones
+            try:
+                combined_filters = self._get_filters() + filters
+            except sgtk.TankError as exc:
+                self.data_refresh_fail.emit(exc.message)
+                return
+
+            self._clear_pages()
+            self._latest_ids_request_id = self._data_retriever.execute_method(
+                _get_latest_publish_ids,
+                self._sg_formatter.entity_type,
+                combined_filters,
+                self._publish_type_field,
+            )
+            return
+
+        self._load_publishes(filters)
+
+    def set_show_latest_only(self, show_latest_only):
+        """
+        Switches between showing all publishes and latest publishes only.
+
+        :param show_latest_only: If true, only latest items are shown.
+        """
+        if show_latest_only == self._show_latest_only:
+            return
+
+        if self._server_side_grouping and self._sg_location:
+            # the data loaded depends on the mode
+            self.load_data(self._sg_location, show_latest_only, self._filters)
         else:
-            self._publish_type_field = "tank_type"
+            # all publishes are loaded, so this is only a matter of filtering
+            self._set_show_latest_only(show_latest_only)
+            self._on_data_updated()
+
+    def cancel_pending_work(self):
+        """
+        Cancels all background work for the data currently loaded,
+        including the query for the latest publishes.
+        """
+        self._latest_ids_request_id = None
 
-        self._show_latest_only = show_latest_only
+        SgEntityListingModel.cancel_pending_work(self)
 
+    ############################################################################################
+    # protected methods
+
+    def _load_publishes(self, filters):
+        """
+        Loads the publishes.
+
+        :param filters: Additional filters
+        """
         SgEntityListingModel.load_data(
             self,
-            sg_location,
-            additional_fields=["version", "task", self._publish_type_field],
+            self._sg_location,
+            # entity and project are needed to look up the publish histories
+            additional_fields=[
+                "version",
+                "task",
+                "entity",
+                "project",
+                self._publish_type_field,
+            ],
             sort_field="created_at",
             filters=filters,
         )
 
-    def _before_data_processing(self, sg_data_list):
+    def _set_show_latest_only(self, show_latest_only):
+        """
+        Sets whether only latest publishes should be shown.
+
+        :param show_latest_only: If true, only latest items are shown.
+        """
+        if show_latest_only != self._show_latest_only:
+            self._show_latest_only = show_latest_only
+            self.show_latest_only_changed.emit()
+
+    def _on_worker_completed(self, uid, request_type, data):
+        """
+        Called when a background query has completed.
+
+        :param uid: Unique id of the request
+        :param request_type: Type of the request
+        :param data: Dictionary with the results
+        """
+        if shotgun_model.sanitize_qt(uid) != self._latest_ids_request_id:
+            SgEntityListingModel._on_worker_completed(self, uid, request_type, data)
+            return
+
+        self._latest_ids_request_id = None
+        latest_ids = shotgun_model.sanitize_qt(data)["return_value"]
+
+        # second pass, load the latest publishes only
+        self._load_publishes(self._filters + [["id", "in", latest_ids]])
+
+    def _on_worker_failure(self, uid, msg):
+        """
+        Called when a background query has failed.
+
+        :param uid: Unique id of the request
+        :param msg: Error message
+        """
+        if shotgun_model.sanitize_qt(uid) != self._latest_ids_request_id:
+            SgEntityListingModel._on_worker_failure(self, uid, msg)
+            return
+
+        self._latest_ids_request_id = None
+        self.data_refresh_fail.emit(shotgun_model.sanitize_qt(msg))
+
+    def _update_latest_publishes(self):
+        """
+        Flags the latest publish of each group, so that showing latest
+        publishes only can be done from memory.
+        """
+        # for example, if there are these publishes:
+        # name FOO, version 1, task ANIM, type XXX
+        # name FOO, version 2, task ANIM, type XXX
+        # name FOO, version 3, task ANIM, type XXX
+        # name FOO, version 1, task ANIM, type YYY
+        # name FOO, version 2, task ANIM, type YYY
+        # name FOO, version 5, task LAY,  type YYY
+        # name FOO, version 6, task LAY,  type YYY
+        # name FOO, version 7, task LAY,  type YYY
+        #
+        # three items are flagged as latest:
+        # - Foo v3 (type XXX)
+        # - Foo v2 (type YYY, task ANIM)
+        # - Foo v7 (type YYY, task LAY)
+        #
+        # the latest publish is the most recently created one.
+        latest_publishes = {}
+
+        items = [self.item(row) for row in range(self.rowCount())]
+        for item in items:
+            sg_item = item.get_sg_data()
+            unique_key = self._get_publish_group(sg_item)
+
+            latest = latest_publishes.get(unique_key)
+            if latest is None or _get_publish_age(sg_item) > _get_publish_age(latest):
+                latest_publishes[unique_key] = sg_item
+
+        self._latest_publish_ids = set(
+            sg_item["id"] for sg_item in latest_publishes.values()
+        )
+
+        for item in items:
+            is_latest = item.get_sg_data()["id"] in self._latest_publish_ids
+            # only touch items which change, as each change is re-filtered
+            if item.data(self.LATEST_PUBLISH_ROLE) != is_latest:
+                item.setData(is_latest, self.LATEST_PUBLISH_ROLE)
+
+        # without any filtering nor culling, and for locations linking whole
+        # histories, e.g. entities or tasks rather than users, the model holds
+        # the full history of each publish, which the history tab can display
+        # as is.
+        entity_type = self._sg_formatter.entity_type
+        get_publish_lookup().register(
+            entity_type,
+            [item.get_sg_data() for item in items],
+            complete=not (
+                self.content_is_partial
+                or self._filters
+                or (self._show_latest_only and self._server_side_grouping)
+                or not filters_cover_histories(entity_type, self._get_filters())
+            ),
+        )
+
+        self._on_data_updated()
+
+    def _get_publish_group(self, sg_item):
+        """
+        Returns the key of the group a publish belongs to. Publishes
+        with the same name, type and task belong to the same group.
+
+        :param sg_item: Shotgun data for a publish
+        :returns: Hashable key
         """
-        Called just after data has been retrieved from Shotgun but before any processing
-        takes place. This makes it possible for deriving classes to perform summaries,
-        calculations and other manipulations of the data before it is passed on to the model
-        class.
+        type_id = None
+        type_link = sg_item.get(self._publish_type_field)
+        if type_link:
+            type_id = type_link["id"]
+
+        task_id = None
+        task_link = sg_item.get("task")
+        if task_link:
+            task_id = task_link["id"]
+
+        return (sg_item.get("name"), type_id, task_id)
 
-        :param sg_data_list: list of shotgun dictionaries, as returned by the find() call.
-        :returns: should return a list of shotgun dictionaries, on the same form as the input.
+    def _on_data_updated(self):
         """
-        if not self._show_latest_only:
-            # show everything
-            new_sg_data_list = sg_data_list
+        Updates the label showing the number of items.
+        """
+        SgEntityListingModel._on_data_updated(self)
+
+        if self.label_nb_items_status and self._show_latest_only:
+            self.label_nb_items_status.setText(
+                self.TEXT_NUM_ITEMS_LATEST.format(
+                    num=len(self._latest_publish_ids),
+                    entity_type=self._sg_formatter.entity_type.lower(),
+                )
+            )
+
+
+class LatestPublishProxyModel(FilterItemProxyModel):
+    """
+    Proxy model which hides all but the latest publishes of a
+    :class:`SgLatestPublishListingModel` when that model is set up
+    to show latest publishes only.
+    """
+
+    def setSourceModel(self, model):
+        """
+        Sets the source model.
+
+        :param model: :class:`SgLatestPublishListingModel`
+        """
+        FilterItemProxyModel.setSourceModel(self, model)
+        model.show_latest_only_changed.connect(self.invalidateFilter)
+
+    def filterAcceptsRow(self, src_row, src_parent_idx):
+        """
+        Override base class method to also filter out publishes which
+        are not the latest ones.
+
+        :param src_row: Row of the item in the source model
+        :param src_parent_idx: Parent index in the source model
+        :returns: True if the row should be displayed
+        """
+        if not FilterItemProxyModel.filterAcceptsRow(self, src_row, src_parent_idx):
+            return False
+
+        model = self.sourceModel()
+        if not model.show_latest_only:
+            return True
+
+        src_idx = model.index(src_row, 0, src_parent_idx)
+        return bool(src_idx.data(model.LATEST_PUBLISH_ROLE))
+
+
+def _get_publish_age(sg_item):
+    """
+    Returns a value ordering publishes from the oldest to the most recent.
+
+    :param sg_item: Shotgun data for a publish
+    :returns: Sortable tuple
+    """
+    return (sg_item.get("created_at") or 0, sg_item["id"])
+
+
+def _get_latest_publish_ids(sg, entity_type, filters, publish_type_field):
+    """
+    Returns the ids of the latest publish of each publish group, using
+    a grouped summary query. Meant to be executed in a background thread
+    via the ShotgunDataRetriever.execute_method() method.
+
+    Ids increase as publishes are created, so the highest id of each
+    group is its most recently created publish.
+
+    :param sg: Shotgun API instance
+    :param entity_type: Publish entity type
+    :param filters: List of Shotgun filters
+    :param publish_type_field: Field holding the publish type
+    :returns: List of publish ids
+    """
+    grouping = [
+        {"field": field, "type": "exact", "direction": "asc"}
+        for field in ["name", publish_type_field, "task"]
+    ]
+    result = sg.summarize(
+        entity_type, filters, [{"field": "id", "type": "maximum"}], grouping=grouping
+    )
 
+    latest_ids = []
+    groups = result.get("groups") or []
+    while groups:
+        group = groups.pop()
+        if group.get("groups"):
+            # nested grouping
+            groups.extend(group["groups"])
         else:
+            latest_ids.append(group["summaries"]["id"])
 
-            # filter the shotgun data so that we only return the latest publish for each file.
-
-            # FIRST PASS!
-            # get a dict with only the latest versions, grouped by type and task
-            # rely on the fact that versions are returned in desc order from sg.
-            # (this is defined in SgEntityListingModel)
-            #
-            # for example, if there are these publishes:
-            # name FOO, version 1, task ANIM, type XXX
-            # name FOO, version 2, task ANIM, type XXX
-            # name FOO, version 3, task ANIM, type XXX
-            # name FOO, version 1, task ANIM, type YYY
-            # name FOO, version 2, task ANIM, type YYY
-            # name FOO, version 5, task LAY,  type YYY
-            # name FOO, version 6, task LAY,  type YYY
-            # name FOO, version 7, task LAY,  type YYY
-            #
-            # three items should show up:
-            # - Foo v3 (type XXX)
-            # - Foo v2 (type YYY, task ANIM)
-            # - Foo v7 (type YYY, task LAY)
-
-            unique_data = {}
-
-            # the data is passed from sg in desc order, with the highest version
-            # first.
-            for sg_item in sg_data_list:
-
-                # get the associated type
-                type_id = None
-                type_link = sg_item[self._publish_type_field]
-                if type_link:
-                    type_id = type_link["id"]
-
-                # also get the associated task
-                task_id = None
-                task_link = sg_item["task"]
-                if task_link:
-                    task_id = task_link["id"]
-
-                # get a unique key to track this publish group
-                unique_key = (sg_item["name"], type_id, task_id)
-
-                # add records only if a record doesn't already exist
-                # the data arrives in desc order, so we know that
-                # if a record already exists, it must have a higher
-                # version than the current one. So skip current one.
-                if unique_key not in unique_data:
-                    unique_data[unique_key] = sg_item
-
-            # Make sure we get a list because the model is going to filter
-            # this list of entries in place and Python3's .values returns
-            # an iterator.
-            new_sg_data_list = list(unique_data.values())
-
-        # now return this culled data set as our new set of shotgun data, now only
-        # including the latest publishes
-        return SgEntityListingModel._before_data_processing(self, new_sg_data_list)
+    return sorted(latest_ids)
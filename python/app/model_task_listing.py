@@ -10,9 +10,9 @@
 
 from sgtk.platform.qt import QtCore, QtGui
 import sgtk
-from . import utils
 
 from .model_entity_listing import SgEntityListingModel
+from .query_signature import canonical_filters
 
 # import the shotgun_model module from the shotgun utils framework
 shotgun_model = sgtk.platform.import_framework(
@@ -50,9 +50,15 @@ class SgTaskListingModel(SgEntityListingModel):
                             Needs to be a PublishedFile or TankPublishedFile.
         :param parent: QT parent object
         """
+        # assignee user id -> task items, rebuilt whenever data is loaded
+        self._assignee_items = {}
+        # assignee user id -> composited thumbnail, shared by all their tasks
+        self._assignee_icons = {}
+
         # init base class
         SgEntityListingModel.__init__(self, entity_type, parent, bg_task_manager)
         self.data_refreshed.connect(self._on_data_refreshed)
+        self.page_loaded.connect(self._on_data_refreshed)
 
         # have a model to pull down user's thumbnails for task assingments
         self._task_assignee_model = TaskAssigneeModel(self, bg_task_manager)
@@ -78,35 +84,78 @@ class SgTaskListingModel(SgEntityListingModel):
         so that a data_updated signal is consistently sent
         out both after the data has been updated and after a cache has been read in
         """
+        self._assignee_items = {}
+
         if self._sg_location.entity_type not in ["HumanUser", "Project"]:
             # show square thumbs for users and project (my tasks)
             # for other types, fetch user thumbnails
-            rows = self.rowCount()
+            for x in range(self.rowCount()):
+                item = self.item(x)
+                for user in item.get_sg_data()["task_assignees"]:
+                    # groups can be assigned too, but don't have thumbnails
+                    if user.get("type") == "HumanUser":
+                        self._assignee_items.setdefault(user["id"], []).append(item)
 
-            # get the task assignees
-            assignees = []
-            for x in range(rows):
-                data = self.item(x).get_sg_data()
-                assignees.extend(data["task_assignees"])
-            user_ids = [x["id"] for x in assignees]
+            # users seen before already have their thumbnail
+            self._apply_assignee_icons(self._assignee_icons)
 
-            self.request_user_thumbnails.emit(user_ids)
+            user_ids = sorted(set(self._assignee_items) - set(self._assignee_icons))
+            if user_ids:
+                self.request_user_thumbnails.emit(user_ids)
 
     def _on_user_thumb(self, sg_data, image):
         """
         When a user thumb arrives from the
         user thumbnail retriever
         """
-        rows = self.rowCount()
+        # user thumbnails are keyed separately from the task rows
+        self._thumbnail_compositor.request(
+            (sg_data["type"], sg_data["id"]),
+            self._sg_formatter.create_thumbnail,
+            image,
+            sg_data,
+            None,
+            self._get_thumbnail_size(),
+        )
+
+    def _on_thumbnails_composited(self, thumbnails):
+        """
+        Called with a batch of thumbnails composited in the background.
+
+        :param thumbnails: List of (key, QImage) tuples, where the key is either
+            a task id or a (type, id) tuple for task assignee thumbnails.
+        """
+        task_thumbnails = []
+        user_icons = {}
+        for key, image in thumbnails:
+            if isinstance(key, tuple):
+                user_icons[key[1]] = QtGui.QIcon(QtGui.QPixmap.fromImage(image))
+            else:
+                task_thumbnails.append((key, image))
+
+        self._assignee_icons.update(user_icons)
+        self._apply_assignee_icons(user_icons)
+
+        SgEntityListingModel._on_thumbnails_composited(self, task_thumbnails)
+
+    def _apply_assignee_icons(self, user_icons):
+        """
+        Assigns user thumbnails to the tasks assigned to these users.
 
-        for x in range(rows):
-            item = self.item(x)
-            data = item.get_sg_data()
-            user_ids = [x["id"] for x in data["task_assignees"]]
-            if sg_data["id"] in user_ids:
+        :param user_icons: Dictionary of user id -> QIcon
+        """
+        for user_id, icon in user_icons.items():
+            for item in self._assignee_items.get(user_id, []):
                 # this thumbnail should be assigned
-                icon = self._sg_formatter.create_thumbnail(image, sg_data)
-                item.setIcon(QtGui.QIcon(icon))
+                item.setIcon(icon)
+
+    def _clear_thumbnails(self):
+        """
+        Forgets about all thumbnails, typically because new data is being loaded.
+        """
+        SgEntityListingModel._clear_thumbnails(self)
+        self._assignee_items = {}
+        self._assignee_icons = {}
 
     def _populate_default_thumbnail(self, item):
         """
@@ -151,11 +200,11 @@ class SgTaskListingModel(SgEntityListingModel):
             # ignore and not display.
             return
 
+        self._on_thumbnail_downloaded(item)
+
         if self._sg_location.entity_type in ["HumanUser", "Project"]:
             # show square thumbs for users and project (my tasks)
-            sg_data = item.get_sg_data()
-            icon = self._sg_formatter.create_thumbnail(image, sg_data)
-            item.setIcon(QtGui.QIcon(icon))
+            self._request_thumbnail(item.get_sg_data(), image, path)
 
 
 class TaskAssigneeModel(ShotgunModel):
@@ -204,7 +253,9 @@ class TaskAssigneeModel(ShotgunModel):
         """
         if len(user_ids) > 0:
             fields = ["image"]
-            self._load_data("HumanUser", [["id", "in", user_ids]], ["id"], fields)
+            self._load_data(
+                "HumanUser", canonical_filters([["id", "in", user_ids]]), ["id"], fields
+            )
             self._refresh_data()
 
     def _populate_thumbnail_image(self, item, field, image, path):
@@ -230,6 +281,5 @@ class TaskAssigneeModel(ShotgunModel):
         :param image: Image object representing the thumbnail
         :param path: A path on disk to the thumbnail. This is a file in jpeg format.
         """
-        self._current_pixmap = utils.create_round_thumbnail(image)
         sg_data = item.get_sg_data()
         self.thumbnail_updated.emit(sg_data, image)
@@ -11,9 +11,9 @@
 import sgtk
 from sgtk.platform.qt import QtCore, QtGui
 
-shotgun_data = sgtk.platform.import_framework(
-    "tk-framework-shotgunutils", "shotgun_data"
-)
+from .query_coalescer import CoalescingDataRetriever
+from .entity_store import get_entity_store
+
 shotgun_model = sgtk.platform.import_framework(
     "tk-framework-shotgunutils", "shotgun_model"
 )
@@ -22,23 +22,42 @@ shotgun_model = sgtk.platform.import_framework(
 class NoteUpdater(QtCore.QObject):
     """
     Class that operates asynchronously on notes.
+
+    Notes marked as read are collected for a short while and updated
+    together, in a single batch request. The change is applied to the
+    entity store right away, so that the notes show as read in all
+    models without waiting for the update.
     """
 
+    # time, in milliseconds, to collect notes before updating them
+    FLUSH_INTERVAL = 1000
+
     def __init__(self, task_manager, parent):
         """
         Constructor
 
-        :param data_retriever: Task manager to use for background work
+        :param task_manager: Task manager to use for background work
         :param parent: QT parent object
         """
         QtCore.QObject.__init__(self, parent)
 
-        self._guids = []
+        # request uid -> {note id: read status before the note was marked as
+        # read}, for all notes of the request, reverted if the request fails
+        self._requests = {}
+
+        # notes waiting to be updated, known to be unread or to be checked,
+        # and their read status before they were marked as read
+        self._unread_note_ids = []
+        self._unverified_note_ids = []
+        self._previous_statuses = {}
+
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL)
+        self._flush_timer.timeout.connect(self.flush)
 
         self._app = sgtk.platform.current_bundle()
-        self.__sg_data_retriever = shotgun_data.ShotgunDataRetriever(
-            self, bg_task_manager=task_manager
-        )
+        self.__sg_data_retriever = CoalescingDataRetriever(self, task_manager)
         self.__sg_data_retriever.start()
         self.__sg_data_retriever.work_completed.connect(self.__on_worker_signal)
         self.__sg_data_retriever.work_failure.connect(self.__on_worker_failure)
@@ -52,9 +71,10 @@ class NoteUpdater(QtCore.QObject):
         """
         uid = shotgun_model.sanitize_qt(uid)  # qstring on pyqt, str on pyside
         msg = shotgun_model.sanitize_qt(msg)
-        if uid in self._guids:
-            self._app.log_warning("Could not update note: %s" % msg)
-            self._guids.remove(uid)
+        previous_statuses = self._requests.pop(uid, None)
+        if previous_statuses is not None:
+            self._app.log_warning("Could not update notes: %s" % msg)
+            self._revert(previous_statuses)
 
     def __on_worker_signal(self, uid, request_type, data):
         """
@@ -68,9 +88,8 @@ class NoteUpdater(QtCore.QObject):
         """
         uid = shotgun_model.sanitize_qt(uid)  # qstring on pyqt, str on pyside
         data = shotgun_model.sanitize_qt(data)
-        if uid in self._guids:
-            self._app.log_debug("Note update complete: %s" % data)
-            self._guids.remove(uid)
+        if self._requests.pop(uid, None) is not None:
+            self._app.log_debug("Notes marked as read: %s" % (data["return_value"],))
 
     def mark_note_as_read(self, note_id):
         """
@@ -78,17 +97,111 @@ class NoteUpdater(QtCore.QObject):
 
         :param note_id: Shotgun note id to operate on
         """
-        data = {"note_id": note_id}
-        uid = self.__sg_data_retriever.execute_method(self._mark_note_as_read, data)
-        self._guids.append(uid)
+        if note_id in self._unread_note_ids or note_id in self._unverified_note_ids:
+            return
+
+        sg_data = get_entity_store().get("Note", note_id, ["read_by_current_user"])
+        if sg_data and sg_data["read_by_current_user"] == "unread":
+            # no need to check the status again before updating it
+            self._unread_note_ids.append(note_id)
+        else:
+            self._unverified_note_ids.append(note_id)
+        # a note whose status isn't known may well be unread
+        self._previous_statuses[note_id] = (
+            sg_data["read_by_current_user"] if sg_data else "unread"
+        )
+
+        # the note is read, whichever way it was before
+        get_entity_store().update("Note", note_id, {"read_by_current_user": "read"})
+
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush(self, wait=False):
+        """
+        Updates all notes waiting to be marked as read right away.
 
-    def _mark_note_as_read(self, sg, data):
+        :param wait: If True, the notes are updated before returning rather
+            than in the background, e.g. because the dialog is closing and
+            background work is about to be discarded.
         """
-        Async callback called by the data retriever.
-        Sets the note read status to read in case the status is set to unread.
+        self._flush_timer.stop()
+        if not (self._unread_note_ids or self._unverified_note_ids):
+            return
+
+        unread_note_ids = self._unread_note_ids
+        unverified_note_ids = self._unverified_note_ids
+        previous_statuses = self._previous_statuses
+        self._unread_note_ids = []
+        self._unverified_note_ids = []
+        self._previous_statuses = {}
+
+        if wait:
+            try:
+                note_ids = _mark_notes_as_read(
+                    self._app.shotgun, unread_note_ids, unverified_note_ids
+                )
+            except Exception as e:
+                self._app.log_warning("Could not update notes: %s" % e)
+                self._revert(previous_statuses)
+            else:
+                self._app.log_debug("Notes marked as read: %s" % (note_ids,))
+            return
+
+        uid = self.__sg_data_retriever.execute_method(
+            _mark_notes_as_read, unread_note_ids, unverified_note_ids
+        )
+        self._requests[uid] = previous_statuses
+
+    def _revert(self, previous_statuses):
         """
-        note_id = data["note_id"]
+        Reverts the read status of notes which could not be updated.
 
-        sg_data = sg.find_one("Note", [["id", "is", note_id]], ["read_by_current_user"])
-        if sg_data and sg_data["read_by_current_user"] == "unread":
-            sg.update("Note", note_id, {"read_by_current_user": "read"})
+        :param previous_statuses: Dictionary mapping note ids to the read
+            status they had before being marked as read.
+        """
+        for note_id, status in previous_statuses.items():
+            if status != "read":
+                get_entity_store().update(
+                    "Note", note_id, {"read_by_current_user": status}
+                )
+
+
+def _mark_notes_as_read(sg, unread_note_ids, unverified_note_ids):
+    """
+    Sets the read status of notes to read, in a single batch request.
+    Meant to be executed in a background thread via the
+    ShotgunDataRetriever.execute_method() method.
+
+    :param sg: Shotgun API instance
+    :param unread_note_ids: Ids of notes known to be unread
+    :param unverified_note_ids: Ids of notes which are only updated
+        if their status is unread.
+    :returns: List of ids of the notes which have been updated
+    """
+    note_ids = list(unread_note_ids)
+
+    if unverified_note_ids:
+        sg_records = sg.find(
+            "Note", [["id", "in", unverified_note_ids]], ["read_by_current_user"]
+        )
+        note_ids.extend(
+            sg_data["id"]
+            for sg_data in sg_records
+            if sg_data["read_by_current_user"] == "unread"
+        )
+
+    if note_ids:
+        sg.batch(
+            [
+                {
+                    "request_type": "update",
+                    "entity_type": "Note",
+                    "entity_id": note_id,
+                    "data": {"read_by_current_user": "read"},
+                }
+                for note_id in note_ids
+            ]
+        )
+
+    return note_ids
@@ -0,0 +1,199 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import collections
+
+# shared lookup instance, see get_publish_lookup()
+_publish_lookup = None
+
+
+def get_publish_lookup():
+    """
+    Returns the publish lookup shared by all models.
+
+    :returns: :class:`PublishLookup` instance
+    """
+    global _publish_lookup
+
+    if _publish_lookup is None:
+        _publish_lookup = PublishLookup()
+
+    return _publish_lookup
+
+
+def get_publish_type_field(entity_type):
+    """
+    Returns the field holding the type of a publish.
+
+    :param entity_type: PublishedFile or TankPublishedFile
+    :returns: Field name
+    """
+    if entity_type == "PublishedFile":
+        return "published_file_type"
+    else:
+        return "tank_type"
+
+
+def get_history_fields(entity_type):
+    """
+    Returns the fields needed to find the version history of a publish.
+
+    :param entity_type: PublishedFile or TankPublishedFile
+    :returns: List of field names
+    """
+    return [
+        "name",
+        "version_number",
+        "task",
+        "entity",
+        "project",
+        get_publish_type_field(entity_type),
+    ]
+
+
+def get_history_key(entity_type, sg_data):
+    """
+    Returns the key shared by all publishes in the version history of
+    a publish: same project, entity, name, type and task.
+
+    :param entity_type: PublishedFile or TankPublishedFile
+    :param sg_data: Shotgun data for a publish
+    :returns: Hashable key or None if the data lacks any of the history fields
+    """
+    key = []
+    for field in get_history_fields(entity_type):
+        if field == "version_number":
+            continue
+        if field not in sg_data:
+            return None
+        value = sg_data[field]
+        if isinstance(value, dict):
+            # entity link
+            value = (value.get("type"), value.get("id"))
+        key.append(value)
+    return tuple(key)
+
+
+def filters_cover_histories(entity_type, filters):
+    """
+    Returns whether the publishes matching some filters hold every publish
+    of the histories they belong to. This is the case when the filters only
+    narrow down fields shared by a whole history, e.g. the entity, task or
+    project of a location, but not when they select publishes created by a
+    user or linked to a version.
+
+    :param entity_type: PublishedFile or TankPublishedFile
+    :param filters: List of Shotgun filters
+    :returns: True if the histories are complete, False otherwise
+    """
+    history_fields = get_history_fields(entity_type)
+    for sg_filter in filters or []:
+        if not isinstance(sg_filter, (list, tuple)) or len(sg_filter) != 3:
+            # complex filters, e.g. filter_operator dictionaries
+            return False
+        field, operator, _ = sg_filter
+        if field == "version_number" or field not in history_fields:
+            return False
+        if operator not in ("is", "in"):
+            return False
+    return True
+
+
+class PublishLookup(object):
+    """
+    Keeps track of the publishes loaded by the models of the panel, so
+    that the version history of a publish can be looked up without
+    going back to Shotgun.
+
+    Models register the publishes they load. Models holding every
+    publish of a location can additionally flag the histories they hold
+    as complete, in which case those can be displayed right away.
+
+    This is only ever accessed from the GUI thread.
+    """
+
+    # maximum number of publishes remembered
+    MAX_RECORDS = 5000
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        # (entity type, id) -> sg data, least recently registered first
+        self._publishes = collections.OrderedDict()
+        # (entity type, history key) -> ids of all publishes in that history
+        self._complete_histories = {}
+
+    def __repr__(self):
+        return "<Publish lookup %d publishes, %d complete histories>" % (
+            len(self._publishes),
+            len(self._complete_histories),
+        )
+
+    def register(self, entity_type, sg_records, complete=False):
+        """
+        Registers publishes loaded from Shotgun.
+
+        :param entity_type: PublishedFile or TankPublishedFile
+        :param sg_records: List of Shotgun records. Records lacking
+            any of the history fields are ignored.
+        :param complete: True if the records hold every publish of
+            the histories they belong to.
+        """
+        histories = {}
+        for sg_data in sg_records:
+            history_key = get_history_key(entity_type, sg_data)
+            if history_key is None:
+                continue
+
+            key = (entity_type, sg_data["id"])
+            self._publishes.pop(key, None)
+            self._publishes[key] = dict(sg_data)
+            histories.setdefault((entity_type, history_key), set()).add(sg_data["id"])
+
+        if complete:
+            self._complete_histories.update(histories)
+
+        while len(self._publishes) > self.MAX_RECORDS:
+            (evicted_type, evicted_id), sg_data = self._publishes.popitem(last=False)
+            # the history can't be listed from memory anymore
+            history_key = get_history_key(evicted_type, sg_data)
+            self._complete_histories.pop((evicted_type, history_key), None)
+
+    def get_publish(self, entity_type, entity_id):
+        """
+        Returns a registered publish.
+
+        :param entity_type: PublishedFile or TankPublishedFile
+        :param entity_id: Id of the publish
+        :returns: Shotgun data or None if the publish is unknown
+        """
+        return self._publishes.get((entity_type, entity_id))
+
+    def get_history(self, entity_type, sg_data):
+        """
+        Returns the version history of a publish, if it is completely known.
+
+        :param entity_type: PublishedFile or TankPublishedFile
+        :param sg_data: Shotgun data for a publish, including the history fields
+        :returns: List of Shotgun records or None if the history is not known
+        """
+        history_key = get_history_key(entity_type, sg_data)
+        publish_ids = self._complete_histories.get((entity_type, history_key))
+        if not publish_ids:
+            return None
+
+        history = []
+        for publish_id in sorted(publish_ids):
+            publish = self._publishes.get((entity_type, publish_id))
+            if publish is None:
+                return None
+            history.append(publish)
+        return history
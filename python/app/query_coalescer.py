@@ -0,0 +1,290 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import copy
+import uuid
+
+import sgtk
+from sgtk.platform.qt import QtCore
+
+from .query_signature import get_query_signature
+
+shotgun_data = sgtk.platform.import_framework(
+    "tk-framework-shotgunutils", "shotgun_data"
+)
+shotgun_model = sgtk.platform.import_framework(
+    "tk-framework-shotgunutils", "shotgun_model"
+)
+
+# query key -> _InFlightQuery, for all queries which haven't completed yet,
+# shared by all retrievers so that panels and dialogs coalesce their queries.
+_in_flight = {}
+
+
+class _InFlightQuery(object):
+    """
+    A query which has been issued and all the requests waiting for it.
+    """
+
+    def __init__(self, execute_name, args, kwargs):
+        """
+        Constructor
+
+        :param execute_name: Name of the ShotgunDataRetriever method
+            issuing the query.
+        :param args: Positional arguments of the query
+        :param kwargs: Keyword arguments of the query
+        """
+        self.execute_name = execute_name
+        self.args = args
+        self.kwargs = kwargs
+        # retriever the query has been issued with
+        self.owner = None
+        # (retriever, uid) for each request waiting for the query
+        self.waiters = []
+
+
+class CoalescingDataRetriever(QtCore.QObject):
+    """
+    Wrapper around a ShotgunDataRetriever which doesn't issue a query
+    when an identical one is already in flight, from any retriever.
+    The request is attached to the pending query instead and completes
+    along with it.
+
+    Every request gets its own uid and its own work_completed or
+    work_failure signal, emitted by the retriever it was made with,
+    so this can be used as a drop in replacement for the retriever.
+
+    Only :meth:`execute_find` and :meth:`execute_shared_method` requests
+    are coalesced, methods passed to :meth:`execute_method` may have side
+    effects and are always executed.
+
+    Queries are only coalesced with queries running in the same priority
+    class, see :mod:`task_scheduler`, so that urgent requests never wait
+    behind less important work.
+
+    :signal work_completed(str, str, dict): Emitted with the uid of the
+        request, the request type and the results.
+    :signal work_failure(str, str): Emitted with the uid of the request
+        and an error message.
+    """
+
+    work_completed = QtCore.Signal(str, str, dict)
+    work_failure = QtCore.Signal(str, str)
+
+    def __init__(self, parent, bg_task_manager):
+        """
+        Constructor
+
+        :param parent: QT parent object
+        :param bg_task_manager: Task manager used to run the queries
+        """
+        QtCore.QObject.__init__(self, parent)
+
+        # uid of the queries issued with this retriever -> query key
+        self._issued = {}
+        # queries are only shared within a priority class
+        self._priority_class = getattr(bg_task_manager, "priority_class", None)
+
+        self._sg_data_retriever = shotgun_data.ShotgunDataRetriever(
+            self, bg_task_manager=bg_task_manager
+        )
+        self._sg_data_retriever.work_completed.connect(self._on_worker_signal)
+        self._sg_data_retriever.work_failure.connect(self._on_worker_failure)
+
+    def start(self):
+        """
+        Starts the retriever.
+        """
+        self._sg_data_retriever.start()
+
+    def stop(self):
+        """
+        Stops the retriever. Queries other retrievers are waiting
+        for are issued again on their behalf.
+        """
+        self._release_queries()
+        self._sg_data_retriever.stop()
+
+    def clear(self):
+        """
+        Discards all outstanding requests. Queries other retrievers
+        are waiting for are issued again on their behalf.
+        """
+        self._release_queries()
+        self._sg_data_retriever.clear()
+
+    def execute_find(self, entity_type, filters, fields, order=None, **kwargs):
+        """
+        Runs a find query, unless an identical one is in flight.
+
+        :param entity_type: Shotgun entity type
+        :param filters: List of Shotgun filters
+        :param fields: List of Shotgun fields
+        :param order: Optional Shotgun sort order
+        :param kwargs: Any other argument accepted by
+            ShotgunDataRetriever.execute_find()
+        :returns: Unique id of the request
+        """
+        signature = get_query_signature(
+            entity_type, filters, fields, order, kwargs.get("limit")
+        )
+        options = sorted(item for item in kwargs.items() if item[0] != "limit")
+        return self._execute(
+            ("find", signature, repr(options)),
+            "execute_find",
+            (entity_type, filters, fields, order),
+            kwargs,
+        )
+
+    def execute_shared_method(self, key, method, *args, **kwargs):
+        """
+        Executes a method reading from Shotgun, unless a method with
+        the same key is in flight. See ShotgunDataRetriever.execute_method().
+
+        :param key: Hashable key identifying what the method returns,
+            typically built from its arguments.
+        :param method: Method called with a Shotgun API instance and
+            the remaining arguments.
+        :returns: Unique id of the request
+        """
+        return self._execute(
+            ("method", method.__name__, key),
+            "execute_method",
+            (method,) + args,
+            kwargs,
+        )
+
+    def execute_method(self, method, *args, **kwargs):
+        """
+        Executes a method, see ShotgunDataRetriever.execute_method().
+
+        :param method: Method called with a Shotgun API instance and
+            the remaining arguments.
+        :returns: Unique id of the request
+        """
+        uid = self._sg_data_retriever.execute_method(method, *args, **kwargs)
+        return shotgun_model.sanitize_qt(uid)
+
+    ############################################################################################
+    # private methods
+
+    def _execute(self, key, execute_name, args, kwargs):
+        """
+        Issues a query or attaches a request to an identical query in flight.
+
+        :param key: Key identifying the query
+        :param execute_name: Name of the ShotgunDataRetriever method
+        :param args: Positional arguments of the query
+        :param kwargs: Keyword arguments of the query
+        :returns: Unique id of the request
+        """
+        key = (self._priority_class,) + key
+        query = _in_flight.get(key)
+        if query is None:
+            query = _InFlightQuery(execute_name, args, kwargs)
+            _in_flight[key] = query
+            uid = self._issue(key, query)
+        else:
+            uid = "coalesced_%s" % uuid.uuid4().hex
+
+        query.waiters.append((self, uid))
+        return uid
+
+    def _issue(self, key, query):
+        """
+        Issues a query with this retriever.
+
+        :param key: Key identifying the query
+        :param query: :class:`_InFlightQuery` to issue
+        :returns: Unique id of the query
+        """
+        execute = getattr(self._sg_data_retriever, query.execute_name)
+        uid = shotgun_model.sanitize_qt(execute(*query.args, **query.kwargs))
+        query.owner = self
+        self._issued[uid] = key
+        return uid
+
+    def _release_queries(self):
+        """
+        Stops waiting for any query and hands the queries issued with this
+        retriever over to a retriever still waiting for them.
+        """
+        for key, query in list(_in_flight.items()):
+            query.waiters = [
+                (retriever, uid)
+                for (retriever, uid) in query.waiters
+                if retriever is not self
+            ]
+            if query.owner is not self:
+                continue
+
+            if query.waiters:
+                query.waiters[0][0]._issue(key, query)
+            else:
+                del _in_flight[key]
+
+        self._issued = {}
+
+    def _pop_waiters(self, uid):
+        """
+        Returns the requests waiting for a query issued with this retriever.
+
+        :param uid: Unique id of the query
+        :returns: List of (retriever, uid) tuples, or None if the query
+            wasn't issued on behalf of any request anymore.
+        """
+        key = self._issued.pop(uid, None)
+        if key is None:
+            return None
+
+        return _in_flight.pop(key).waiters
+
+    def _on_worker_signal(self, uid, request_type, data):
+        """
+        Called when a query has completed.
+
+        :param uid: Unique id of the query
+        :param request_type: Type of the request
+        :param data: Dictionary with the results
+        """
+        uid = shotgun_model.sanitize_qt(uid)  # qstring on pyqt, str on pyside
+        request_type = shotgun_model.sanitize_qt(request_type)
+        data = shotgun_model.sanitize_qt(data)
+
+        waiters = self._pop_waiters(uid)
+        if waiters is None:
+            # not a shared query, or one which has been cleared
+            self.work_completed.emit(uid, request_type, data)
+            return
+
+        # the first request gets the original results and the others a copy,
+        # made before anything had a chance to modify the results
+        results = [data] + [copy.deepcopy(data) for _ in waiters[1:]]
+        for (retriever, waiter_uid), waiter_data in zip(waiters, results):
+            retriever.work_completed.emit(waiter_uid, request_type, waiter_data)
+
+    def _on_worker_failure(self, uid, msg):
+        """
+        Called when a query has failed.
+
+        :param uid: Unique id of the query
+        :param msg: Error message
+        """
+        uid = shotgun_model.sanitize_qt(uid)  # qstring on pyqt, str on pyside
+        msg = shotgun_model.sanitize_qt(msg)
+
+        waiters = self._pop_waiters(uid)
+        if waiters is None:
+            self.work_failure.emit(uid, msg)
+            return
+
+        for retriever, waiter_uid in waiters:
+            retriever.work_failure.emit(waiter_uid, msg)
@@ -0,0 +1,152 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import json
+import hashlib
+
+# Note: This module is deliberately free of any toolkit or Qt imports.
+#
+# The ShotgunModel disk cache is keyed on the string representation of the
+# query parameters. Field lists built from sets and dictionaries built in
+# different orders stringify differently from one process to the next, which
+# means that the cache is missed in every new session. All models pass their
+# query parameters through the methods below so that the same query always
+# produces the same parameters, and therefore hits the same cache.
+
+# operators where the order of the values doesn't matter
+UNORDERED_VALUE_OPERATORS = ["in", "not_in", "type_is", "type_is_not"]
+
+
+def canonical_fields(fields):
+    """
+    Returns a sorted list of unique field names.
+
+    :param fields: Iterable of Shotgun field names
+    :returns: List of field names
+    """
+    return sorted(set(fields or []))
+
+
+def canonical_filters(filters):
+    """
+    Returns a normalized version of the given Shotgun filters.
+
+    Since all top level filters have to match, their order doesn't matter
+    and they are sorted. The same goes for the filters of complex
+    ``{"filter_operator": ..., "filters": [...]}`` filters and for the values
+    of ``in`` style operators. Dictionaries, e.g. entity links, are rebuilt
+    with sorted keys and tuples are converted to lists.
+
+    :param filters: List of Shotgun filters
+    :returns: List of normalized Shotgun filters
+    """
+    return _sorted_values([_normalize_filter(f) for f in filters or []])
+
+
+def canonical_order(order):
+    """
+    Returns a normalized version of the given Shotgun sort order. The order
+    of the sort fields is significant and is therefore preserved.
+
+    :param order: List of dictionaries with field_name and direction keys
+    :returns: List of normalized dictionaries
+    """
+    return [
+        {
+            "direction": item.get("direction") or "asc",
+            "field_name": item["field_name"],
+        }
+        for item in order or []
+    ]
+
+
+def get_query_signature(entity_type, filters, fields, order=None, limit=None):
+    """
+    Returns a signature identifying a Shotgun query, which is identical for
+    equivalent queries regardless of field, filter and dictionary ordering
+    and of the Python process it was computed in.
+
+    :param entity_type: Shotgun entity type
+    :param filters: List of Shotgun filters
+    :param fields: List of Shotgun fields
+    :param order: Optional Shotgun sort order
+    :param limit: Optional maximum number of records
+    :returns: Hex digest string
+    """
+    query = [
+        entity_type,
+        canonical_filters(filters),
+        canonical_fields(fields),
+        canonical_order(order),
+        limit,
+    ]
+    return hashlib.sha1(_dumps(query).encode("utf-8")).hexdigest()
+
+
+def _dumps(value):
+    """
+    Serializes a value in a stable way.
+
+    :param value: Value to serialize
+    :returns: String
+    """
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def _sorted_values(values):
+    """
+    Sorts a list of arbitrary, potentially non comparable, values.
+
+    :param values: List of values
+    :returns: Sorted list
+    """
+    return sorted(values, key=_dumps)
+
+
+def _normalize_value(value):
+    """
+    Normalizes a filter value.
+
+    :param value: Value used in a Shotgun filter
+    :returns: Normalized value
+    """
+    if isinstance(value, dict):
+        return dict((key, _normalize_value(value[key])) for key in sorted(value))
+
+    if isinstance(value, (list, tuple)):
+        return [_normalize_value(item) for item in value]
+
+    return value
+
+
+def _normalize_filter(sg_filter):
+    """
+    Normalizes a single Shotgun filter.
+
+    :param sg_filter: Simple ``[field, operator, values...]`` filter or complex
+        ``{"filter_operator": ..., "filters": [...]}`` filter.
+    :returns: Normalized filter
+    """
+    if isinstance(sg_filter, dict) and "filters" in sg_filter:
+        normalized = _normalize_value(sg_filter)
+        normalized["filters"] = canonical_filters(sg_filter["filters"])
+        return normalized
+
+    normalized = _normalize_value(sg_filter)
+
+    if (
+        isinstance(normalized, list)
+        and len(normalized) == 3
+        and normalized[1] in UNORDERED_VALUE_OPERATORS
+        and isinstance(normalized[2], list)
+    ):
+        normalized[2] = _sorted_values(normalized[2])
+
+    return normalized
@@ -0,0 +1,118 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import sgtk
+from sgtk.platform.qt import QtCore
+
+from . import utils
+from .query_signature import get_query_signature
+from .query_coalescer import CoalescingDataRetriever
+
+shotgun_model = sgtk.platform.import_framework(
+    "tk-framework-shotgunutils", "shotgun_model"
+)
+
+
+class RecordCounter(QtCore.QObject):
+    """
+    Counts records in the background using summary queries,
+    which is a lot cheaper than loading the records themselves.
+
+    :signal count_available(str, int): Emitted when a count has been
+        retrieved. The arguments are the key passed to :meth:`count`
+        and the number of records.
+    """
+
+    count_available = QtCore.Signal(str, int)
+
+    def __init__(self, bg_task_manager, parent=None):
+        """
+        Constructor
+
+        :param bg_task_manager: Background task manager to run the queries in
+        :param parent: QT parent object
+        """
+        QtCore.QObject.__init__(self, parent)
+
+        self._app = sgtk.platform.current_bundle()
+
+        # request uid -> key
+        self._requests = {}
+
+        self._sg_data_retriever = CoalescingDataRetriever(self, bg_task_manager)
+        self._sg_data_retriever.start()
+        self._sg_data_retriever.work_completed.connect(self._on_worker_signal)
+        self._sg_data_retriever.work_failure.connect(self._on_worker_failure)
+
+    def destroy(self):
+        """
+        Tear down method
+        """
+        self.clear()
+        self._sg_data_retriever.stop()
+
+    ############################################################################################
+    # public interface
+
+    def count(self, key, entity_type, filters):
+        """
+        Requests the number of records matching a query.
+
+        :param key: String identifying the request in the count_available signal
+        :param entity_type: Shotgun entity type
+        :param filters: List of Shotgun filters
+        """
+        uid = self._sg_data_retriever.execute_shared_method(
+            get_query_signature(entity_type, filters, []),
+            utils.get_record_count,
+            entity_type,
+            filters,
+        )
+        self._requests[uid] = key
+
+    def clear(self):
+        """
+        Discards all outstanding requests.
+        """
+        self._sg_data_retriever.clear()
+        self._requests = {}
+
+    ############################################################################################
+    # private methods
+
+    def _on_worker_signal(self, uid, request_type, data):
+        """
+        Called when a count query has completed.
+
+        :param uid: Unique id of the request
+        :param request_type: Type of the request
+        :param data: Dictionary with the results
+        """
+        uid = shotgun_model.sanitize_qt(uid)  # qstring on pyqt, str on pyside
+        data = shotgun_model.sanitize_qt(data)
+
+        key = self._requests.pop(uid, None)
+        if key is not None:
+            self.count_available.emit(key, data["return_value"])
+
+    def _on_worker_failure(self, uid, msg):
+        """
+        Called when a count query has failed.
+
+        :param uid: Unique id of the request
+        :param msg: Error message
+        """
+        uid = shotgun_model.sanitize_qt(uid)  # qstring on pyqt, str on pyside
+        msg = shotgun_model.sanitize_qt(msg)
+
+        key = self._requests.pop(uid, None)
+        if key is not None:
+            # counts are only informative
+            self._app.log_debug("Could not count records for %s: %s" % (key, msg))
@@ -14,7 +14,10 @@ from sgtk.platform.qt import QtCore, QtGui
 import re
 import datetime
 import pprint
+import collections
+import threading
 from . import utils
+from .thumbnail_cache import get_composited_thumbnail
 
 shotgun_globals = sgtk.platform.import_framework(
     "tk-framework-shotgunutils",
@@ -25,6 +28,203 @@ qtwidgets_utils = sgtk.platform.import_framework(
     "utils",
 )
 
+# A {token} slot in a compiled template. See ShotgunTypeFormatter._compile_template
+_TemplateToken = collections.namedtuple(
+    "_TemplateToken", ["sg_fields", "directive", "pre_roll", "post_roll"]
+)
+
+# Process wide registry of ShotgunTypeFormatter instances, keyed by entity type.
+# Note that this module is imported separately for each instance of the app, so
+# the registry is naturally discarded whenever the engine reloads the app and
+# its hooks. Context changes are handled via clear_type_formatters().
+_type_formatters = {}
+
+
+def get_type_formatter(entity_type):
+    """
+    Returns the shared formatter for the given entity type, creating it
+    the first time the entity type is requested.
+
+    Type formatters are immutable once created, so the same instance can
+    safely be used by all models, locations and widgets in the panel.
+
+    :param entity_type: Shotgun entity type
+    :returns: :class:`ShotgunTypeFormatter` instance
+    """
+    formatter = _type_formatters.get(entity_type)
+    if formatter is None:
+        formatter = ShotgunTypeFormatter(entity_type)
+        _type_formatters[entity_type] = formatter
+    return formatter
+
+
+def clear_type_formatters():
+    """
+    Discards all shared type formatters so that the shotgun_fields hook
+    is executed again next time a formatter is requested. This should be
+    called whenever the hook values may have changed, e.g. on context change.
+    """
+    _type_formatters.clear()
+    _list_item_cache.clear()
+
+
+def get_list_item_cache():
+    """
+    Returns the shared cache of rendered list item details.
+
+    :returns: :class:`ListItemDetailsCache` instance
+    """
+    return _list_item_cache
+
+
+class ListItemDetailsCache(object):
+    """
+    Bounded LRU cache of rendered list item details.
+
+    Rendering the (top_left, top_right, body) html for a list item is
+    comparatively expensive and the view re-renders items on every hover,
+    scroll, selection and thumbnail update. Since the rendered html only
+    depends on the templates and the record, entries are keyed by entity type,
+    entity id, updated_at and a hash of the formatter's list item templates.
+
+    Items displaying relative timestamps (e.g. "10:32" vs "24 Jun 10:32")
+    expire when the formatted timestamp would next change.
+
+    The cache can be populated from background threads, see
+    :meth:`render_list_items`.
+    """
+
+    # default maximum number of rendered items to keep around
+    DEFAULT_MAX_SIZE = 2000
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        """
+        Constructor
+
+        :param max_size: Maximum number of items to keep in the cache.
+        """
+        self._max_size = max_size
+        # OrderedDict used as an LRU - most recently used entries are last
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __repr__(self):
+        return "<List item details cache %s>" % self.cache_info()
+
+    def get_list_item_details(self, sg_formatter, sg_data, preformatted=None):
+        """
+        Returns the rendered list item details for the given record,
+        rendering and caching them if not already cached.
+
+        :param sg_formatter: :class:`ShotgunTypeFormatter` to render with
+        :param sg_data: Shotgun data dictionary to render
+        :param preformatted: Optional entry previously returned by
+            :meth:`render_list_items` for this record. It is used as is
+            if it is still valid for the record.
+        :returns: tuple with formatted and resolved (top_left, top_right,
+                  body) strings.
+        """
+        key = sg_formatter.get_list_item_cache_key(sg_data)
+
+        if preformatted and self._is_valid(preformatted, key):
+            return preformatted[1]
+
+        return self._get_entry(sg_formatter, sg_data, key)[1]
+
+    def render_list_items(self, sg_formatter, sg_data_list):
+        """
+        Renders the list item details for a batch of records, e.g. a full
+        result set as it was loaded into a model. This is safe to run in a
+        background thread.
+
+        :param sg_formatter: :class:`ShotgunTypeFormatter` to render with
+        :param sg_data_list: List of Shotgun data dictionaries
+        :returns: Dictionary keyed by entity id. Values are opaque entries
+            which can be passed to :meth:`get_list_item_details`.
+        """
+        entries = {}
+        for sg_data in sg_data_list:
+            key = sg_formatter.get_list_item_cache_key(sg_data)
+            entries[sg_data["id"]] = self._get_entry(sg_formatter, sg_data, key)
+        return entries
+
+    def cache_info(self):
+        """
+        Returns diagnostics about the cache.
+
+        :returns: Dictionary with keys hits, misses, size and max_size
+        """
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "size": len(self._entries),
+            "max_size": self._max_size,
+        }
+
+    def clear(self):
+        """
+        Removes all items from the cache and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def _is_valid(self, entry, key):
+        """
+        Checks if a cache entry can be used to display a record
+
+        :param entry: Tuple with (key, details, expires_at)
+        :param key: Cache key for the record to display
+        :returns: True if valid, False otherwise
+        """
+        entry_key, _, expires_at = entry
+        if key is None or entry_key != key:
+            return False
+        return expires_at is None or datetime.datetime.now() < expires_at
+
+    def _get_entry(self, sg_formatter, sg_data, key):
+        """
+        Returns the cache entry for a record, rendering it if needed.
+
+        :param sg_formatter: :class:`ShotgunTypeFormatter` to render with
+        :param sg_data: Shotgun data dictionary to render
+        :param key: Cache key for the record, None if it cannot be cached.
+        :returns: Tuple with (key, details, expires_at)
+        """
+        if key is not None:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    if self._is_valid(entry, key):
+                        self._hits += 1
+                        self._entries.move_to_end(key)
+                        return entry
+                    # time relative tokens need to be rendered again
+                    del self._entries[key]
+
+        # render outside of the lock, this is the expensive part
+        entry = (
+            key,
+            sg_formatter.format_list_item_details(sg_data),
+            sg_formatter.get_list_item_expiry(sg_data),
+        )
+
+        with self._lock:
+            self._misses += 1
+            if key is not None:
+                self._entries[key] = entry
+                if len(self._entries) > self._max_size:
+                    # evict the least recently used item
+                    self._entries.popitem(last=False)
+
+        return entry
+
+
+_list_item_cache = ListItemDetailsCache()
+
 
 class ShotgunTypeFormatter(object):
     """
@@ -37,6 +237,9 @@ class ShotgunTypeFormatter(object):
     presented, which fields should be displayed etc.
     """
 
+    # fields which are formatted relative to the current time
+    TIME_RELATIVE_FIELDS = ["created_at", "updated_at"]
+
     def __init__(self, entity_type):
         """
         Constructor
@@ -75,24 +278,49 @@ class ShotgunTypeFormatter(object):
             "shotgun_fields_hook", "get_entity_default_tab", entity_type=entity_type
         )
 
-        # extract a list of fields given all the different {tokens} defined
-        fields = []
-        fields += self._resolve_sg_fields(
-            self._get_hook_value("get_list_item_definition", "top_left")
-        )
-        fields += self._resolve_sg_fields(
-            self._get_hook_value("get_list_item_definition", "top_right")
-        )
-        fields += self._resolve_sg_fields(
-            self._get_hook_value("get_list_item_definition", "body")
+        # compile the templates up front so that rendering them, which happens
+        # on every repaint of a list item, doesn't need to parse anything.
+        self._templates = {}
+        self._list_item_templates = tuple(
+            self._get_template(self._get_hook_value("get_list_item_definition", key))
+            for key in ["top_left", "top_right", "body"]
         )
-        fields += self._resolve_sg_fields(
-            self._get_hook_value("get_main_view_definition", "title")
+        self._main_view_templates = tuple(
+            self._get_template(self._get_hook_value("get_main_view_definition", key))
+            for key in ["title", "body"]
         )
-        fields += self._resolve_sg_fields(
-            self._get_hook_value("get_main_view_definition", "body")
+
+        # used to key rendered list items in the ListItemDetailsCache, along
+        # with the values of the fields they display
+        self._list_item_templates_hash = hash(self._list_item_templates)
+        self._list_item_fields = tuple(
+            sorted(
+                set(
+                    field
+                    for template in self._list_item_templates
+                    for field in self._resolve_sg_fields(template)
+                )
+            )
         )
 
+        # tokens which are displayed relative to the current time, and
+        # therefore make rendered list items expire.
+        self._list_item_time_tokens = [
+            segment
+            for template in self._list_item_templates
+            for segment in template
+            if isinstance(segment, _TemplateToken)
+            and set(segment.sg_fields) & set(self.TIME_RELATIVE_FIELDS)
+        ]
+
+        # extract a list of fields given all the different {tokens} defined
+        fields = []
+        for template in self._list_item_templates + self._main_view_templates:
+            fields += self._resolve_sg_fields(template)
+
+        # the last update time is used to key the cache of rendered list items
+        fields.append("updated_at")
+
         # also include the thumbnail field so that it gets retrieved as part of the general
         # query payload
         fields.extend(self.thumbnail_fields)
@@ -120,24 +348,40 @@ class ShotgunTypeFormatter(object):
     ###############################################################################################
     # helper methods
 
-    def _resolve_sg_fields(self, token_str):
+    def _resolve_sg_fields(self, template):
         """
         Convenience method. Returns the sg fields for all tokens
-        given a token_str
+        given a compiled template
 
-        :param token_str: String with tokens, e.g. "{code}_{created_by}"
+        :param template: Compiled template, e.g. for "{code}_{created_by}"
         :returns: All shotgun fields, e.g. ["code", "created_by"]
         """
         fields = []
 
-        for _, sg_fields, _, _, _ in self._resolve_tokens(token_str):
-            fields.extend(sg_fields)
+        for segment in template:
+            if isinstance(segment, _TemplateToken):
+                fields.extend(segment.sg_fields)
 
         return fields
 
-    def _resolve_tokens(self, token_str):
+    def _get_template(self, token_str):
         """
-        Resolve a list of tokens from a string.
+        Returns the compiled representation of a token string,
+        compiling it on first use.
+
+        :param token_str: String with tokens, e.g. "{code}_{created_by}"
+        :returns: Compiled template, see :meth:`_compile_template`
+        """
+        template = self._templates.get(token_str)
+        if template is None:
+            template = self._compile_template(token_str)
+            self._templates[token_str] = template
+        return template
+
+    def _compile_template(self, token_str):
+        """
+        Compile a string with tokens into a sequence of segments which
+        can be rendered in a single pass without any further parsing.
 
         Tokens are on the following form:
 
@@ -165,53 +409,75 @@ class ShotgunTypeFormatter(object):
         - {[Name: ]code[<br>]}           # Same but with a post line break
 
         :param token_str: String with tokens, e.g. "{code}_{created_by}"
-        returns: a list of tuples with (full_token, sg_fields, directive, preroll, postroll)
+        :returns: tuple of segments in display order. Each segment is either a
+                  literal string or a :class:`_TemplateToken` holding the
+                  resolved sg_fields, directive, preroll and postroll.
         """
-
         try:
-            # find all field names ["xx", "yy", "zz.xx"] from "{xx}_{yy}_{zz.xx}"
-            raw_tokens = set(re.findall("{([^}^{]*)}", token_str))
+            # find all field tokens ["xx", "yy", "zz.xx"] from "{xx}_{yy}_{zz.xx}"
+            matches = list(re.finditer("{([^}^{]*)}", token_str))
         except Exception as error:
             raise TankError("Could not parse '%s' - Error: %s" % (token_str, error))
 
-        fields = []
-        for raw_token in raw_tokens:
-
-            pre_roll = None
-            post_roll = None
-            directive = None
-
-            processed_token = raw_token
-
-            match = re.match("^\[([^\]]+)\]", processed_token)
-            if match:
-                pre_roll = match.group(1)
-                # remove preroll part from main token
-                processed_token = processed_token[len(pre_roll) + 2 :]
-
-            match = re.match(".*\[([^\]]+)\]$", processed_token)
-            if match:
-                post_roll = match.group(1)
-                # remove preroll part from main token
-                processed_token = processed_token[: -(len(post_roll) + 2)]
-
-            if "::" in processed_token:
-                # we have a special formatting directive
-                # e.g. created_at::ago
-                sg_field_str, directive = processed_token.split("::")
-            else:
-                sg_field_str = processed_token
+        segments = []
+        parsed_tokens = {}
+        position = 0
+        for match in matches:
+            if match.start() > position:
+                segments.append(token_str[position : match.start()])
 
-            if "|" in sg_field_str:
-                # there is more than one sg field, we have a
-                # series of fallbacks
-                sg_fields = sg_field_str.split("|")
-            else:
-                sg_fields = [sg_field_str]
+            raw_token = match.group(1)
+            if raw_token not in parsed_tokens:
+                parsed_tokens[raw_token] = self._parse_token(raw_token)
+            segments.append(parsed_tokens[raw_token])
 
-            fields.append((raw_token, sg_fields, directive, pre_roll, post_roll))
+            position = match.end()
 
-        return fields
+        if position < len(token_str):
+            segments.append(token_str[position:])
+
+        return tuple(segments)
+
+    def _parse_token(self, raw_token):
+        """
+        Parse the contents of a single token, e.g. "[Name: ]code|title::nolink".
+
+        :param raw_token: Token string without its surrounding curly brackets
+        :returns: :class:`_TemplateToken` instance
+        """
+        pre_roll = None
+        post_roll = None
+        directive = None
+
+        processed_token = raw_token
+
+        match = re.match(r"^\[([^\]]+)\]", processed_token)
+        if match:
+            pre_roll = match.group(1)
+            # remove preroll part from main token
+            processed_token = processed_token[len(pre_roll) + 2 :]
+
+        match = re.match(r".*\[([^\]]+)\]$", processed_token)
+        if match:
+            post_roll = match.group(1)
+            # remove preroll part from main token
+            processed_token = processed_token[: -(len(post_roll) + 2)]
+
+        if "::" in processed_token:
+            # we have a special formatting directive
+            # e.g. created_at::ago
+            sg_field_str, directive = processed_token.split("::")
+        else:
+            sg_field_str = processed_token
+
+        if "|" in sg_field_str:
+            # there is more than one sg field, we have a
+            # series of fallbacks
+            sg_fields = tuple(sg_field_str.split("|"))
+        else:
+            sg_fields = (sg_field_str,)
+
+        return _TemplateToken(sg_fields, directive, pre_roll, post_roll)
 
     def _get_hook_value(self, method_name, hook_key):
         """
@@ -288,7 +554,7 @@ class ShotgunTypeFormatter(object):
                 )
             str_val = ", ".join(link_urls)
 
-        elif sg_field in ["created_at", "updated_at"]:
+        elif sg_field in self.TIME_RELATIVE_FIELDS:
             created_datetime = datetime.datetime.fromtimestamp(value)
             str_val, _ = utils.create_human_readable_timestamp(created_datetime)
 
@@ -328,25 +594,37 @@ class ShotgunTypeFormatter(object):
         :param sg_data: Data dictionary to get values from
         :returns: string with tokens replaced with actual values
         """
-        # extract all tokens and process them one after the other
-        for (
-            full_token,
-            sg_fields,
-            directive,
-            pre_roll,
-            post_roll,
-        ) in self._resolve_tokens(token_str):
+        return self._render_template(self._get_template(token_str), sg_data)
+
+    def _render_template(self, template, sg_data):
+        """
+        Render a compiled template given a shotgun data dict
+
+        :param template: Compiled template, see :meth:`_compile_template`
+        :param sg_data: Data dictionary to get values from
+        :returns: string with tokens replaced with actual values
+        """
+        chunks = []
+
+        for segment in template:
+
+            if not isinstance(segment, _TemplateToken):
+                # literal part of the template
+                chunks.append(segment)
+                continue
 
             # get the first sg field value we find
             # this is usef when we have a fallback syntax in the token string,
             # for example {artist|created_by}
-            for sg_field in sg_fields:
+            for sg_field in segment.sg_fields:
                 sg_value = sg_data.get(sg_field)
                 if sg_value:
                     # got a value so stop looking
                     break
 
-            if (sg_value is None or sg_value == []) and (pre_roll or post_roll):
+            if (sg_value is None or sg_value == []) and (
+                segment.pre_roll or segment.post_roll
+            ):
                 # shotgun value is empty
                 # if we have a pre or post roll part of the token
                 # then we basicaly just skip the display of both
@@ -354,22 +632,20 @@ class ShotgunTypeFormatter(object):
                 # e.g. Hello {[Shot:]sg_shot} becomes:
                 # for shot abc: 'Hello Shot:abc'
                 # for shot <empty>: 'Hello '
-                token_str = token_str.replace("{%s}" % full_token, "")
+                continue
 
-            else:
-                resolved_value = self._sg_field_to_str(
-                    sg_data["type"], sg_field, sg_value, directive
-                )
+            resolved_value = self._sg_field_to_str(
+                sg_data["type"], sg_field, sg_value, segment.directive
+            )
 
-                # potentially add pre/and post
-                if pre_roll:
-                    resolved_value = "%s%s" % (pre_roll, resolved_value)
-                if post_roll:
-                    resolved_value = "%s%s" % (resolved_value, post_roll)
-                # and replace the token with the value
-                token_str = token_str.replace("{%s}" % full_token, resolved_value)
+            # potentially add pre/and post
+            if segment.pre_roll:
+                chunks.append(segment.pre_roll)
+            chunks.append(resolved_value)
+            if segment.post_roll:
+                chunks.append(segment.post_roll)
 
-        return token_str
+        return "".join(chunks)
 
     ####################################################################################################
     # properties
@@ -429,27 +705,36 @@ class ShotgunTypeFormatter(object):
     @property
     def fields(self):
         """
-        fields needed to render list or main details
+        fields needed to render list or main details, in a stable order
         """
-        return list(self._token_fields)
+        return sorted(self._token_fields)
 
     ####################################################################################################
     # public methods
 
-    def create_thumbnail(self, image, sg_data):
+    def create_thumbnail(self, image, sg_data, path=None, size=None):
         """
         Given a QImage representing a thumbnail and return a formatted
-        pixmap that is suitable for that data type.
+        image that is suitable for that data type.
+
+        This doesn't touch any QPixmaps and can be called from a background thread.
 
         :param image: QImage representing a shotgun thumbnail
         :param sg_data: Data associated with the thumbnail
-        :returns: Pixmap object
+        :param path: Path on disk to the thumbnail. If specified, the formatted
+            image is cached on disk and reused the next time the same
+            thumbnail is formatted.
+        :param size: Optional (width, height) tuple with the size the thumbnail
+            is displayed at. If not specified, a full 512x400 image is returned.
+        :returns: QImage object
         """
         if self.entity_type in ["HumanUser", "ApiUser"]:
-            return utils.create_round_512x400_note_thumbnail(image)
+            create_method = utils.create_round_512x400_note_thumbnail
+            kwargs = {}
 
         elif self.entity_type == "ClientUser":
-            return utils.create_round_512x400_note_thumbnail(image, client=True)
+            create_method = utils.create_round_512x400_note_thumbnail
+            kwargs = {"client": True}
 
         elif self.entity_type == "Note":
 
@@ -460,15 +745,20 @@ class ShotgunTypeFormatter(object):
             else:
                 unread = False
 
-            return utils.create_round_512x400_note_thumbnail(image, client_note, unread)
+            create_method = utils.create_round_512x400_note_thumbnail
+            kwargs = {"client": client_note, "unread": unread}
 
         elif self.entity_type == "Task" and sg_data["type"] == "HumanUser":
             # a user icon for a task
             # todo: refcator this logic to make it clearer
-            return utils.create_round_512x400_note_thumbnail(image)
+            create_method = utils.create_round_512x400_note_thumbnail
+            kwargs = {}
 
         else:
-            return utils.create_rectangular_512x400_thumbnail(image)
+            create_method = utils.create_rectangular_512x400_thumbnail
+            kwargs = {}
+
+        return get_composited_thumbnail(create_method, image, path, size, **kwargs)
 
     @classmethod
     def get_playback_url(cls, sg_data):
@@ -521,13 +811,10 @@ class ShotgunTypeFormatter(object):
                this data dictionary.
         :returns: tuple with formatted and resolved (header, body) strings.
         """
-        title = self._get_hook_value("get_main_view_definition", "title")
-        body = self._get_hook_value("get_main_view_definition", "body")
-
-        title_converted = self._convert_token_string(title, sg_data)
-        body_converted = self._convert_token_string(body, sg_data)
-
-        return (title_converted, body_converted)
+        return tuple(
+            self._render_template(template, sg_data)
+            for template in self._main_view_templates
+        )
 
     def format_list_item_details(self, sg_data):
         """
@@ -541,16 +828,63 @@ class ShotgunTypeFormatter(object):
         :returns: tuple with formatted and resolved (top_left, top_right,
                   body) strings.
         """
+        return tuple(
+            self._render_template(template, sg_data)
+            for template in self._list_item_templates
+        )
+
+    def get_list_item_cache_key(self, sg_data):
+        """
+        Returns a key which uniquely identifies the rendered list item details
+        for the given data, for use with the :class:`ListItemDetailsCache`.
+
+        The displayed values are part of the key, so that records updated
+        from the panel, which keep their last update time until they are
+        refreshed, are rendered again.
+
+        :param sg_data: Shotgun data dictionary
+        :returns: Hashable key or None if the data cannot be cached.
+        """
+        updated_at = sg_data.get("updated_at")
+        if updated_at is None or sg_data.get("id") is None:
+            return None
 
-        top_left = self._get_hook_value("get_list_item_definition", "top_left")
-        top_right = self._get_hook_value("get_list_item_definition", "top_right")
-        body = self._get_hook_value("get_list_item_definition", "body")
+        return (
+            sg_data["type"],
+            sg_data["id"],
+            updated_at,
+            self._list_item_templates_hash,
+            repr([sg_data.get(field) for field in self._list_item_fields]),
+        )
 
-        top_left_converted = self._convert_token_string(top_left, sg_data)
-        top_right_converted = self._convert_token_string(top_right, sg_data)
-        body_converted = self._convert_token_string(body, sg_data)
+    def get_list_item_expiry(self, sg_data):
+        """
+        Returns the point in time when the list item details rendered
+        for the given data become outdated because they contain
+        timestamps which are displayed relative to the current time.
 
-        return (top_left_converted, top_right_converted, body_converted)
+        :param sg_data: Shotgun data dictionary
+        :returns: Datetime object or None if the details never expire.
+        """
+        expires_at = None
+
+        for token in self._list_item_time_tokens:
+            # resolve the fallback chain the same way the rendering does
+            for sg_field in token.sg_fields:
+                sg_value = sg_data.get(sg_field)
+                if sg_value:
+                    break
+
+            if sg_field not in self.TIME_RELATIVE_FIELDS or not sg_value:
+                continue
+
+            field_expiry = utils.get_human_readable_timestamp_expiry(
+                datetime.datetime.fromtimestamp(sg_value)
+            )
+            if field_expiry and (expires_at is None or field_expiry < expires_at):
+                expires_at = field_expiry
+
+        return expires_at
 
     def get_link_filters(self, sg_location):
         """
@@ -579,23 +913,39 @@ class ShotgunTypeFormatter(object):
         )
 
 
-class ShotgunEntityFormatter(ShotgunTypeFormatter):
+class ShotgunEntityFormatter(object):
     """
-    A more detailed formatter subclassing the ShotgunTypeFormatter.
+    A more detailed formatter wrapping the ShotgunTypeFormatter.
 
     This formatter takes a Shotgun entity id, meaning that it can
     be more intelligent when resolving things like descriptions, tooltips etc.
+
+    It is a thin wrapper around the shared type formatter for its entity type
+    (see :meth:`get_type_formatter`) and all methods and properties which aren't
+    specific to the entity id are forwarded to that shared object. Creating
+    an entity formatter is therefore cheap and doesn't execute any hooks once
+    the entity type has been seen before.
     """
 
     def __init__(self, entity_type, entity_id):
         """
         Constructor
         """
-        super(ShotgunEntityFormatter, self).__init__(entity_type)
+        self._type_formatter = get_type_formatter(entity_type)
         self._entity_id = entity_id
 
     def __repr__(self):
-        return "<PTR %s %s entity formatter>" % (self._entity_type, self._entity_id)
+        return "<PTR %s %s entity formatter>" % (self.entity_type, self._entity_id)
+
+    def __getattr__(self, name):
+        """
+        Forwards attribute lookups that are not handled by this class
+        to the shared type formatter.
+        """
+        if name == "_type_formatter":
+            # not yet initialized
+            raise AttributeError(name)
+        return getattr(self._type_formatter, name)
 
     @property
     def entity_id(self):
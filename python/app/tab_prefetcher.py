@@ -0,0 +1,111 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+
+class TabPrefetcher(object):
+    """
+    Loads the entity tabs which aren't displayed, one at a time,
+    so that switching to them doesn't require waiting for any query.
+
+    Prefetching only happens while nothing is being loaded in the
+    foreground: it is stopped as soon as a tab is loaded on behalf
+    of the user, and resumed once that tab has been refreshed.
+    """
+
+    def __init__(self, load_callback):
+        """
+        Constructor
+
+        :param load_callback: Method loading a tab, called with the tab name.
+        """
+        self._load_callback = load_callback
+        # tabs left to prefetch, in order
+        self._queue = []
+        # tab currently being prefetched
+        self._current_tab = None
+        # tabs which have been prefetched for the current location
+        self._prefetched_tabs = set()
+
+    def reset(self):
+        """
+        Forgets about all prefetched tabs, typically because
+        another location is displayed.
+        """
+        self.stop()
+        self._prefetched_tabs = set()
+
+    def start(self, tab_names):
+        """
+        Starts prefetching tabs. Tabs which have already been
+        prefetched are skipped.
+
+        :param tab_names: Names of the tabs to prefetch, in order
+        """
+        self._queue = [
+            tab_name for tab_name in tab_names if tab_name not in self._prefetched_tabs
+        ]
+        if self._current_tab is None:
+            self._prefetch_next()
+
+    def stop(self):
+        """
+        Stops prefetching. A tab which is being prefetched is not
+        considered prefetched.
+        """
+        self._queue = []
+        self._current_tab = None
+
+    def discard(self, tab_name):
+        """
+        Drops a tab from the tabs left to prefetch, typically because
+        it turns out not to be worth it. A tab which is being prefetched
+        is left alone.
+
+        :param tab_name: Name of the tab
+        """
+        if tab_name in self._queue:
+            self._queue.remove(tab_name)
+
+    def take(self, tab_name):
+        """
+        Checks whether a tab has been prefetched. The tab is then
+        not considered prefetched anymore, so it is loaded again
+        when shown next time.
+
+        :param tab_name: Name of the tab
+        :returns: True if the tab has been prefetched
+        """
+        if tab_name in self._prefetched_tabs:
+            self._prefetched_tabs.remove(tab_name)
+            return True
+        return False
+
+    def tab_loaded(self, tab_name):
+        """
+        To be called whenever a tab has finished loading, successfully or not.
+
+        :param tab_name: Name of the tab
+        """
+        if tab_name != self._current_tab:
+            return
+
+        self._prefetched_tabs.add(tab_name)
+        self._current_tab = None
+        self._prefetch_next()
+
+    def _prefetch_next(self):
+        """
+        Starts prefetching the next tab in the queue.
+        """
+        if not self._queue:
+            return
+
+        self._current_tab = self._queue.pop(0)
+        self._load_callback(self._current_tab)
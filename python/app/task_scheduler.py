@@ -0,0 +1,259 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import time
+import threading
+
+import sgtk
+from sgtk.platform.qt import QtCore
+
+task_manager = sgtk.platform.import_framework(
+    "tk-framework-shotgunutils", "task_manager"
+)
+
+# priority classes of the work done by the panel, most important first.
+# Thumbnails of the visible rows are downloaded by the ShotgunModel through
+# the same data retriever as the rows, so they can't be given a class of
+# their own. They run in the visible class, where the retriever queues
+# downloads behind its queries.
+PRIORITY_FOREGROUND = "foreground"
+PRIORITY_VISIBLE = "visible"
+PRIORITY_PREFETCH = "prefetch"
+PRIORITY_HOUSEKEEPING = "housekeeping"
+PRIORITY_CPU = "cpu"
+
+NETWORK_PRIORITIES = [
+    PRIORITY_FOREGROUND,
+    PRIORITY_VISIBLE,
+    PRIORITY_PREFETCH,
+    PRIORITY_HOUSEKEEPING,
+]
+
+# added to the priority of the tasks of each class, well above the
+# priorities the data retrievers use among their own tasks
+CLASS_PRIORITY_STEP = 1000
+
+
+def get_cpu_task_manager(bg_task_manager):
+    """
+    Returns the task manager CPU bound work should run in, for
+    a component which has been handed a task manager for its queries.
+
+    :param bg_task_manager: :class:`PriorityTaskManager` or plain
+        BackgroundTaskManager instance.
+    :returns: The CPU task manager associated with the task manager,
+        or the task manager itself if there is none.
+    """
+    return getattr(bg_task_manager, "cpu_task_manager", None) or bg_task_manager
+
+
+class PriorityTaskManager(object):
+    """
+    Task manager running the work of a single priority class in a
+    BackgroundTaskManager shared by several classes. Tasks are added with
+    the priority of the class, so that they only ever run once the tasks
+    of the more important classes have all started.
+
+    Anything but adding tasks is handed over to the shared task manager,
+    so this can be used wherever a BackgroundTaskManager is expected.
+    Signals are those of the shared task manager, emitted for the tasks
+    of all classes.
+
+    It keeps track of how long tasks wait before they start running.
+    """
+
+    # tasks waiting longer than this, in seconds, are logged
+    STARVATION_THRESHOLD = 5.0
+
+    def __init__(self, task_manager, priority_class, priority, cpu_task_manager=None):
+        """
+        Constructor
+
+        :param task_manager: BackgroundTaskManager the tasks run in
+        :param priority_class: One of the priority classes, e.g. PRIORITY_VISIBLE
+        :param priority: Priority of the class in the task manager,
+            higher priorities run first.
+        :param cpu_task_manager: Task manager to run CPU bound work related
+            to the work of this task manager in, see :func:`get_cpu_task_manager`.
+        """
+        self.priority_class = priority_class
+        self.cpu_task_manager = cpu_task_manager
+        self._task_manager = task_manager
+        self._priority = priority
+
+        # wait times are recorded from the worker threads
+        self._lock = threading.Lock()
+        self._num_started = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def __getattr__(self, name):
+        # signals and all other methods are the ones of the shared task manager
+        return getattr(self._task_manager, name)
+
+    def add_task(self, cbl, priority=None, *args, **kwargs):
+        """
+        Adds a task, see BackgroundTaskManager.add_task().
+
+        :param cbl: Callable run by the task
+        :param priority: Priority of the task among the tasks of the class
+        :returns: Unique id of the task
+        """
+        queued_at = time.time()
+
+        def timed_cbl(*cbl_args, **cbl_kwargs):
+            self._record_wait(time.time() - queued_at)
+            return cbl(*cbl_args, **cbl_kwargs)
+
+        return self._task_manager.add_task(
+            timed_cbl, self._priority + (priority or 0), *args, **kwargs
+        )
+
+    def add_pass_through_task(self, priority=None, *args, **kwargs):
+        """
+        Adds a task which does nothing but wait for its upstream tasks,
+        see BackgroundTaskManager.add_pass_through_task().
+
+        :param priority: Priority of the task among the tasks of the class
+        :returns: Unique id of the task
+        """
+        return self._task_manager.add_pass_through_task(
+            self._priority + (priority or 0), *args, **kwargs
+        )
+
+    def shut_down(self):
+        """
+        Does nothing, the shared task manager is shut down by its owner.
+        """
+
+    def get_metrics(self):
+        """
+        Returns how long tasks have waited before running.
+
+        :returns: Dictionary with the number of tasks started, and the mean
+            and maximum number of seconds they have waited.
+        """
+        with self._lock:
+            return {
+                "started": self._num_started,
+                "mean_wait": self._total_wait / max(self._num_started, 1),
+                "max_wait": self._max_wait,
+            }
+
+    def _record_wait(self, wait):
+        """
+        Records the time a task has waited. Called from a worker thread.
+
+        :param wait: Number of seconds
+        """
+        with self._lock:
+            self._num_started += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+
+        if wait > self.STARVATION_THRESHOLD:
+            sgtk.platform.current_bundle().log_debug(
+                "Task waited %.1fs in the %s queue." % (wait, self.priority_class)
+            )
+
+
+class TaskScheduler(QtCore.QObject):
+    """
+    Runs the background work of a dialog by priority class. Network bound
+    work is split into foreground, visible, prefetch and housekeeping
+    classes, which share a single pool of threads, the more important
+    classes always running first. CPU bound work, e.g. thumbnail
+    compositing, runs in a separate pool.
+
+    Thread counts are configured with the ``network_threads`` and
+    ``cpu_threads`` settings.
+
+    How long tasks wait before running is logged periodically.
+    """
+
+    # interval, in milliseconds, between two logs of the wait times
+    METRICS_LOG_INTERVAL = 60000
+
+    def __init__(self, parent=None):
+        """
+        Constructor
+
+        :param parent: QT parent object
+        """
+        QtCore.QObject.__init__(self, parent)
+
+        app = sgtk.platform.current_bundle()
+        network_threads = max(app.get_setting("network_threads"), 1)
+        cpu_threads = max(app.get_setting("cpu_threads"), 1)
+
+        self._network_pool = task_manager.BackgroundTaskManager(
+            self, start_processing=True, max_threads=network_threads
+        )
+        self._cpu_pool = task_manager.BackgroundTaskManager(
+            self, start_processing=True, max_threads=cpu_threads
+        )
+
+        cpu_task_manager = PriorityTaskManager(self._cpu_pool, PRIORITY_CPU, 0)
+        self._task_managers = {PRIORITY_CPU: cpu_task_manager}
+        for index, priority_class in enumerate(NETWORK_PRIORITIES):
+            priority = (len(NETWORK_PRIORITIES) - index) * CLASS_PRIORITY_STEP
+            self._task_managers[priority_class] = PriorityTaskManager(
+                self._network_pool, priority_class, priority, cpu_task_manager
+            )
+
+        self._num_started_logged = 0
+        self._metrics_timer = QtCore.QTimer(self)
+        self._metrics_timer.setInterval(self.METRICS_LOG_INTERVAL)
+        self._metrics_timer.timeout.connect(self._log_metrics)
+        self._metrics_timer.start()
+
+    def get_task_manager(self, priority_class):
+        """
+        Returns the task manager for a priority class.
+
+        :param priority_class: One of the priority classes, e.g. PRIORITY_FOREGROUND
+        :returns: :class:`PriorityTaskManager` instance
+        """
+        return self._task_managers[priority_class]
+
+    def get_starvation_metrics(self):
+        """
+        Returns how long tasks have waited before running, per priority class.
+
+        :returns: Dictionary mapping priority classes to the dictionaries
+            returned by :meth:`PriorityTaskManager.get_metrics`.
+        """
+        return dict(
+            (priority_class, manager.get_metrics())
+            for priority_class, manager in self._task_managers.items()
+        )
+
+    def shut_down(self):
+        """
+        Shuts down all task managers.
+        """
+        self._metrics_timer.stop()
+        self._log_metrics()
+        self._network_pool.shut_down()
+        self._cpu_pool.shut_down()
+
+    def _log_metrics(self):
+        """
+        Logs how long tasks have waited, if any task has started since last time.
+        """
+        metrics = self.get_starvation_metrics()
+        num_started = sum(entry["started"] for entry in metrics.values())
+        if num_started == self._num_started_logged:
+            return
+        self._num_started_logged = num_started
+
+        sgtk.platform.current_bundle().log_debug(
+            "Background task wait times: %s" % metrics
+        )
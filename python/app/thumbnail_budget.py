@@ -0,0 +1,116 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import collections
+
+import sgtk
+
+# shared budget instance, see get_thumbnail_budget()
+_thumbnail_budget = None
+
+
+def get_thumbnail_budget():
+    """
+    Returns the thumbnail memory budget shared by all listing models,
+    creating it on first use based on the app settings.
+
+    :returns: :class:`ThumbnailMemoryBudget` instance
+    """
+    global _thumbnail_budget
+
+    if _thumbnail_budget is None:
+        app = sgtk.platform.current_bundle()
+        max_size_mb = app.get_setting("thumbnail_memory_budget")
+        _thumbnail_budget = ThumbnailMemoryBudget(max_size_mb * 1024 * 1024)
+
+    return _thumbnail_budget
+
+
+class ThumbnailMemoryBudget(object):
+    """
+    Keeps track of the memory used by the thumbnails displayed in the
+    listing models, across all tabs.
+
+    Models register each thumbnail they display and touch it whenever it
+    is painted. Once the total size goes over the budget, the least recently
+    used thumbnails are handed back to their models to be released.
+
+    This is only ever accessed from the GUI thread.
+    """
+
+    def __init__(self, max_size):
+        """
+        Constructor
+
+        :param max_size: Maximum size, in bytes, of all thumbnails together.
+            If 0, the size is not limited.
+        """
+        self._max_size = max_size
+        # (model, entity id) -> size in bytes, least recently used first
+        self._entries = collections.OrderedDict()
+        self._total_size = 0
+
+    def __repr__(self):
+        return "<Thumbnail memory budget %d/%d bytes, %d thumbnails>" % (
+            self._total_size,
+            self._max_size,
+            len(self._entries),
+        )
+
+    def add(self, model, entity_id, size):
+        """
+        Registers a thumbnail which has been loaded by a model, releasing
+        least recently used thumbnails if the budget is exceeded.
+
+        :param model: Model holding the thumbnail. It must implement
+            a ``release_thumbnail(entity_id)`` method.
+        :param entity_id: Id of the entity the thumbnail belongs to
+        :param size: Size of the thumbnail, in bytes
+        """
+        key = (model, entity_id)
+        self._total_size -= self._entries.pop(key, 0)
+        self._entries[key] = size
+        self._total_size += size
+
+        if not self._max_size:
+            return
+
+        evicted = []
+        while self._total_size > self._max_size and len(self._entries) > 1:
+            evicted_key, evicted_size = self._entries.popitem(last=False)
+            self._total_size -= evicted_size
+            evicted.append(evicted_key)
+
+        for evicted_model, evicted_id in evicted:
+            evicted_model.release_thumbnail(evicted_id)
+
+    def touch(self, model, entity_id):
+        """
+        Marks a thumbnail as recently used.
+
+        :param model: Model holding the thumbnail
+        :param entity_id: Id of the entity the thumbnail belongs to
+        :returns: True if the thumbnail is registered, False otherwise
+        """
+        key = (model, entity_id)
+        if key not in self._entries:
+            return False
+        self._entries.move_to_end(key)
+        return True
+
+    def remove_model(self, model):
+        """
+        Forgets about all thumbnails held by a model, typically
+        because the model has been cleared.
+
+        :param model: Model to remove
+        """
+        for key in [key for key in self._entries if key[0] is model]:
+            self._total_size -= self._entries.pop(key)
@@ -0,0 +1,275 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import os
+import uuid
+import hashlib
+import threading
+import collections
+
+import sgtk
+from sgtk.platform.qt import QtCore, QtGui
+
+logger = sgtk.platform.get_logger(__name__)
+
+# shared cache instance, see get_composited_thumbnail_cache()
+_composited_thumbnail_cache = None
+_composited_thumbnail_cache_lock = threading.Lock()
+
+
+def get_composited_thumbnail_cache():
+    """
+    Returns the on-disk cache of composited thumbnails, creating it
+    on first use based on the app settings.
+
+    :returns: :class:`CompositedThumbnailCache` instance or None if the
+        cache has been disabled in the app settings.
+    """
+    global _composited_thumbnail_cache
+
+    # thumbnails are composited from several background threads
+    with _composited_thumbnail_cache_lock:
+        if _composited_thumbnail_cache is None:
+            app = sgtk.platform.current_bundle()
+            max_size_mb = app.get_setting("composited_thumbnail_cache_size")
+            if not max_size_mb:
+                return None
+
+            _composited_thumbnail_cache = CompositedThumbnailCache(
+                os.path.join(app.cache_location, "composited_thumbnails"),
+                max_size_mb * 1024 * 1024,
+            )
+
+    return _composited_thumbnail_cache
+
+
+def get_composited_thumbnail(create_method, image, path, size=None, **kwargs):
+    """
+    Returns a composited thumbnail, loading it from the on-disk cache
+    if it has been composited before.
+
+    :param create_method: Compositing method from the utils module, e.g.
+        :meth:`utils.create_round_thumbnail`.
+    :param image: QImage source image, or None to load it from the path
+    :param path: Path on disk to the source thumbnail. If None, the thumbnail
+        is composited without using the cache.
+    :param size: Optional (width, height) tuple. If specified, the composited
+        thumbnail is scaled down to fit this size.
+    :param kwargs: Additional arguments to pass to the compositing method
+    :returns: QImage
+    """
+    cache = get_composited_thumbnail_cache()
+    key = None
+    if path is not None and cache is not None:
+        key = cache.get_key(path, create_method.__name__, size=size, **kwargs)
+
+    if key is not None:
+        composited_image = cache.load(key)
+        if composited_image is not None:
+            return composited_image
+
+    if image is None:
+        image = QtGui.QImage(path)
+
+    composited_image = create_method(image, **kwargs)
+    if size is not None:
+        composited_image = composited_image.scaled(
+            size[0],
+            size[1],
+            QtCore.Qt.KeepAspectRatio,
+            QtCore.Qt.SmoothTransformation,
+        )
+
+    if key is not None:
+        cache.store(key, composited_image)
+
+    return composited_image
+
+
+class CompositedThumbnailCache(object):
+    """
+    On-disk cache of composited thumbnails.
+
+    Compositing a thumbnail decodes the source jpeg, smooth scales it and
+    paints it onto a canvas. The result only depends on the source file and
+    the compositing parameters, so it is stored as a png and loaded directly
+    the next time the same source thumbnail is displayed the same way.
+
+    The cache is capped in size. The least recently used files are removed
+    first when the cap is exceeded.
+
+    The cache only deals with QImages and is safe to use from background threads.
+    """
+
+    # bump this whenever the compositing logic changes
+    CACHE_VERSION = 1
+
+    FILE_EXTENSION = ".png"
+
+    def __init__(self, cache_dir, max_size):
+        """
+        Constructor
+
+        :param cache_dir: Folder to store the composited thumbnails in
+        :param max_size: Maximum size of the cache, in bytes
+        """
+        self._cache_dir = cache_dir
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        # file name -> file size, least recently used first. Built lazily.
+        self._entries = None
+        self._total_size = 0
+
+    def __repr__(self):
+        return "<Composited thumbnail cache %s>" % self._cache_dir
+
+    def get_key(self, source_path, variant, **kwargs):
+        """
+        Returns the key identifying a composited thumbnail.
+
+        :param source_path: Path on disk to the source thumbnail
+        :param variant: Name of the compositing variant
+        :param kwargs: Compositing parameters, e.g. client or unread flags
+            and the target size.
+        :returns: Key string or None if the source cannot be found on disk
+        """
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return None
+
+        key_data = [
+            self.CACHE_VERSION,
+            source_path,
+            stat.st_mtime,
+            stat.st_size,
+            variant,
+            sorted(kwargs.items()),
+        ]
+        return hashlib.sha1(str(key_data).encode("utf-8")).hexdigest()
+
+    def load(self, key):
+        """
+        Loads a composited thumbnail from the cache.
+
+        :param key: Key as returned by :meth:`get_key`
+        :returns: QImage or None if not cached
+        """
+        file_name = key + self.FILE_EXTENSION
+
+        with self._lock:
+            self._ensure_scanned()
+            if file_name not in self._entries:
+                return None
+            self._entries.move_to_end(file_name)
+
+        path = os.path.join(self._cache_dir, file_name)
+        image = QtGui.QImage(path)
+        if image.isNull():
+            # the file is gone or corrupt
+            self._remove(file_name)
+            return None
+
+        # the file modification time is used to restore
+        # the LRU order in future sessions.
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+        return image
+
+    def store(self, key, image):
+        """
+        Stores a composited thumbnail in the cache, evicting least
+        recently used thumbnails if the cache grows too large.
+
+        :param key: Key as returned by :meth:`get_key`
+        :param image: QImage to store
+        """
+        file_name = key + self.FILE_EXTENSION
+        path = os.path.join(self._cache_dir, file_name)
+
+        # write to a temp file first, so that other processes never
+        # see a partially written file.
+        tmp_path = "%s.%s.tmp" % (path, uuid.uuid4().hex)
+        try:
+            if not os.path.exists(self._cache_dir):
+                os.makedirs(self._cache_dir)
+            if not image.save(tmp_path, "PNG"):
+                raise IOError("Could not write %s" % tmp_path)
+            os.replace(tmp_path, path)
+            file_size = os.path.getsize(path)
+        except (IOError, OSError) as e:
+            logger.debug("Could not cache composited thumbnail: %s" % e)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+
+        with self._lock:
+            self._ensure_scanned()
+            self._total_size -= self._entries.pop(file_name, 0)
+            self._entries[file_name] = file_size
+            self._total_size += file_size
+            evicted = self._evict()
+
+        for file_name in evicted:
+            try:
+                os.remove(os.path.join(self._cache_dir, file_name))
+            except OSError:
+                pass
+
+    def _remove(self, file_name):
+        """
+        Forgets about a cached file.
+
+        :param file_name: Name of the file in the cache folder
+        """
+        with self._lock:
+            self._total_size -= self._entries.pop(file_name, 0)
+
+    def _ensure_scanned(self):
+        """
+        Builds the in-memory index of the cache folder on first access.
+        Must be called with the lock held.
+        """
+        if self._entries is not None:
+            return
+
+        files = []
+        if os.path.isdir(self._cache_dir):
+            for file_name in os.listdir(self._cache_dir):
+                if not file_name.endswith(self.FILE_EXTENSION):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(self._cache_dir, file_name))
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, file_name, stat.st_size))
+
+        self._entries = collections.OrderedDict()
+        self._total_size = 0
+        for _, file_name, file_size in sorted(files):
+            self._entries[file_name] = file_size
+            self._total_size += file_size
+
+    def _evict(self):
+        """
+        Drops least recently used entries until the cache fits its size cap.
+        Must be called with the lock held.
+
+        :returns: List of file names to delete from disk
+        """
+        evicted = []
+        while self._total_size > self._max_size and len(self._entries) > 1:
+            file_name, file_size = self._entries.popitem(last=False)
+            self._total_size -= file_size
+            evicted.append(file_name)
+        return evicted
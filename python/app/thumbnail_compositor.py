@@ -0,0 +1,169 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import uuid
+
+import sgtk
+from sgtk.platform.qt import QtCore
+
+from .task_scheduler import get_cpu_task_manager
+
+
+class ThumbnailCompositor(QtCore.QObject):
+    """
+    Composites thumbnails in the background task manager.
+
+    Thumbnails tend to arrive in bursts, for example when a listing with
+    hundreds of items is loaded from the cache. Compositing happens on
+    QImages in background tasks, and the finished images are handed back
+    to the GUI thread in batches rather than one at a time.
+
+    :signal thumbnails_composited(list): Emitted with a list of
+        ``(key, QImage)`` tuples for thumbnails which have been composited
+        since the last emission.
+    """
+
+    thumbnails_composited = QtCore.Signal(list)
+
+    # time, in milliseconds, to collect results before handing them over
+    BATCH_INTERVAL = 50
+
+    def __init__(self, bg_task_manager, parent=None):
+        """
+        Constructor
+
+        :param bg_task_manager: Background task manager of the owner of the
+            compositor. Compositing runs in the CPU task manager associated
+            with it, if any.
+        :param parent: QT parent object
+        """
+        QtCore.QObject.__init__(self, parent)
+
+        self._task_manager = get_cpu_task_manager(bg_task_manager)
+        # tasks from this compositor are grouped so they can be stopped in one go
+        self._group = "thumbnail_compositor_%s" % uuid.uuid4().hex
+
+        # task uid -> key and key -> uid of the most recent request
+        self._pending_keys = {}
+        self._latest_tasks = {}
+        self._results = []
+
+        self._batch_timer = QtCore.QTimer(self)
+        self._batch_timer.setSingleShot(True)
+        self._batch_timer.setInterval(self.BATCH_INTERVAL)
+        self._batch_timer.timeout.connect(self._emit_results)
+
+        self._task_manager.task_completed.connect(self._on_task_completed)
+        self._task_manager.task_failed.connect(self._on_task_failed)
+
+    def destroy(self):
+        """
+        Tear down method
+        """
+        self.clear()
+        self._task_manager.task_completed.disconnect(self._on_task_completed)
+        self._task_manager.task_failed.disconnect(self._on_task_failed)
+
+    ############################################################################################
+    # public interface
+
+    def request(self, key, create_method, *args, **kwargs):
+        """
+        Schedules a thumbnail to be composited. If a thumbnail with the same key
+        is already being composited, that result is discarded in favor of this one.
+
+        :param key: Hashable key identifying the thumbnail, handed back
+            together with the composited image.
+        :param create_method: Method returning a QImage. It is executed in a
+            background thread, so must not create any QPixmaps or widgets.
+        :param args: Arguments to pass to the method
+        :param kwargs: Keyword arguments to pass to the method
+        """
+        uid = self._task_manager.add_task(
+            create_method, group=self._group, task_args=list(args), task_kwargs=kwargs
+        )
+        self._pending_keys[uid] = key
+        self._latest_tasks[key] = uid
+
+    def clear(self):
+        """
+        Discards all outstanding requests and results.
+        """
+        self._task_manager.stop_task_group(self._group)
+        self._batch_timer.stop()
+        self._pending_keys = {}
+        self._latest_tasks = {}
+        self._results = []
+
+    ############################################################################################
+    # private methods
+
+    def _pop_request(self, uid):
+        """
+        Forgets about a request.
+
+        :param uid: Unique id of the task
+        :returns: Key of the request or None if the request is unknown or
+            has been superseded by a later request.
+        """
+        key = self._pending_keys.pop(uid, None)
+        if key is None or self._latest_tasks.get(key) != uid:
+            return None
+        del self._latest_tasks[key]
+        return key
+
+    def _on_task_completed(self, uid, group, result):
+        """
+        Called when a background task has completed.
+
+        :param uid: Unique id of the task
+        :param group: Group the task belongs to
+        :param result: The composited QImage
+        """
+        if group != self._group:
+            return
+
+        key = self._pop_request(uid)
+        if key is None:
+            return
+
+        self._results.append((key, result))
+        if not self._batch_timer.isActive():
+            self._batch_timer.start()
+
+    def _on_task_failed(self, uid, group, msg, stack_trace):
+        """
+        Called when a background task has failed.
+
+        :param uid: Unique id of the task
+        :param group: Group the task belongs to
+        :param msg: Error message
+        :param stack_trace: Stack trace for the error
+        """
+        if group != self._group:
+            return
+
+        key = self._pop_request(uid)
+        if key is None:
+            return
+
+        # the item simply keeps its default thumbnail
+        sgtk.platform.current_bundle().log_debug(
+            "Could not composite thumbnail for %s: %s\n%s" % (key, msg, stack_trace)
+        )
+
+    def _emit_results(self):
+        """
+        Hands the results collected so far over to the listeners.
+        """
+        results = self._results
+        self._results = []
+        if results:
+            self.thumbnails_composited.emit(results)
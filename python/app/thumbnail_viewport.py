@@ -0,0 +1,118 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+from sgtk.platform.qt import QtCore
+
+
+class ThumbnailViewportLoader(QtCore.QObject):
+    """
+    Drives the thumbnail downloads of a listing model from what its
+    list view actually shows.
+
+    Whenever the view is scrolled, resized, shown or its rows change, the
+    model is handed the entities of the visible rows, followed by the ones
+    of a few rows around them. Nothing is requested while the view is
+    hidden, e.g. because its tab isn't the current one.
+
+    The view's model is expected to be a proxy model on top of a
+    :class:`~model_entity_listing.SgEntityListingModel`.
+    """
+
+    # number of rows beyond each end of the viewport to load thumbnails for
+    LOOK_AHEAD_ROWS = 10
+
+    # time, in milliseconds, to wait for the view to settle, e.g. while scrolling
+    UPDATE_DELAY = 50
+
+    def __init__(self, view, parent=None):
+        """
+        Constructor
+
+        :param view: QListView displaying the model
+        :param parent: QT parent object
+        """
+        QtCore.QObject.__init__(self, parent)
+
+        self._view = view
+
+        self._update_timer = QtCore.QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(self.UPDATE_DELAY)
+        self._update_timer.timeout.connect(self._update)
+
+        scroll_bar = view.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self._schedule_update)
+        scroll_bar.rangeChanged.connect(self._schedule_update)
+
+        proxy_model = view.model()
+        proxy_model.rowsInserted.connect(self._schedule_update)
+        proxy_model.rowsRemoved.connect(self._schedule_update)
+        proxy_model.modelReset.connect(self._schedule_update)
+        proxy_model.layoutChanged.connect(self._schedule_update)
+        proxy_model.dataChanged.connect(self._schedule_update)
+
+        view.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        """
+        Catches the view being shown or resized.
+
+        :param obj: Object the event is for
+        :param event: QEvent
+        :returns: False, the event is always processed as usual
+        """
+        if event.type() in (QtCore.QEvent.Show, QtCore.QEvent.Resize):
+            self._schedule_update()
+        return False
+
+    def _schedule_update(self, *args):
+        """
+        Schedules the thumbnails to be requested once the view has settled.
+        """
+        if self._view.isVisible():
+            self._update_timer.start()
+
+    def _update(self):
+        """
+        Hands the model the entities to load thumbnails for, most
+        important first.
+        """
+        if not self._view.isVisible():
+            return
+
+        proxy_model = self._view.model()
+        num_rows = proxy_model.rowCount()
+        if num_rows == 0:
+            return
+
+        viewport_rect = self._view.viewport().rect()
+        first_index = self._view.indexAt(viewport_rect.topLeft())
+        last_index = self._view.indexAt(viewport_rect.bottomLeft())
+        first_row = first_index.row() if first_index.isValid() else 0
+        last_row = last_index.row() if last_index.isValid() else num_rows - 1
+
+        rows = list(range(first_row, last_row + 1))
+        # scrolling down is the most likely next move
+        rows.extend(
+            range(last_row + 1, min(last_row + 1 + self.LOOK_AHEAD_ROWS, num_rows))
+        )
+        rows.extend(
+            reversed(range(max(first_row - self.LOOK_AHEAD_ROWS, 0), first_row))
+        )
+
+        source_model = proxy_model.sourceModel()
+        entity_ids = []
+        for row in rows:
+            source_index = proxy_model.mapToSource(proxy_model.index(row, 0))
+            item = source_model.itemFromIndex(source_index)
+            if item:
+                entity_ids.append(item.get_sg_data().get("id"))
+
+        source_model.request_thumbnails(entity_ids)
@@ -18,22 +18,19 @@ def create_round_thumbnail(image):
     Create a 200 px wide circle thumbnail
 
     :param image: QImage representing a thumbnail
-    :returns: Round QPixmap
+    :returns: Round QImage
     """
     CANVAS_SIZE = 200
 
     # get the 512 base image
-    base_image = QtGui.QPixmap(CANVAS_SIZE, CANVAS_SIZE)
-    base_image.fill(QtCore.Qt.transparent)
+    base_image = _create_canvas(CANVAS_SIZE, CANVAS_SIZE)
 
     # now attempt to load the image
-    # pixmap will be a null pixmap if load fails
-    thumb = QtGui.QPixmap.fromImage(image)
-
-    if not thumb.isNull():
+    # image will be a null image if load fails
+    if not image.isNull():
 
         # scale it down to fit inside a frame of maximum 512x512
-        thumb_scaled = thumb.scaled(
+        thumb_scaled = image.scaled(
             CANVAS_SIZE,
             CANVAS_SIZE,
             QtCore.Qt.KeepAspectRatioByExpanding,
@@ -42,8 +39,7 @@ def create_round_thumbnail(image):
 
         # now composite the thumbnail on top of the base image
         # bottom align it to make it look nice
-        thumb_img = thumb_scaled.toImage()
-        brush = QtGui.QBrush(thumb_img)
+        brush = QtGui.QBrush(thumb_scaled)
         painter = QtGui.QPainter(base_image)
         painter.setRenderHint(QtGui.QPainter.Antialiasing)
         painter.setBrush(brush)
@@ -57,12 +53,12 @@ def create_round_512x400_note_thumbnail(image, client=False, unread=False):
     """
     Given a QImage shotgun thumbnail, create a round icon
     with the thumbnail composited onto a centered otherwise empty canvas.
-    This will return a 512x400 pixmap object.
+    This will return a 512x400 image object.
 
     :param image: QImage source image
     :param client: indicates that this is a client note
     :param unread: indicates that this is an unread note
-    :returns: QPixmap circular thumbnail, 380px wide, on a
+    :returns: QImage circular thumbnail, 380px wide, on a
               512x400 rect backdrop
     """
     CANVAS_WIDTH = 512
@@ -70,17 +66,14 @@ def create_round_512x400_note_thumbnail(image, client=False, unread=False):
     CIRCLE_SIZE = 380
 
     # get the 512 base image
-    base_image = QtGui.QPixmap(CANVAS_WIDTH, CANVAS_HEIGHT)
-    base_image.fill(QtCore.Qt.transparent)
+    base_image = _create_canvas(CANVAS_WIDTH, CANVAS_HEIGHT)
 
     # now attempt to load the image
-    # pixmap will be a null pixmap if load fails
-    thumb = QtGui.QPixmap.fromImage(image)
-
-    if not thumb.isNull():
+    # image will be a null image if load fails
+    if not image.isNull():
 
         # scale it to fill a 400x400 square
-        thumb_scaled = thumb.scaled(
+        thumb_scaled = image.scaled(
             CIRCLE_SIZE,
             CIRCLE_SIZE,
             QtCore.Qt.KeepAspectRatioByExpanding,
@@ -89,8 +82,7 @@ def create_round_512x400_note_thumbnail(image, client=False, unread=False):
 
         # now composite the thumbnail on top of the base image
         # bottom align it to make it look nice
-        thumb_img = thumb_scaled.toImage()
-        brush = QtGui.QBrush(thumb_img)
+        brush = QtGui.QBrush(thumb_scaled)
 
         painter = QtGui.QPainter(base_image)
         painter.setRenderHint(QtGui.QPainter.Antialiasing)
@@ -107,18 +99,18 @@ def create_round_512x400_note_thumbnail(image, client=False, unread=False):
         painter.drawEllipse(0, 0, CIRCLE_SIZE, CIRCLE_SIZE)
 
         if unread:
-            UNREAD_NOTE_INDICATOR = QtGui.QPixmap(
+            UNREAD_NOTE_INDICATOR = QtGui.QImage(
                 ":/tk_multi_infopanel/unread_indicator.png"
             )
-            painter.drawPixmap(-10, -10, UNREAD_NOTE_INDICATOR)
+            painter.drawImage(-10, -10, UNREAD_NOTE_INDICATOR)
 
         painter.translate(0, 250)
 
         if client:
-            CLIENT_NOTE_INDICATOR = QtGui.QPixmap(
+            CLIENT_NOTE_INDICATOR = QtGui.QImage(
                 ":/tk_multi_infopanel/client_note_indicator.png"
             )
-            painter.drawPixmap(0, 0, CLIENT_NOTE_INDICATOR)
+            painter.drawImage(0, 0, CLIENT_NOTE_INDICATOR)
 
         painter.end()
 
@@ -129,27 +121,24 @@ def create_rectangular_512x400_thumbnail(image):
     """
     Given a QImage shotgun thumbnail, create a rectangular icon
     with the thumbnail composited onto a centered otherwise empty canvas.
-    This will return a 512x400 pixmap object.
+    This will return a 512x400 image object.
 
     :param image: QImage source image
-    :returns: QPixmap rectangular thumbnail on a 512x400 rect backdrop
+    :returns: QImage rectangular thumbnail on a 512x400 rect backdrop
     """
     CANVAS_WIDTH = 512
     CANVAS_HEIGHT = 400
     CORNER_RADIUS = 10
 
     # get the 512 base image
-    base_image = QtGui.QPixmap(CANVAS_WIDTH, CANVAS_HEIGHT)
-    base_image.fill(QtCore.Qt.transparent)
+    base_image = _create_canvas(CANVAS_WIDTH, CANVAS_HEIGHT)
 
     # now attempt to load the image
-    # pixmap will be a null pixmap if load fails
-    thumb = QtGui.QPixmap.fromImage(image)
-
-    if not thumb.isNull():
+    # image will be a null image if load fails
+    if not image.isNull():
 
         # scale it down to fit inside a frame of maximum 512x512
-        thumb_scaled = thumb.scaled(
+        thumb_scaled = image.scaled(
             CANVAS_WIDTH,
             CANVAS_HEIGHT,
             QtCore.Qt.KeepAspectRatioByExpanding,
@@ -158,8 +147,7 @@ def create_rectangular_512x400_thumbnail(image):
 
         # now composite the thumbnail on top of the base image
         # bottom align it to make it look nice
-        thumb_img = thumb_scaled.toImage()
-        brush = QtGui.QBrush(thumb_img)
+        brush = QtGui.QBrush(thumb_scaled)
 
         painter = QtGui.QPainter(base_image)
         painter.setRenderHint(QtGui.QPainter.Antialiasing)
@@ -175,6 +163,53 @@ def create_rectangular_512x400_thumbnail(image):
     return base_image
 
 
+def _create_canvas(width, height):
+    """
+    Creates an empty, transparent image to composite thumbnails onto.
+
+    Thumbnails are composited onto QImages rather than QPixmaps, since
+    only the former can be used outside of the GUI thread.
+
+    :param width: Width of the canvas in pixels
+    :param height: Height of the canvas in pixels
+    :returns: QImage
+    """
+    canvas = QtGui.QImage(width, height, QtGui.QImage.Format_ARGB32_Premultiplied)
+    canvas.fill(QtCore.Qt.transparent)
+    return canvas
+
+
+def get_record_count(sg, entity_type, filters):
+    """
+    Returns the number of records matching a query, using a summary query
+    rather than loading the records.
+
+    Meant to be executed in a background thread via the
+    ShotgunDataRetriever.execute_method() method.
+
+    :param sg: Shotgun API instance
+    :param entity_type: Shotgun entity type
+    :param filters: List of Shotgun filters
+    :returns: Number of records
+    """
+    result = sg.summarize(entity_type, filters, [{"field": "id", "type": "count"}])
+    return result["summaries"]["id"]
+
+
+def get_display_size(size):
+    """
+    Returns the size in pixels needed to display an image at the given
+    size on screen, taking high dpi displays into account.
+
+    :param size: QSize the image is displayed at
+    :returns: (width, height) tuple of ints
+    """
+    app = QtCore.QCoreApplication.instance()
+    # devicePixelRatio is only available from Qt 5
+    ratio = getattr(app, "devicePixelRatio", lambda: 1.0)()
+    return (int(round(size.width() * ratio)), int(round(size.height() * ratio)))
+
+
 def create_human_readable_timestamp(datetime_obj):
     """
     Formats a time stamp the way dates are formatted in the
@@ -216,3 +251,32 @@ def create_human_readable_timestamp(datetime_obj):
         time_str = datetime_obj.strftime("%H:%M")
 
     return (time_str, full_time_str)
+
+
+def get_human_readable_timestamp_expiry(datetime_obj):
+    """
+    Returns the point in time when the string returned by
+    :meth:`create_human_readable_timestamp` for the given datetime
+    will next change, e.g. when "10:32" turns into "24 Jun 10:32".
+
+    :param datetime_obj: Datetime obj to compute the expiry for
+    :returns: Datetime object or None if the formatted string will never change
+    """
+    now = datetime.datetime.now()
+
+    if datetime_obj > now:
+        # future times are reported precisely until they are in the past
+        return datetime_obj
+
+    delta_days = (now - datetime_obj).days
+
+    if delta_days <= 1:
+        # currently displayed as a timestamp - 23:22
+        return datetime_obj + datetime.timedelta(days=2)
+
+    elif delta_days // 7 <= 52:
+        # currently displayed without the year - 26 June
+        return datetime_obj + datetime.timedelta(weeks=53)
+
+    # displayed with the full date, this won't change anymore
+    return None
@@ -139,7 +139,7 @@ class ListItemWidget(QtGui.QWidget):
     def set_thumbnail(self, pixmap):
         """
         Set a thumbnail given the current pixmap.
-        The pixmap must be 100x100 or it will appear squeezed
+        The pixmap is scaled to the size returned by calculate_thumbnail_size()
 
         :param pixmap: pixmap object to use
         """
@@ -165,3 +165,12 @@ class ListItemWidget(QtGui.QWidget):
         :returns: Size of the widget
         """
         return QtCore.QSize(300, 102)
+
+    @staticmethod
+    def calculate_thumbnail_size():
+        """
+        Returns the size at which thumbnails are displayed in this widget.
+
+        :returns: Size of the thumbnail
+        """
+        return QtCore.QSize(96, 75)
@@ -0,0 +1,277 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import os
+import sys
+import types
+import importlib.util
+
+import pytest
+
+APP_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), os.pardir, "python", "app")
+)
+
+
+class _BoundSignal(object):
+    """
+    Signal of an object, calling its slots right away when emitted.
+    """
+
+    def __init__(self):
+        self._slots = []
+
+    def connect(self, slot):
+        self._slots.append(slot)
+
+    def emit(self, *args):
+        for slot in list(self._slots):
+            slot(*args)
+
+
+class _Signal(object):
+    """
+    Stands in for QtCore.Signal, with a separate signal for each object.
+    """
+
+    def __init__(self, *types):
+        self._name = None
+
+    def __set_name__(self, owner, name):
+        self._name = "_signal_%s" % name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return obj.__dict__.setdefault(self._name, _BoundSignal())
+
+
+class _QObject(object):
+    def __init__(self, parent=None):
+        pass
+
+
+class FakeDataRetriever(_QObject):
+    """
+    Stands in for the ShotgunDataRetriever, recording the queries issued
+    until they are completed by the test.
+    """
+
+    work_completed = _Signal(str, str, dict)
+    work_failure = _Signal(str, str)
+
+    # all queries issued by any retriever: uid -> (retriever, args)
+    issued = {}
+
+    def __init__(self, parent=None, bg_task_manager=None):
+        _QObject.__init__(self, parent)
+        self.cleared = False
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def clear(self):
+        self.cleared = True
+
+    def execute_find(self, *args, **kwargs):
+        uid = "find_%d" % len(self.issued)
+        self.issued[uid] = (self, args)
+        return uid
+
+    def execute_method(self, method, *args, **kwargs):
+        uid = "method_%d" % len(self.issued)
+        self.issued[uid] = (self, (method,) + args)
+        return uid
+
+    @classmethod
+    def complete(cls, uid, data):
+        retriever, _ = cls.issued.pop(uid)
+        retriever.work_completed.emit(uid, "find", data)
+
+    @classmethod
+    def fail(cls, uid, msg):
+        retriever, _ = cls.issued.pop(uid)
+        retriever.work_failure.emit(uid, msg)
+
+
+@pytest.fixture
+def query_coalescer(monkeypatch):
+    """
+    Loads the query_coalescer module without importing the app package,
+    which requires a running toolkit engine. The toolkit framework and Qt
+    are replaced by the fakes above.
+    """
+    FakeDataRetriever.issued = {}
+
+    frameworks = {
+        "shotgun_data": types.SimpleNamespace(ShotgunDataRetriever=FakeDataRetriever),
+        "shotgun_model": types.SimpleNamespace(sanitize_qt=lambda value: value),
+    }
+    sgtk = types.ModuleType("sgtk")
+    sgtk.platform = types.ModuleType("sgtk.platform")
+    sgtk.platform.import_framework = lambda framework, name: frameworks[name]
+    sgtk.platform.qt = types.ModuleType("sgtk.platform.qt")
+    sgtk.platform.qt.QtCore = types.SimpleNamespace(QObject=_QObject, Signal=_Signal)
+    monkeypatch.setitem(sys.modules, "sgtk", sgtk)
+    monkeypatch.setitem(sys.modules, "sgtk.platform", sgtk.platform)
+    monkeypatch.setitem(sys.modules, "sgtk.platform.qt", sgtk.platform.qt)
+
+    # a package of its own, so that relative imports resolve
+    package = types.ModuleType("coalescer_test_app")
+    package.__path__ = [APP_PATH]
+    monkeypatch.setitem(sys.modules, "coalescer_test_app", package)
+
+    spec = importlib.util.spec_from_file_location(
+        "coalescer_test_app.query_coalescer",
+        os.path.join(APP_PATH, "query_coalescer.py"),
+    )
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, spec.name, module)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _make_retriever(query_coalescer):
+    """
+    Returns a retriever and the list the results it emits are appended to.
+    """
+    retriever = query_coalescer.CoalescingDataRetriever(None, None)
+    results = []
+    retriever.work_completed.connect(
+        lambda uid, request_type, data: results.append((uid, data))
+    )
+    retriever.work_failure.connect(lambda uid, msg: results.append((uid, msg)))
+    return retriever, results
+
+
+def _find(retriever, entity_type="Shot"):
+    return retriever.execute_find(entity_type, [["id", "is", 1]], ["code"])
+
+
+def test_identical_queries_are_coalesced(query_coalescer):
+    retriever_a, results_a = _make_retriever(query_coalescer)
+    retriever_b, results_b = _make_retriever(query_coalescer)
+
+    uid_a = _find(retriever_a)
+    uid_b = _find(retriever_b)
+    assert uid_a != uid_b
+    assert len(FakeDataRetriever.issued) == 1
+
+    FakeDataRetriever.complete(uid_a, {"sg": [{"id": 1}]})
+    assert results_a == [(uid_a, {"sg": [{"id": 1}]})]
+    assert results_b == [(uid_b, {"sg": [{"id": 1}]})]
+    assert not query_coalescer._in_flight
+
+
+def test_different_queries_are_not_coalesced(query_coalescer):
+    retriever_a, _ = _make_retriever(query_coalescer)
+    retriever_b, _ = _make_retriever(query_coalescer)
+
+    _find(retriever_a, "Shot")
+    _find(retriever_b, "Asset")
+    assert len(FakeDataRetriever.issued) == 2
+
+
+def test_waiters_get_unmodified_copies(query_coalescer):
+    retriever_a = query_coalescer.CoalescingDataRetriever(None, None)
+    retriever_b, results_b = _make_retriever(query_coalescer)
+    # the first request modifies its results
+    retriever_a.work_completed.connect(
+        lambda uid, request_type, data: data["sg"][0].update(code="changed")
+    )
+
+    uid_a = _find(retriever_a)
+    _find(retriever_b)
+    FakeDataRetriever.complete(uid_a, {"sg": [{"id": 1, "code": "original"}]})
+
+    assert results_b[0][1] == {"sg": [{"id": 1, "code": "original"}]}
+
+
+def test_query_is_handed_over_when_cleared(query_coalescer):
+    retriever_a, results_a = _make_retriever(query_coalescer)
+    retriever_b, results_b = _make_retriever(query_coalescer)
+
+    uid_a = _find(retriever_a)
+    uid_b = _find(retriever_b)
+    retriever_a.clear()
+
+    # the query is issued again on behalf of the retriever still waiting
+    assert len(FakeDataRetriever.issued) == 2
+    (handed_over_uid,) = [
+        uid
+        for uid, (sg_retriever, _) in FakeDataRetriever.issued.items()
+        if sg_retriever is retriever_b._sg_data_retriever
+    ]
+
+    # the results of the cleared query don't reach the waiting retriever
+    FakeDataRetriever.complete(uid_a, {"sg": []})
+    assert results_b == []
+
+    FakeDataRetriever.complete(handed_over_uid, {"sg": [{"id": 1}]})
+    assert results_b == [(uid_b, {"sg": [{"id": 1}]})]
+    assert not query_coalescer._in_flight
+
+
+def test_waiter_leaving_keeps_query(query_coalescer):
+    retriever_a, results_a = _make_retriever(query_coalescer)
+    retriever_b, results_b = _make_retriever(query_coalescer)
+
+    uid_a = _find(retriever_a)
+    _find(retriever_b)
+    retriever_b.stop()
+
+    # the owner's query is still in flight and not issued again
+    assert list(FakeDataRetriever.issued) == [uid_a]
+    FakeDataRetriever.complete(uid_a, {"sg": []})
+    assert results_a == [(uid_a, {"sg": []})]
+    assert results_b == []
+
+
+def test_query_is_dropped_without_waiters(query_coalescer):
+    retriever_a, _ = _make_retriever(query_coalescer)
+
+    _find(retriever_a)
+    retriever_a.stop()
+    assert not query_coalescer._in_flight
+
+    # an identical query is issued again
+    _find(retriever_a)
+    assert len(FakeDataRetriever.issued) == 2
+
+
+def test_failures_reach_all_waiters(query_coalescer):
+    retriever_a, results_a = _make_retriever(query_coalescer)
+    retriever_b, results_b = _make_retriever(query_coalescer)
+
+    uid_a = _find(retriever_a)
+    uid_b = _find(retriever_b)
+    FakeDataRetriever.fail(uid_a, "error")
+
+    assert results_a == [(uid_a, "error")]
+    assert results_b == [(uid_b, "error")]
+    assert not query_coalescer._in_flight
+
+
+def test_priority_classes_are_not_coalesced(query_coalescer):
+    foreground = types.SimpleNamespace(priority_class="foreground")
+    prefetch = types.SimpleNamespace(priority_class="prefetch")
+    retriever_a = query_coalescer.CoalescingDataRetriever(None, prefetch)
+    retriever_b = query_coalescer.CoalescingDataRetriever(None, foreground)
+    retriever_c = query_coalescer.CoalescingDataRetriever(None, foreground)
+
+    _find(retriever_a)
+    _find(retriever_b)
+    assert len(FakeDataRetriever.issued) == 2
+
+    _find(retriever_c)
+    assert len(FakeDataRetriever.issued) == 2
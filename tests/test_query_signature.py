@@ -0,0 +1,136 @@
+# Copyright (c) 2026 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import os
+import sys
+import subprocess
+import importlib.util
+
+import pytest
+
+MODULE_PATH = os.path.join(
+    os.path.dirname(__file__), os.pardir, "python", "app", "query_signature.py"
+)
+
+# Builds the query the way the models do, from a set of fields and with
+# dictionaries populated in an arbitrary order, and prints its signature.
+SIGNATURE_SCRIPT = """
+import importlib.util
+spec = importlib.util.spec_from_file_location("query_signature", %r)
+query_signature = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(query_signature)
+
+fields = list(set(["code", "image", "updated_at", "sg_status_list", "description"]))
+fields += ["step", "id"]
+entity = dict((key, value) for key, value in set([("type", "Shot"), ("id", 12)]))
+filters = [
+    ["project", "is", {"type": "Project", "id": 1}],
+    ["entity", "in", [entity, {"id": 3, "type": "Asset"}]],
+]
+order = [{"field_name": "due_date", "direction": "desc"}]
+print(query_signature.get_query_signature("Task", filters, fields, order, 201))
+print(query_signature.canonical_fields(fields))
+print(query_signature.canonical_filters(filters))
+""" % os.path.abspath(MODULE_PATH)
+
+
+@pytest.fixture(scope="module")
+def query_signature():
+    """
+    Loads the query_signature module without importing the app package,
+    which requires a running toolkit engine.
+    """
+    spec = importlib.util.spec_from_file_location("query_signature", MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_signature_stable_across_hash_seeds():
+    """
+    The same query must produce the same parameters in every Python
+    process, otherwise the model disk cache is missed on every new session.
+    """
+    outputs = set()
+    for seed in ["0", "1", "42", "1234", "random"]:
+        env = dict(os.environ, PYTHONHASHSEED=seed)
+        outputs.add(
+            subprocess.check_output(
+                [sys.executable, "-c", SIGNATURE_SCRIPT], env=env
+            ).decode("utf-8")
+        )
+    assert len(outputs) == 1
+
+
+def test_fields_are_sorted_and_unique(query_signature):
+    assert query_signature.canonical_fields(["b", "a", "b", "c"]) == ["a", "b", "c"]
+
+
+def test_filters_ignore_ordering(query_signature):
+    filters_a = [
+        ["sg_status_list", "is", "ip"],
+        ["entity", "in", [{"type": "Shot", "id": 1}, {"id": 2, "type": "Shot"}]],
+    ]
+    filters_b = [
+        ["entity", "in", [{"id": 2, "type": "Shot"}, {"id": 1, "type": "Shot"}]],
+        ["sg_status_list", "is", "ip"],
+    ]
+    assert query_signature.canonical_filters(
+        filters_a
+    ) == query_signature.canonical_filters(filters_b)
+    assert str(query_signature.canonical_filters(filters_a)) == str(
+        query_signature.canonical_filters(filters_b)
+    )
+
+
+def test_filters_keep_ordered_values(query_signature):
+    filters = [["version_number", "between", [3, 1]]]
+    assert query_signature.canonical_filters(filters) == filters
+
+
+def test_complex_filters(query_signature):
+    filters_a = [
+        {
+            "filter_operator": "any",
+            "filters": [["code", "is", "a"], ("code", "is", "b")],
+        }
+    ]
+    filters_b = [
+        {
+            "filters": [["code", "is", "b"], ["code", "is", "a"]],
+            "filter_operator": "any",
+        }
+    ]
+    assert query_signature.canonical_filters(
+        filters_a
+    ) == query_signature.canonical_filters(filters_b)
+
+
+def test_order_is_preserved(query_signature):
+    order = [
+        {"field_name": "step", "direction": "desc"},
+        {"field_name": "due_date"},
+    ]
+    assert query_signature.canonical_order(order) == [
+        {"direction": "desc", "field_name": "step"},
+        {"direction": "asc", "field_name": "due_date"},
+    ]
+
+
+def test_signature(query_signature):
+    signature = query_signature.get_query_signature(
+        "Shot", [["id", "is", 1]], ["code", "image"], limit=10
+    )
+    assert signature == query_signature.get_query_signature(
+        "Shot", [["id", "is", 1]], ["image", "code", "image"], limit=10
+    )
+    assert signature != query_signature.get_query_signature(
+        "Shot", [["id", "is", 1]], ["image", "code"], limit=20
+    )